@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: format-sniffing datetime parser vs trying every strptime format.
+
+Parses a mixed corpus shaped like our feeds (NIH VideoCast air dates, ISO
+timestamps from manual entries and scrapers, RFC 822 dates, month-name dates
+and some non-date strings) with a copy of the old format loop and with a
+per-source DateTimeParser, and checks that both give the same results.
+
+Usage:
+    uv run python benchmarks/bench_datetime_parse.py [--items 50000] [--repeat 3]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.utils import DATETIME_FORMATS, DateTimeParser  # noqa: E402
+
+# (strftime format used to generate samples, share of the corpus)
+CORPUS_MIX = [
+    ("%m/%d/%Y %I:%M:%S %p", 30),  # RSS "Air date:" / author field
+    ("%Y-%m-%dT%H:%M:%S", 20),  # manual entries, JSON-LD
+    ("%B %d, %Y %I:%M %p", 15),  # scraped month-name dates
+    ("%B %d, %Y", 10),
+    ("%b %d, %Y", 10),
+    ("%a, %d %b %Y %H:%M:%S %z", 10),  # RFC 822 pubDate
+    ("%Y-%m-%d", 5),
+]
+# Share of strings that are not dates at all (e.g. RSS author names)
+NON_DATE_SHARE = 5
+
+
+def old_parse_datetime(dt_str: str) -> datetime | None:
+    """The previous implementation: try each format until one doesn't raise."""
+    if not dt_str:
+        return None
+    dt_str = dt_str.strip()
+    for fmt in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(dt_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def build_corpus(items: int) -> list[str]:
+    """Generate a shuffled mix of datetime strings."""
+    rng = random.Random(42)
+    formats = [fmt for fmt, _ in CORPUS_MIX]
+    weights = [share for _, share in CORPUS_MIX]
+    base = datetime(2025, 1, 1, 8, 0)
+    corpus = []
+    for _ in range(items):
+        if rng.randrange(100) < NON_DATE_SHARE:
+            corpus.append(rng.choice(["NIH VideoCast", "Office of the Director", "TBA"]))
+            continue
+        dt = base + timedelta(minutes=15 * rng.randrange(50_000))
+        fmt = rng.choices(formats, weights)[0]
+        text = dt.strftime(fmt.replace("%z", "+0000"))
+        corpus.append(text)
+    return corpus
+
+
+def best_of(repeat: int, func, corpus: list[str]) -> tuple[float, list]:
+    """Return the fastest wall-clock time over several runs and the results."""
+    best = float("inf")
+    results: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(text) for text in corpus]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.items)
+    old_time, old_results = best_of(args.repeat, old_parse_datetime, corpus)
+    new_time, new_results = best_of(args.repeat, DateTimeParser().parse, corpus)
+
+    if old_results != new_results:
+        print("Results differ between the old and new parser")
+        return 1
+
+    print(f"Format loop:     {old_time:.3f}s ({len(corpus)} strings)")
+    print(f"Sniffing parser: {new_time:.3f}s ({len(corpus)} strings)")
+    print(f"Speedup:         {old_time / new_time:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
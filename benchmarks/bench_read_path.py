@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: validated vs trusted seminar read path.
+
+Builds a throwaway database with 100k seminars inside the default time window
+and times get_seminars_in_window() with full pydantic validation against the
+trusted read path used by the generators (fields=RENDER_FIELDS).
+
+Usage:
+    uv run python benchmarks/bench_read_path.py [--rows 100000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.database import SeminarDatabase  # noqa: E402
+from src.core.models import Seminar  # noqa: E402
+
+
+def build_database(path: Path, rows: int) -> SeminarDatabase:
+    """Fill a database with realistic-looking seminars spread over the window."""
+    database = SeminarDatabase(path, {"persistent_connection": True})
+    now = datetime.utcnow()
+    batch = []
+    for i in range(rows):
+        batch.append(
+            Seminar(
+                source_id=f"source_{i % 20}",
+                title=f"Seminar {i}: Host-pathogen interactions in   tuberculosis",
+                description="Weekly infectious disease seminar. " * 20,
+                url=f"https://example.org/events/{i}",
+                start_datetime=now + timedelta(minutes=(i % 80000) - 40000),
+                location="Online",
+                organizer="Example University",
+                category="University - Example",
+                tags=["immunology", "tuberculosis"],
+                raw_data={"uid": f"{i}@example.org", "summary": "x" * 400, "links": [{"href": "https://example.org"}] * 3},
+            )
+        )
+        if len(batch) == 5000:
+            database.upsert_many(batch)
+            batch = []
+    database.upsert_many(batch)
+    return database
+
+
+def best_of(repeat: int, func) -> tuple[float, int]:
+    """Return the fastest wall-clock time over several runs and the row count."""
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(func())
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building database with {args.rows} rows...")
+        database = build_database(Path(tmp) / "bench.db", args.rows)
+
+        validated, n_validated = best_of(
+            args.repeat, lambda: database.get_seminars_in_window()
+        )
+        trusted, n_trusted = best_of(
+            args.repeat,
+            lambda: database.get_records_in_window(),
+        )
+        database.close()
+
+    print(f"Validated path: {validated:.3f}s ({n_validated} seminars)")
+    print(f"Trusted path:   {trusted:.3f}s ({n_trusted} seminars)")
+    print(f"Speedup:        {validated / trusted:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Regression check: startup import time of the pipeline against its dependencies.
+
+Imports what a collection run loads before touching any source (main.py,
+the database and the collector) in a fresh interpreter with -X importtime,
+and fails if any module that should only load on demand (source parsers,
+generators, the deploy package) was imported.
+
+The import time is compared with a baseline measured in the same run: a
+fresh interpreter importing only the third-party packages startup needs
+anyway. The check fails if our own modules add more than --max-overhead
+(a fraction of the baseline) on top of it, so the budget scales with the
+machine instead of being a fixed number of milliseconds. Both are the best
+of several interleaved runs.
+
+Usage:
+    uv run python benchmarks/check_import_time.py [--max-overhead 1.0] [--repeat 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# What a collection run imports before the first source runs
+STARTUP_IMPORTS = "import main, src.core.database, src.sources.collector"
+
+# Third-party packages the startup path cannot avoid
+BASELINE_IMPORTS = "import pydantic, pytz, requests, rich.console, sqlite3, toml"
+
+# Share of the baseline our own modules may add on top of it
+DEFAULT_MAX_OVERHEAD = 1.0
+
+# Modules that must not be imported at startup
+LAZY_MODULES = (
+    "atproto",
+    "bs4",
+    "feedparser",
+    "icalendar",
+    "src.deploy",
+    "src.generators",
+    "src.sources.bluesky_source",
+    "src.sources.conference_source",
+    "src.sources.ical_source",
+    "src.sources.manual_source",
+    "src.sources.podcast_source",
+    "src.sources.rss_source",
+    "src.sources.scraper_source",
+    "src.sources.who_source",
+)
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def measure_imports(statement: str) -> tuple[float, set[str]]:
+    """
+    Run an import statement in a new interpreter.
+
+    Returns:
+        (milliseconds spent importing, names of all imported modules); the
+        time is the sum of every module's self time, so nested and
+        interpreter-startup imports are all counted once
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            total_us += int(match.group(1))
+            modules.add(match.group(3))
+    return total_us / 1000, modules
+
+
+def eager_modules(modules: set[str]) -> list[str]:
+    """Return the LAZY_MODULES (or their submodules) found among imported modules."""
+    return [
+        lazy for lazy in LAZY_MODULES
+        if any(name == lazy or name.startswith(f"{lazy}.") for name in modules)
+    ]
+
+
+def measure_overhead(repeat: int) -> tuple[float, float, set[str]]:
+    """
+    Measure startup and baseline import times, interleaved, best of `repeat`.
+
+    Returns:
+        (startup milliseconds, baseline milliseconds, modules imported at startup)
+    """
+    startup_ms = baseline_ms = float("inf")
+    modules: set[str] = set()
+    for _ in range(repeat):
+        ms, modules = measure_imports(STARTUP_IMPORTS)
+        startup_ms = min(startup_ms, ms)
+        baseline_ms = min(baseline_ms, measure_imports(BASELINE_IMPORTS)[0])
+    return startup_ms, baseline_ms, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-overhead", type=float, default=DEFAULT_MAX_OVERHEAD)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    startup_ms, baseline_ms, modules = measure_overhead(args.repeat)
+    failed = False
+    eager = eager_modules(modules)
+    if eager:
+        print(f"Imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+
+    overhead = startup_ms / baseline_ms - 1
+    print(
+        f"Startup imports: {startup_ms:.0f}ms, dependencies alone: {baseline_ms:.0f}ms "
+        f"(overhead {overhead:.0%}, budget {args.max_overhead:.0%})"
+    )
+    if overhead > args.max_overhead:
+        print("Startup budget exceeded")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
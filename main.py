@@ -7,34 +7,37 @@ and optionally uploads to LabKey WebDAV.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import toml
 
-from src.core.database import SeminarDatabase
-from src.core.exclusion_filter import ExclusionFilter
+from src.core.http_client import close_session
 from src.core.utils import console
-from src.deploy.webdav_uploader import upload_to_labkey
-from src.generators.html_generator import HTMLGenerator
-from src.generators.ics_generator import ICSGenerator
-from src.generators.json_generator import JSONGenerator
-from src.sources.collector import SourceCollector
 
 
-def main(skip_upload: bool = False) -> int:
+def main(skip_upload: bool = False, refilter: bool = False, force: bool = False) -> int:
     """
     Main pipeline: collect -> generate -> upload.
 
     Args:
         skip_upload: If True, skip the upload step (for local testing)
+        refilter: If True, re-apply the filter config to stored rejected
+            candidates instead of collecting; implies skip_upload
+        force: If True, collect every source, including ones refreshed recently
 
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    # Imported here so that loading main.py (e.g. for --help) stays light
+    from src.core.database import SeminarDatabase
+    from src.sources.collector import SourceCollector
+
     console.print("[bold blue]GID Seminars Aggregator[/bold blue]\n")
 
     base_dir = Path(__file__).parent
     config_dir = base_dir / "config"
+    database: SeminarDatabase | None = None
 
     try:
         # Load configurations
@@ -43,59 +46,86 @@ def main(skip_upload: bool = False) -> int:
         settings_config = toml.load(config_dir / "settings.toml")
 
         # Initialize database
-        db_path = base_dir / settings_config.get("database", {}).get(
-            "path", "data/seminars.db"
+        database_config = settings_config.get("database", {})
+        db_path = base_dir / database_config.get("path", "data/seminars.db")
+        # Exclusions are stored per seminar; the database loads the rules and
+        # only re-checks stored rows when they change
+        database = SeminarDatabase(
+            db_path, database_config, base_dir / "data" / "excluded_events.toml"
         )
-        database = SeminarDatabase(db_path)
         console.print(f"  Database: {db_path}")
+        if database.exclusions_update is not None:
+            console.print(
+                f"  [dim]Exclusion rules changed: {database.exclusions_update} "
+                "stored event(s) excluded[/dim]"
+            )
 
-        # Step 1: Collect seminars
-        console.print("\n[bold]Step 1: Collecting seminars...[/bold]")
         collector = SourceCollector(
             sources_config=sources_config,
             settings_config=settings_config,
             database=database,
             base_dir=base_dir,
         )
-        collection_results = collector.collect_all()
 
-        # Check if any sources succeeded
-        successful_sources = sum(
-            1 for r in collection_results.values() if r["status"] == "success"
+        if refilter:
+            # Step 1: Re-apply the filter to stored candidates, no network access
+            console.print("\n[bold]Step 1: Re-filtering rejected candidates...[/bold]")
+            collector.refilter_rejected()
+            skip_upload = True
+        else:
+            # Step 1: Collect seminars
+            console.print("\n[bold]Step 1: Collecting seminars...[/bold]")
+            collection_results = collector.collect_all(force=force)
+
+            # Check if any sources succeeded (deferred sources are still fresh)
+            successful_sources = sum(
+                1 for r in collection_results.values()
+                if r["status"] in ("success", "deferred")
+            )
+            if successful_sources == 0:
+                console.print("\n[red]All sources failed. Aborting.[/red]")
+                return 1
+
+        # Step 2: Generate outputs (generators are imported here to keep startup light)
+        console.print("\n[bold]Step 2: Generating outputs...[/bold]")
+        from src.generators import (
+            HTMLGenerator,
+            ICSGenerator,
+            JSONGenerator,
+            build_render_snapshot,
         )
-        if successful_sources == 0:
-            console.print("\n[red]All sources failed. Aborting.[/red]")
-            return 1
 
-        # Load exclusion filter
-        console.print("\n[bold]Loading exclusion filter...[/bold]")
-        exclusions_path = base_dir / "data" / "excluded_events.toml"
-        exclusion_filter = ExclusionFilter(exclusions_path)
-
-        # Step 2: Generate outputs
-        console.print("\n[bold]Step 2: Generating outputs...[/bold]")
         output_config = settings_config.get("output", {})
         output_dir = base_dir / output_config.get("output_dir", "local-outputs")
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate ICS
-        ics_generator = ICSGenerator(settings_config, database, exclusion_filter)
-        ics_path = output_dir / output_config.get("ics_filename", "gid_seminars.ics")
-        ics_generator.generate(ics_path)
-
-        # Generate HTML
-        html_generator = HTMLGenerator(settings_config, database, exclusion_filter)
-        html_path = output_dir / output_config.get("html_filename", "index.html")
-        html_generator.generate(html_path)
-
-        # Generate JSON
-        json_generator = JSONGenerator(settings_config, database, exclusion_filter)
-        json_path = output_dir / output_config.get("json_filename", "seminars.json")
-        json_generator.generate(json_path)
+        # Load and filter the time window once for all generators
+        snapshot = build_render_snapshot(settings_config, database)
+        console.print(f"  Snapshot: {snapshot.count} seminar(s) in window")
+
+        # Render ICS, HTML and JSON in parallel from the same snapshot
+        outputs = [
+            (ICSGenerator, output_config.get("ics_filename", "gid_seminars.ics")),
+            (HTMLGenerator, output_config.get("html_filename", "index.html")),
+            (JSONGenerator, output_config.get("json_filename", "seminars.json")),
+        ]
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            futures = [
+                executor.submit(
+                    generator_class(settings_config, database).generate,
+                    output_dir / filename,
+                    snapshot,
+                )
+                for generator_class, filename in outputs
+            ]
+            for future in futures:
+                future.result()
 
         # Step 3: Upload to LabKey (unless skipped)
         if not skip_upload:
             console.print("\n[bold]Step 3: Uploading to LabKey...[/bold]")
+            from src.deploy import upload_to_labkey
+
             upload_results = upload_to_labkey(base_dir)
 
             # Check for upload failures
@@ -106,10 +136,10 @@ def main(skip_upload: bool = False) -> int:
                         f"\n[yellow]Warning: {failed_uploads} file(s) failed to upload[/yellow]"
                     )
         else:
-            console.print("\n[dim]Step 3: Upload skipped (--skip-upload)[/dim]")
+            console.print("\n[dim]Step 3: Upload skipped (--skip-upload/--refilter)[/dim]")
 
         # Print database statistics
-        stats = database.get_statistics()
+        stats = snapshot.statistics
         console.print("\n[bold]Database Statistics:[/bold]")
         console.print(f"  Total seminars: {stats['total_seminars']}")
         console.print(f"  By source: {stats['by_source']}")
@@ -124,8 +154,19 @@ def main(skip_upload: bool = False) -> int:
         traceback.print_exc()
         return 1
 
+    finally:
+        close_session()
+        if database is not None:
+            database.close()
+
 
 if __name__ == "__main__":
     # Check for --skip-upload flag
     skip_upload = "--skip-upload" in sys.argv or "--local" in sys.argv
-    sys.exit(main(skip_upload=skip_upload))
+    sys.exit(
+        main(
+            skip_upload=skip_upload,
+            refilter="--refilter" in sys.argv,
+            force="--force" in sys.argv,
+        )
+    )
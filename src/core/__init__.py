@@ -1,13 +1,14 @@
 # Core modules for GID Seminars
 """Core infrastructure: models, database, exceptions."""
 
-from .models import Seminar, SourceRun, AccessRestriction
+from .models import Seminar, SeminarRecord, FilterVerdict, SourceRun, AccessRestriction
 from .database import SeminarDatabase
 from .exceptions import (
     GIDSeminarsError,
     SourceError,
     ParseError,
     NetworkError,
+    NotModifiedError,
     DatabaseError,
     ConfigurationError,
     DeploymentError,
@@ -15,6 +16,8 @@ from .exceptions import (
 
 __all__ = [
     "Seminar",
+    "SeminarRecord",
+    "FilterVerdict",
     "SourceRun",
     "AccessRestriction",
     "SeminarDatabase",
@@ -22,6 +25,7 @@ __all__ = [
     "SourceError",
     "ParseError",
     "NetworkError",
+    "NotModifiedError",
     "DatabaseError",
     "ConfigurationError",
     "DeploymentError",
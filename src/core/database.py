@@ -3,14 +3,36 @@
 
 import json
 import sqlite3
+import statistics
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Callable, Generator, Iterator, Sequence
 
 from .exceptions import DatabaseError
-from .models import Seminar, SourceRun, SourceRunStatus
-from .utils import DEFAULT_DAYS_AHEAD, DEFAULT_DAYS_BEHIND
+from .exclusion_filter import ExclusionFilter
+from .models import FilterVerdict, Seminar, SeminarRecord, SourceRun, SourceRunStatus
+from .utils import DEFAULT_DAYS_AHEAD, DEFAULT_DAYS_BEHIND, to_utc_epoch
+
+
+def _decode_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _decode_json(value: str | None) -> Any:
+    return json.loads(value) if value else None
+
+
+# Decoders for columns stored as text that map to richer field types
+_COLUMN_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "start_datetime": _decode_datetime,
+    "end_datetime": _decode_datetime,
+    "created_at": _decode_datetime,
+    "updated_at": _decode_datetime,
+    "tags": lambda value: json.loads(value) if value else [],
+    "raw_data": _decode_json,
+}
 
 
 class SeminarDatabase:
@@ -18,24 +40,156 @@ class SeminarDatabase:
 
     SCHEMA_VERSION = 1
 
-    def __init__(self, db_path: Path):
+    # Columns the output generators read - skips raw_data and bookkeeping timestamps
+    RENDER_FIELDS = (
+        "id", "source_id", "title", "description", "url",
+        "start_datetime", "end_datetime", "start_epoch", "timezone", "location", "organizer",
+        "category", "tags", "access_restriction", "registration_url",
+        "recording_url", "checksum",
+    )
+
+    # Rows fetched per round trip by the streaming iterators
+    STREAM_BATCH_SIZE = 500
+
+    # PRAGMA values accepted from the [database] settings table
+    PRAGMA_SETTINGS = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store")
+
+    def __init__(
+        self,
+        db_path: Path,
+        config: dict[str, Any] | None = None,
+        exclusions_path: Path | None = None,
+    ):
+        """
+        Initialize the database.
+
+        Args:
+            db_path: Path to the SQLite file
+            config: Optional [database] settings. persistent_connection keeps a
+                single tuned connection open until close(); the PRAGMA_SETTINGS
+                keys and cached_statements tune every connection.
+            exclusions_path: Exclusion rules applied to stored and upserted
+                seminars; defaults to excluded_events.toml next to the database
+        """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        config = config or {}
+        self.persistent = config.get("persistent_connection", False)
+        self.cached_statements = config.get("cached_statements", 128)
+        self.pragmas = {
+            name: config[name] for name in self.PRAGMA_SETTINGS if name in config
+        }
+
+        # Serializes access so sources collected from worker threads never
+        # write to SQLite concurrently
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._depth = 0
         self._ensure_schema()
 
+        # Exclusion rules applied to seminars as they are upserted. Loading
+        # them here means no upsert can run before the rules are in place.
+        # exclusions_update is the number of excluded seminars when the rules
+        # changed since the last run, else None.
+        self.exclusion_filter = ExclusionFilter(
+            exclusions_path or self.db_path.parent / "excluded_events.toml"
+        )
+        self.exclusions_update = self.apply_exclusions(self.exclusion_filter)
+
     @contextmanager
     def connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Context manager for database connections.
+
+        Commits on success and rolls back on error. In persistent mode the
+        shared connection is reused and only the outermost block commits.
+        Errors are raised as DatabaseError; one raised by a nested block
+        passes through unchanged.
+        """
+        with self._lock:
+            if self.persistent:
+                conn = self._get_persistent_connection()
+                self._depth += 1
+                try:
+                    yield conn
+                    if self._depth == 1:
+                        conn.commit()
+                except Exception as e:
+                    if self._depth == 1:
+                        conn.rollback()
+                    if isinstance(e, DatabaseError):
+                        raise
+                    raise DatabaseError(f"Database error: {e}") from e
+                finally:
+                    self._depth -= 1
+                return
+
+            conn = self._open_connection()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                if isinstance(e, DatabaseError):
+                    raise
+                raise DatabaseError(f"Database error: {e}") from e
+            finally:
+                conn.close()
+
+    @property
+    def uses_wal(self) -> bool:
+        """Whether connections are configured with journal_mode = WAL."""
+        return str(self.pragmas.get("journal_mode", "")).upper() == "WAL"
+
+    def checkpoint(self) -> None:
+        """
+        Fold the WAL back into the main database file.
+
+        The -wal file is not committed with the database, so this runs after
+        every source's batch; a run killed before close() then still leaves a
+        seminars.db holding everything committed so far.
+        """
+        if not self.uses_wal:
+            return
+        with self.connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        """Checkpoint and close the persistent connection, if one is open."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                if self.uses_wal:
+                    # Fold the WAL back into the main file so the .db is self-contained
+                    self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Database error: {e}") from e
+            finally:
+                self._conn = None
+
+    def _get_persistent_connection(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use."""
+        if self._conn is None:
+            # Worker threads share the connection; self._lock serializes use
+            self._conn = self._open_connection(check_same_thread=False)
+        return self._conn
+
+    def _open_connection(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open a connection with the configured PRAGMAs applied."""
         try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
+            conn = sqlite3.connect(
+                self.db_path,
+                cached_statements=self.cached_statements,
+                check_same_thread=check_same_thread,
+            )
+            conn.row_factory = sqlite3.Row
+            for name, value in self.pragmas.items():
+                conn.execute(f"PRAGMA {name} = {value}")
+        except sqlite3.Error as e:
             raise DatabaseError(f"Database error: {e}") from e
-        finally:
-            conn.close()
+        return conn
 
     def _ensure_schema(self) -> None:
         """Create tables if they don't exist."""
@@ -52,6 +206,8 @@ class SeminarDatabase:
                     url TEXT,
                     start_datetime TEXT NOT NULL,
                     end_datetime TEXT,
+                    start_epoch INTEGER,
+                    end_epoch INTEGER,
                     timezone TEXT DEFAULT 'America/New_York',
                     location TEXT,
                     organizer TEXT,
@@ -63,7 +219,9 @@ class SeminarDatabase:
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL,
                     checksum TEXT,
-                    raw_data TEXT
+                    raw_data TEXT,
+                    excluded INTEGER NOT NULL DEFAULT 0,
+                    excluded_reason TEXT
                 )
             """)
 
@@ -82,6 +240,8 @@ class SeminarDatabase:
                     etag TEXT,
                     last_modified TEXT,
                     content_hash TEXT,
+                    cache_status TEXT,
+                    filter_hash TEXT,
                     error_message TEXT,
                     duration_seconds REAL
                 )
@@ -98,6 +258,71 @@ class SeminarDatabase:
                 )
             """)
 
+            # Keyword-filter verdicts, reused while checksum and config are unchanged
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS filter_verdicts (
+                    seminar_id TEXT PRIMARY KEY,
+                    source_id TEXT NOT NULL,
+                    checksum TEXT,
+                    config_hash TEXT NOT NULL,
+                    matched INTEGER NOT NULL,
+                    keywords TEXT,
+                    evaluated_at TEXT NOT NULL
+                )
+            """)
+
+            # Candidates rejected by the keyword filter, kept so a changed
+            # filter config can be re-applied without refetching
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS rejected_seminars (
+                    id TEXT PRIMARY KEY,
+                    source_id TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    description TEXT,
+                    url TEXT,
+                    start_datetime TEXT NOT NULL,
+                    end_datetime TEXT,
+                    start_epoch INTEGER,
+                    end_epoch INTEGER,
+                    timezone TEXT DEFAULT 'America/New_York',
+                    location TEXT,
+                    organizer TEXT,
+                    category TEXT,
+                    tags TEXT,
+                    access_restriction TEXT DEFAULT 'Public',
+                    registration_url TEXT,
+                    recording_url TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    checksum TEXT,
+                    raw_data TEXT
+                )
+            """)
+
+            # Key/value state, e.g. the hash of the exclusion rules last applied
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+            # Columns added after the initial schema
+            self._ensure_columns(
+                cursor, "source_runs", {"cache_status": "TEXT", "filter_hash": "TEXT"}
+            )
+            self._ensure_columns(
+                cursor,
+                "seminars",
+                {
+                    "start_epoch": "INTEGER",
+                    "end_epoch": "INTEGER",
+                    "excluded": "INTEGER NOT NULL DEFAULT 0",
+                    "excluded_reason": "TEXT",
+                },
+            )
+            self._backfill_epochs(cursor)
+
             # Indexes
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_seminars_source ON seminars(source_id)"
@@ -105,12 +330,55 @@ class SeminarDatabase:
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_seminars_start ON seminars(start_datetime)"
             )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_seminars_start_epoch ON seminars(start_epoch)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_seminars_excluded_start "
+                "ON seminars(excluded, start_epoch)"
+            )
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_seminars_category ON seminars(category)"
             )
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_source_runs_source ON source_runs(source_id)"
             )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_filter_verdicts_source ON filter_verdicts(source_id)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_rejected_seminars_updated ON rejected_seminars(updated_at)"
+            )
+
+    def _ensure_columns(
+        self, cursor: sqlite3.Cursor, table: str, columns: dict[str, str]
+    ) -> None:
+        """Add any columns missing from an existing table."""
+        cursor.execute(f"PRAGMA table_info({table})")
+        existing = {row["name"] for row in cursor.fetchall()}
+        for name, definition in columns.items():
+            if name not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+    def _backfill_epochs(self, cursor: sqlite3.Cursor) -> None:
+        """Fill UTC epoch columns for rows stored before they existed."""
+        cursor.execute("""
+            SELECT id, start_datetime, end_datetime, timezone FROM seminars
+            WHERE start_epoch IS NULL
+        """)
+        updates = []
+        for row in cursor.fetchall():
+            tz_name = row["timezone"] or "UTC"
+            end_datetime = _decode_datetime(row["end_datetime"])
+            updates.append((
+                to_utc_epoch(datetime.fromisoformat(row["start_datetime"]), tz_name),
+                to_utc_epoch(end_datetime, tz_name) if end_datetime else None,
+                row["id"],
+            ))
+        if updates:
+            cursor.executemany(
+                "UPDATE seminars SET start_epoch = ?, end_epoch = ? WHERE id = ?", updates
+            )
 
     # =========================================================================
     # Seminar Operations
@@ -123,89 +391,160 @@ class SeminarDatabase:
         Returns:
             Tuple of (is_new, change_type) where change_type is 'added', 'updated', or 'unchanged'
         """
+        counts = self.upsert_many([seminar])
+        if counts["added"]:
+            return True, "added"
+        if counts["updated"]:
+            return False, "updated"
+        return False, "unchanged"
+
+    def upsert_many(self, seminars: list[Seminar]) -> dict[str, int]:
+        """
+        Insert or update a batch of seminars in a single transaction.
+
+        The batch is staged in a temporary table so the checksum comparison and
+        the insert/update both run as set-based SQL. Rows whose checksum is
+        unchanged are left untouched (including updated_at). New and changed
+        rows are checked against the exclusion rules set by apply_exclusions().
+
+        Returns:
+            Dict with 'added', 'updated' and 'unchanged' counts
+        """
+        counts = {"added": 0, "updated": 0, "unchanged": 0}
+        if not seminars:
+            return counts
+
+        now = datetime.utcnow().isoformat()
+        rows = [
+            {**self._seminar_to_row(seminar, now), **self._exclusion_columns(seminar)}
+            for seminar in seminars
+        ]
+        columns = list(rows[0])
+        column_list = ", ".join(columns)
+        placeholders = ", ".join(f":{name}" for name in columns)
+        # created_at is kept from the original insert
+        assignments = ", ".join(
+            f"{name} = excluded.{name}"
+            for name in columns
+            if name not in ("id", "source_id", "created_at")
+        )
+
         with self.connection() as conn:
             cursor = conn.cursor()
 
-            # Check if seminar exists
-            cursor.execute("SELECT checksum FROM seminars WHERE id = ?", (seminar.id,))
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS seminar_batch AS "
+                "SELECT * FROM main.seminars WHERE 0"
+            )
+            cursor.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS temp.idx_seminar_batch_id "
+                "ON seminar_batch(id)"
+            )
+            cursor.execute("DELETE FROM seminar_batch")
+            # A repeated id within the batch keeps its last occurrence
+            cursor.executemany(
+                f"INSERT OR REPLACE INTO seminar_batch ({column_list}) VALUES ({placeholders})",
+                rows,
+            )
+
+            cursor.execute("""
+                SELECT
+                    COUNT(*) AS total,
+                    COALESCE(SUM(s.id IS NULL), 0) AS added,
+                    COALESCE(SUM(s.id IS NOT NULL AND s.checksum IS NOT b.checksum), 0) AS updated
+                FROM seminar_batch b
+                LEFT JOIN seminars s ON s.id = b.id
+            """)
             row = cursor.fetchone()
+            counts["added"] = row["added"]
+            counts["updated"] = row["updated"]
+            counts["unchanged"] = row["total"] - row["added"] - row["updated"]
 
-            now = datetime.utcnow().isoformat()
-            tags_json = json.dumps(seminar.tags)
-            raw_data_json = json.dumps(seminar.raw_data) if seminar.raw_data else None
-
-            if row is None:
-                # Insert new seminar
-                cursor.execute(
-                    """
-                    INSERT INTO seminars (
-                        id, source_id, title, description, url,
-                        start_datetime, end_datetime, timezone, location, organizer,
-                        category, tags, access_restriction, registration_url, recording_url,
-                        created_at, updated_at, checksum, raw_data
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        seminar.id,
-                        seminar.source_id,
-                        seminar.title,
-                        seminar.description,
-                        seminar.url,
-                        seminar.start_datetime.isoformat(),
-                        seminar.end_datetime.isoformat() if seminar.end_datetime else None,
-                        seminar.timezone,
-                        seminar.location,
-                        seminar.organizer,
-                        seminar.category,
-                        tags_json,
-                        seminar.access_restriction,
-                        seminar.registration_url,
-                        seminar.recording_url,
-                        now,
-                        now,
-                        seminar.checksum,
-                        raw_data_json,
-                    ),
+            # WHERE true disambiguates the upsert clause from a join constraint
+            cursor.execute(f"""
+                INSERT INTO seminars ({column_list})
+                SELECT {column_list} FROM seminar_batch WHERE true
+                ON CONFLICT(id) DO UPDATE SET {assignments}
+                WHERE seminars.checksum IS NOT excluded.checksum
+            """)
+            cursor.execute("DELETE FROM seminar_batch")
+
+        return counts
+
+    def _seminar_to_row(self, seminar: Seminar, now: str) -> dict[str, Any]:
+        """Convert a Seminar model to a dict of seminars table column values."""
+        return {
+            "id": seminar.id,
+            "source_id": seminar.source_id,
+            "title": seminar.title,
+            "description": seminar.description,
+            "url": seminar.url,
+            "start_datetime": seminar.start_datetime.isoformat(),
+            "end_datetime": seminar.end_datetime.isoformat() if seminar.end_datetime else None,
+            "start_epoch": seminar.start_epoch,
+            "end_epoch": seminar.end_epoch,
+            "timezone": seminar.timezone,
+            "location": seminar.location,
+            "organizer": seminar.organizer,
+            "category": seminar.category,
+            "tags": json.dumps(seminar.tags),
+            "access_restriction": seminar.access_restriction,
+            "registration_url": seminar.registration_url,
+            "recording_url": seminar.recording_url,
+            "created_at": now,
+            "updated_at": now,
+            "checksum": seminar.checksum,
+            "raw_data": json.dumps(seminar.raw_data) if seminar.raw_data else None,
+        }
+
+    def _exclusion_columns(self, seminar: Seminar | SeminarRecord) -> dict[str, Any]:
+        """Evaluate the exclusion rules for a seminar as column values."""
+        is_excluded, reason = self.exclusion_filter.is_excluded(seminar)
+        return {"excluded": int(is_excluded), "excluded_reason": reason}
+
+    def apply_exclusions(self, exclusion_filter: ExclusionFilter) -> int | None:
+        """
+        Use these exclusion rules for upserts and bring stored rows up to date.
+
+        Every stored seminar is re-evaluated only when the rules file hash
+        differs from the one last applied; otherwise the stored flags are
+        already correct.
+
+        Returns:
+            Number of excluded seminars after re-evaluating, or None if the
+            rules were unchanged
+        """
+        self.exclusion_filter = exclusion_filter
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT value FROM metadata WHERE key = 'exclusions_hash'")
+            row = cursor.fetchone()
+            if row and row["value"] == exclusion_filter.rules_hash:
+                return None
+
+            cursor.execute("SELECT id, title, url, excluded, excluded_reason FROM seminars")
+            updates = []
+            excluded_count = 0
+            for row in cursor.fetchall():
+                columns = self._exclusion_columns(
+                    SeminarRecord(id=row["id"], title=row["title"], url=row["url"])
                 )
-                return True, "added"
-
-            else:
-                # Check if content changed
-                if row["checksum"] == seminar.checksum:
-                    return False, "unchanged"
-
-                # Update existing seminar
-                cursor.execute(
-                    """
-                    UPDATE seminars SET
-                        title = ?, description = ?, url = ?,
-                        start_datetime = ?, end_datetime = ?, timezone = ?,
-                        location = ?, organizer = ?, category = ?, tags = ?,
-                        access_restriction = ?, registration_url = ?, recording_url = ?,
-                        updated_at = ?, checksum = ?, raw_data = ?
-                    WHERE id = ?
-                """,
-                    (
-                        seminar.title,
-                        seminar.description,
-                        seminar.url,
-                        seminar.start_datetime.isoformat(),
-                        seminar.end_datetime.isoformat() if seminar.end_datetime else None,
-                        seminar.timezone,
-                        seminar.location,
-                        seminar.organizer,
-                        seminar.category,
-                        tags_json,
-                        seminar.access_restriction,
-                        seminar.registration_url,
-                        seminar.recording_url,
-                        now,
-                        seminar.checksum,
-                        raw_data_json,
-                        seminar.id,
-                    ),
+                excluded_count += columns["excluded"]
+                if (columns["excluded"], columns["excluded_reason"]) != (
+                    row["excluded"], row["excluded_reason"]
+                ):
+                    updates.append((columns["excluded"], columns["excluded_reason"], row["id"]))
+            if updates:
+                cursor.executemany(
+                    "UPDATE seminars SET excluded = ?, excluded_reason = ? WHERE id = ?",
+                    updates,
                 )
-                return False, "updated"
+
+            cursor.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('exclusions_hash', ?)",
+                (exclusion_filter.rules_hash,),
+            )
+            return excluded_count
 
     def get_seminar_by_id(self, seminar_id: str) -> Seminar | None:
         """Retrieve a seminar by ID."""
@@ -225,75 +564,216 @@ class SeminarDatabase:
         categories: list[str] | None = None,
     ) -> list[Seminar]:
         """Get seminars within the specified time window."""
-        now = datetime.utcnow()
-        start_date = (now - timedelta(days=days_behind)).isoformat()
-        end_date = (now + timedelta(days=days_ahead)).isoformat()
-
         with self.connection() as conn:
             cursor = conn.cursor()
+            query, params = self._window_query(
+                "*", days_behind, days_ahead, source_ids, categories
+            )
+            cursor.execute(query, params)
+            return [self._row_to_seminar(row) for row in cursor.fetchall()]
 
-            query = """
-                SELECT * FROM seminars
-                WHERE start_datetime >= ? AND start_datetime <= ?
-            """
-            params: list[Any] = [start_date, end_date]
+    def iter_seminars_in_window(
+        self,
+        days_behind: int = DEFAULT_DAYS_BEHIND,
+        days_ahead: int = DEFAULT_DAYS_AHEAD,
+        source_ids: list[str] | None = None,
+        categories: list[str] | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Seminar]:
+        """
+        Stream seminars within the time window without loading them all.
 
-            if source_ids:
-                placeholders = ",".join("?" * len(source_ids))
-                query += f" AND source_id IN ({placeholders})"
-                params.extend(source_ids)
+        Rows are fetched batch_size at a time on a dedicated connection, so
+        only one batch is held in memory and other database users are not
+        blocked while the caller consumes the iterator.
+        """
+        query, params = self._window_query(
+            "*", days_behind, days_ahead, source_ids, categories
+        )
+        for row in self._iter_rows(query, params, batch_size):
+            yield self._row_to_seminar(row)
 
-            if categories:
-                placeholders = ",".join("?" * len(categories))
-                query += f" AND category IN ({placeholders})"
-                params.extend(categories)
+    def get_records_in_window(
+        self,
+        days_behind: int = DEFAULT_DAYS_BEHIND,
+        days_ahead: int = DEFAULT_DAYS_AHEAD,
+        source_ids: list[str] | None = None,
+        categories: list[str] | None = None,
+        fields: Sequence[str] = RENDER_FIELDS,
+        now: datetime | None = None,
+    ) -> list[SeminarRecord]:
+        """
+        Fast read path: get lightweight records within the time window.
 
-            query += " ORDER BY start_datetime ASC"
+        Only the requested columns are read and decoded (id is always
+        included), and no pydantic validation runs.
 
+        Args:
+            days_behind: Days before now to include
+            days_ahead: Days after now to include
+            source_ids: Optional source filter
+            categories: Optional category filter
+            fields: Columns to load; defaults to the columns generators render
+            now: Reference time for the window; defaults to the current UTC time
+        """
+        columns = ", ".join(dict.fromkeys(["id", *fields]))
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            query, params = self._window_query(
+                columns, days_behind, days_ahead, source_ids, categories, now=now
+            )
             cursor.execute(query, params)
-            return [self._row_to_seminar(row) for row in cursor.fetchall()]
+            to_record = self._record_builder(cursor)
+            return [to_record(row) for row in cursor.fetchall()]
+
+    def iter_records_in_window(
+        self,
+        days_behind: int = DEFAULT_DAYS_BEHIND,
+        days_ahead: int = DEFAULT_DAYS_AHEAD,
+        source_ids: list[str] | None = None,
+        categories: list[str] | None = None,
+        fields: Sequence[str] = RENDER_FIELDS,
+        now: datetime | None = None,
+        descending: bool = False,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[SeminarRecord]:
+        """
+        Stream lightweight records within the time window.
+
+        Streaming counterpart of get_records_in_window(); descending yields
+        the most recent seminars first.
+        """
+        columns = ", ".join(dict.fromkeys(["id", *fields]))
+        query, params = self._window_query(
+            columns, days_behind, days_ahead, source_ids, categories,
+            now=now, descending=descending,
+        )
+        to_record = None
+        for row in self._iter_rows(query, params, batch_size):
+            if to_record is None:
+                to_record = self._record_builder(row)
+            yield to_record(row)
+
+    def _window_query(
+        self,
+        columns: str,
+        days_behind: int,
+        days_ahead: int,
+        source_ids: list[str] | None,
+        categories: list[str] | None,
+        now: datetime | None = None,
+        descending: bool = False,
+    ) -> tuple[str, list[Any]]:
+        """
+        Build the SELECT and parameters for a time-window read.
+
+        The window is compared on the indexed UTC start_epoch column, so
+        seminars stored in different local timezones are ordered correctly.
+        Seminars flagged by the exclusion rules are left out.
+        """
+        now = now or datetime.utcnow()
+        start_epoch = to_utc_epoch(now - timedelta(days=days_behind))
+        end_epoch = to_utc_epoch(now + timedelta(days=days_ahead))
+
+        query = f"""
+            SELECT {columns} FROM seminars
+            WHERE excluded = 0 AND start_epoch >= ? AND start_epoch <= ?
+        """
+        params: list[Any] = [start_epoch, end_epoch]
+
+        if source_ids:
+            placeholders = ",".join("?" * len(source_ids))
+            query += f" AND source_id IN ({placeholders})"
+            params.extend(source_ids)
+
+        if categories:
+            placeholders = ",".join("?" * len(categories))
+            query += f" AND category IN ({placeholders})"
+            params.extend(categories)
+
+        query += " ORDER BY start_epoch DESC" if descending else " ORDER BY start_epoch ASC"
+        return query, params
 
     def get_seminars_by_source(self, source_id: str) -> list[Seminar]:
         """Get all seminars from a specific source."""
         with self.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT * FROM seminars WHERE source_id = ? ORDER BY start_datetime",
+                "SELECT * FROM seminars WHERE source_id = ? ORDER BY start_epoch",
                 (source_id,),
             )
             return [self._row_to_seminar(row) for row in cursor.fetchall()]
 
+    def iter_seminars_by_source(
+        self, source_id: str, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Seminar]:
+        """Stream all seminars from a specific source, batch_size rows at a time."""
+        query = "SELECT * FROM seminars WHERE source_id = ? ORDER BY start_epoch"
+        for row in self._iter_rows(query, [source_id], batch_size):
+            yield self._row_to_seminar(row)
+
+    def _iter_rows(
+        self, query: str, params: Sequence[Any], batch_size: int
+    ) -> Iterator[sqlite3.Row]:
+        """
+        Run a read query on its own connection and yield rows in batches.
+
+        The shared connection and its lock are never held between batches, so
+        a slow consumer can't stall collection or other generators. The
+        connection is closed when the iterator is exhausted or discarded.
+        """
+        # Closing may happen on whichever thread drops the iterator
+        conn = self._open_connection(check_same_thread=False)
+        try:
+            cursor = conn.execute(query, params)
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Database error: {e}") from e
+        finally:
+            conn.close()
+
     def delete_stale_seminars(self, source_id: str, current_ids: list[str]) -> int:
-        """Delete seminars from source that are no longer present in the feed."""
+        """
+        Delete seminars from source that are no longer present in the feed.
+
+        Current ids are staged in a temporary table and matched with an
+        anti-join, so the query size doesn't grow with the feed and SQLite's
+        bound-variable limit never applies.
+
+        Returns:
+            Number of seminars deleted
+        """
         if not current_ids:
             return 0
 
         with self.connection() as conn:
             cursor = conn.cursor()
-
-            # Get count of seminars to delete
-            placeholders = ",".join("?" * len(current_ids))
+            self._stage_current_ids(cursor, current_ids)
             cursor.execute(
-                f"""
-                SELECT COUNT(*) FROM seminars
-                WHERE source_id = ? AND id NOT IN ({placeholders})
+                """
+                DELETE FROM seminars
+                WHERE source_id = ?
+                  AND NOT EXISTS (SELECT 1 FROM current_ids c WHERE c.id = seminars.id)
             """,
-                [source_id] + current_ids,
+                (source_id,),
             )
-            count = cursor.fetchone()[0]
-
-            # Delete stale seminars
-            if count > 0:
-                cursor.execute(
-                    f"""
-                    DELETE FROM seminars
-                    WHERE source_id = ? AND id NOT IN ({placeholders})
-                """,
-                    [source_id] + current_ids,
-                )
+            count = cursor.rowcount
+            cursor.execute("DELETE FROM current_ids")
 
             return count
 
+    def _stage_current_ids(self, cursor: sqlite3.Cursor, ids: list[str]) -> None:
+        """Load ids into the temporary current_ids table for an anti-join."""
+        cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS current_ids (id TEXT PRIMARY KEY)"
+        )
+        cursor.execute("DELETE FROM current_ids")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO current_ids (id) VALUES (?)",
+            ((item_id,) for item_id in ids),
+        )
+
     def get_all_categories(self) -> list[str]:
         """Get list of all unique categories."""
         with self.connection() as conn:
@@ -337,6 +817,32 @@ class SeminarDatabase:
                 "by_category": by_category,
             }
 
+    def _record_builder(
+        self, source: sqlite3.Cursor | sqlite3.Row
+    ) -> Callable[[Sequence[Any]], SeminarRecord]:
+        """
+        Return a function converting (possibly partial) rows to SeminarRecords.
+
+        Column decoders are resolved once per query rather than once per row.
+        """
+        if isinstance(source, sqlite3.Row):
+            names = source.keys()
+        else:
+            names = [column[0] for column in source.description]
+        decoders = [
+            (index, _COLUMN_DECODERS[name])
+            for index, name in enumerate(names)
+            if name in _COLUMN_DECODERS
+        ]
+
+        def to_record(row: Sequence[Any]) -> SeminarRecord:
+            values = list(row)
+            for index, decoder in decoders:
+                values[index] = decoder(values[index])
+            return SeminarRecord(**dict(zip(names, values)))
+
+        return to_record
+
     def _row_to_seminar(self, row: sqlite3.Row) -> Seminar:
         """Convert a database row to a Seminar model."""
         return Seminar(
@@ -363,6 +869,200 @@ class SeminarDatabase:
             raw_data=json.loads(row["raw_data"]) if row["raw_data"] else None,
         )
 
+    # =========================================================================
+    # Filter Verdict Operations
+    # =========================================================================
+
+    def get_filter_verdicts(
+        self, source_id: str, config_hash: str
+    ) -> dict[str, FilterVerdict]:
+        """Get stored keyword-filter verdicts for a source, keyed by seminar ID."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT seminar_id, checksum, config_hash, matched, keywords
+                FROM filter_verdicts
+                WHERE source_id = ? AND config_hash = ?
+            """,
+                (source_id, config_hash),
+            )
+            return {
+                row["seminar_id"]: FilterVerdict(
+                    checksum=row["checksum"],
+                    config_hash=row["config_hash"],
+                    matched=bool(row["matched"]),
+                    keywords=json.loads(row["keywords"]) if row["keywords"] else [],
+                )
+                for row in cursor.fetchall()
+            }
+
+    def save_filter_verdicts(
+        self, source_id: str, verdicts: dict[str, FilterVerdict]
+    ) -> None:
+        """
+        Store the verdicts for a source's current items.
+
+        Unchanged verdicts are not rewritten, and verdicts for items the
+        source no longer lists are removed.
+        """
+        if not verdicts:
+            return
+
+        now = datetime.utcnow().isoformat()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO filter_verdicts
+                    (seminar_id, source_id, checksum, config_hash, matched, keywords, evaluated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(seminar_id) DO UPDATE SET
+                    source_id = excluded.source_id,
+                    checksum = excluded.checksum,
+                    config_hash = excluded.config_hash,
+                    matched = excluded.matched,
+                    keywords = excluded.keywords,
+                    evaluated_at = excluded.evaluated_at
+                WHERE filter_verdicts.checksum IS NOT excluded.checksum
+                   OR filter_verdicts.config_hash IS NOT excluded.config_hash
+            """,
+                (
+                    (
+                        seminar_id,
+                        source_id,
+                        verdict.checksum,
+                        verdict.config_hash,
+                        int(verdict.matched),
+                        json.dumps(verdict.keywords),
+                        now,
+                    )
+                    for seminar_id, verdict in verdicts.items()
+                ),
+            )
+
+            self._stage_current_ids(cursor, list(verdicts))
+            cursor.execute(
+                """
+                DELETE FROM filter_verdicts
+                WHERE source_id = ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM current_ids c WHERE c.id = filter_verdicts.seminar_id
+                  )
+            """,
+                (source_id,),
+            )
+            cursor.execute("DELETE FROM current_ids")
+
+    # =========================================================================
+    # Rejected Candidate Operations
+    # =========================================================================
+
+    def save_rejected_seminars(
+        self, rejected: list[Seminar], accepted_ids: list[str]
+    ) -> None:
+        """
+        Keep the candidates a source run filtered out.
+
+        Each stored candidate's updated_at is refreshed whenever the source
+        still lists it, so retention counts from the last time it was seen.
+        Candidates that are now accepted are dropped.
+        """
+        now = datetime.utcnow().isoformat()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            if rejected:
+                rows = [self._seminar_to_row(seminar, now) for seminar in rejected]
+                columns = list(rows[0])
+                assignments = ", ".join(
+                    f"{name} = excluded.{name}"
+                    for name in columns
+                    if name not in ("id", "created_at")
+                )
+                cursor.executemany(
+                    f"""
+                    INSERT INTO rejected_seminars ({", ".join(columns)})
+                    VALUES ({", ".join(f":{name}" for name in columns)})
+                    ON CONFLICT(id) DO UPDATE SET {assignments}
+                """,
+                    rows,
+                )
+
+            if accepted_ids:
+                self._delete_rejected(cursor, accepted_ids)
+
+    def get_rejected_seminars(self) -> list[Seminar]:
+        """Get all stored rejected candidates, grouped by source."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM rejected_seminars ORDER BY source_id, start_epoch"
+            )
+            return [self._row_to_seminar(row) for row in cursor.fetchall()]
+
+    def delete_rejected_seminars(self, seminar_ids: list[str]) -> int:
+        """
+        Delete stored rejected candidates by ID.
+
+        Returns:
+            Number of candidates deleted
+        """
+        if not seminar_ids:
+            return 0
+
+        with self.connection() as conn:
+            return self._delete_rejected(conn.cursor(), seminar_ids)
+
+    def _delete_rejected(self, cursor: sqlite3.Cursor, seminar_ids: list[str]) -> int:
+        """Delete rejected candidates by ID using the current_ids table."""
+        self._stage_current_ids(cursor, seminar_ids)
+        cursor.execute("""
+            DELETE FROM rejected_seminars
+            WHERE EXISTS (SELECT 1 FROM current_ids c WHERE c.id = rejected_seminars.id)
+        """)
+        count = cursor.rowcount
+        cursor.execute("DELETE FROM current_ids")
+        return count
+
+    def touch_rejected_seminars(self, source_ids: list[str]) -> int:
+        """
+        Mark the stored rejected candidates of sources as seen now.
+
+        For sources whose run kept the existing rows without parsing the feed
+        (not modified, or deferred by the scheduler): their candidates are
+        presumably still listed, so retention should not run out for them.
+
+        Returns:
+            Number of candidates touched
+        """
+        if not source_ids:
+            return 0
+
+        now = datetime.utcnow().isoformat()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                UPDATE rejected_seminars SET updated_at = ?
+                WHERE source_id IN ({", ".join("?" * len(source_ids))})
+            """,
+                [now, *source_ids],
+            )
+            return cursor.rowcount
+
+    def prune_rejected_seminars(self, retention_days: int) -> int:
+        """
+        Delete rejected candidates not seen for more than retention_days.
+
+        Returns:
+            Number of candidates deleted
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=retention_days)).isoformat()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM rejected_seminars WHERE updated_at < ?", (cutoff,))
+            return cursor.rowcount
+
     # =========================================================================
     # Source Run Operations
     # =========================================================================
@@ -390,9 +1090,18 @@ class SeminarDatabase:
         events_removed: int = 0,
         error_message: str | None = None,
         etag: str | None = None,
+        last_modified: str | None = None,
         content_hash: str | None = None,
+        cache_status: str | None = None,
+        filter_hash: str | None = None,
     ) -> None:
-        """Record the completion of a source run."""
+        """
+        Record the completion of a source run.
+
+        cache_status marks runs that reused existing rows, e.g. 'not_modified'
+        when the server answered a conditional request with 304. filter_hash
+        identifies the filter config the source's rows were filtered with.
+        """
         with self.connection() as conn:
             cursor = conn.cursor()
 
@@ -417,7 +1126,10 @@ class SeminarDatabase:
                     events_removed = ?,
                     error_message = ?,
                     etag = ?,
+                    last_modified = ?,
                     content_hash = ?,
+                    cache_status = ?,
+                    filter_hash = ?,
                     duration_seconds = ?
                 WHERE id = ?
             """,
@@ -430,7 +1142,10 @@ class SeminarDatabase:
                     events_removed,
                     error_message,
                     etag,
+                    last_modified,
                     content_hash,
+                    cache_status,
+                    filter_hash,
                     duration,
                     run_id,
                 ),
@@ -464,12 +1179,115 @@ class SeminarDatabase:
                     events_updated=row["events_updated"],
                     events_removed=row["events_removed"],
                     etag=row["etag"],
+                    last_modified=row["last_modified"],
                     content_hash=row["content_hash"],
+                    cache_status=row["cache_status"],
+                    filter_hash=row["filter_hash"],
                     error_message=row["error_message"],
                     duration_seconds=row["duration_seconds"],
                 )
             return None
 
+    def get_failure_streaks(self) -> dict[str, tuple[int, datetime]]:
+        """
+        Count each source's errors since its last successful run.
+
+        Skipped runs neither extend nor break a streak.
+
+        Returns:
+            source_id -> (consecutive errors, start time of the latest one),
+            for sources whose latest completed run failed
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT source_id, COUNT(*), MAX(run_started_at)
+                FROM source_runs AS runs
+                WHERE status = ?
+                  AND run_started_at > COALESCE((
+                      SELECT MAX(run_started_at) FROM source_runs
+                      WHERE source_id = runs.source_id AND status = ?
+                  ), '')
+                GROUP BY source_id
+            """,
+                (SourceRunStatus.ERROR.value, SourceRunStatus.SUCCESS.value),
+            )
+            return {
+                source_id: (failures, datetime.fromisoformat(last_failure))
+                for source_id, failures, last_failure in cursor.fetchall()
+            }
+
+    def get_refresh_history(self, limit: int = 10) -> dict[str, list[tuple[datetime, bool]]]:
+        """
+        Get each source's most recent successful runs.
+
+        Args:
+            limit: Maximum number of runs per source
+
+        Returns:
+            source_id -> [(run start time, whether the run added, updated or
+            removed anything)], newest first
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT source_id, run_started_at,
+                       events_added + events_updated + events_removed > 0
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY source_id ORDER BY run_started_at DESC
+                    ) AS recency
+                    FROM source_runs
+                    WHERE status = ?
+                )
+                WHERE recency <= ?
+                ORDER BY source_id, run_started_at DESC
+            """,
+                (SourceRunStatus.SUCCESS.value, limit),
+            )
+            history: dict[str, list[tuple[datetime, bool]]] = {}
+            for source_id, started, changed in cursor.fetchall():
+                history.setdefault(source_id, []).append(
+                    (datetime.fromisoformat(started), bool(changed))
+                )
+            return history
+
+    def get_run_durations(self, limit: int = 5) -> dict[str, float]:
+        """
+        Get the typical duration of each source's runs.
+
+        Args:
+            limit: Number of most recent successful runs per source to consider
+
+        Returns:
+            source_id -> median duration in seconds of those runs
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT source_id, duration_seconds
+                FROM (
+                    SELECT source_id, duration_seconds, ROW_NUMBER() OVER (
+                        PARTITION BY source_id ORDER BY run_started_at DESC
+                    ) AS recency
+                    FROM source_runs
+                    WHERE status = ? AND duration_seconds IS NOT NULL
+                )
+                WHERE recency <= ?
+            """,
+                (SourceRunStatus.SUCCESS.value, limit),
+            )
+            durations: dict[str, list[float]] = {}
+            for source_id, duration in cursor.fetchall():
+                durations.setdefault(source_id, []).append(duration)
+            return {
+                source_id: statistics.median(values)
+                for source_id, values in durations.items()
+            }
+
     # =========================================================================
     # HTTP Cache Operations
     # =========================================================================
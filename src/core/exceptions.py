@@ -31,6 +31,14 @@ class NetworkError(SourceError):
     pass
 
 
+class NotModifiedError(SourceError):
+    """Source content has not changed since the last successful run."""
+
+    def __init__(self, source_id: str, message: str, cache_status: str = "not_modified"):
+        self.cache_status = cache_status
+        super().__init__(source_id, message)
+
+
 class DatabaseError(GIDSeminarsError):
     """Database operation error."""
 
@@ -2,13 +2,18 @@
 """Filter to exclude specific events by URL or title pattern."""
 
 import re
+from collections import Counter
+from hashlib import sha256
 from pathlib import Path
-from typing import Any
+from typing import Iterable, Iterator
 
 import toml
 
-from .models import Seminar
-from .utils import console
+from .models import Seminar, SeminarRecord
+from .utils import console, normalize_url
+
+# Bumped whenever normalize_url changes, so stored verdicts are recomputed
+URL_KEY_VERSION = b"2"
 
 
 class ExclusionFilter:
@@ -21,14 +26,22 @@ class ExclusionFilter:
         Args:
             exclusions_path: Path to excluded_events.toml file
         """
-        self.excluded_urls: set[str] = set()
+        # Normalized URL -> reason
+        self.excluded_urls: dict[str, str] = {}
         self.excluded_patterns: list[tuple[re.Pattern, str]] = []
+        # All title patterns as one alternation; group rule_N is pattern N
+        self._title_pattern: re.Pattern | None = None
 
+        # Hash of the exclusions file and URL key format, so stored verdicts
+        # are only recomputed when the rules change
+        content = b""
         if exclusions_path and exclusions_path.exists():
+            content = exclusions_path.read_bytes()
             self._load_exclusions(exclusions_path)
+        self.rules_hash = sha256(URL_KEY_VERSION + content).hexdigest()[:16]
 
     def _load_exclusions(self, path: Path) -> None:
-        """Load exclusions from TOML file."""
+        """Load exclusions from TOML file and compile them."""
         try:
             config = toml.load(path)
 
@@ -36,9 +49,9 @@ class ExclusionFilter:
             for entry in config.get("exclude_url", []):
                 url = entry.get("url")
                 if url:
-                    self.excluded_urls.add(url)
-                    reason = entry.get("reason", "No reason given")
-                    console.print(f"  [dim]Excluding URL: {url[:50]}... ({reason})[/dim]")
+                    self.excluded_urls[normalize_url(url)] = entry.get(
+                        "reason", "No reason given"
+                    )
 
             # Load title pattern exclusions
             for entry in config.get("exclude_title", []):
@@ -48,18 +61,45 @@ class ExclusionFilter:
                         pattern = re.compile(pattern_str, re.IGNORECASE)
                         reason = entry.get("reason", "No reason given")
                         self.excluded_patterns.append((pattern, reason))
-                        console.print(f"  [dim]Excluding pattern: {pattern_str} ({reason})[/dim]")
                     except re.error as e:
                         console.print(f"  [yellow]Invalid regex pattern '{pattern_str}': {e}[/yellow]")
 
+            self._title_pattern = self._compile_title_pattern()
+
             total = len(self.excluded_urls) + len(self.excluded_patterns)
             if total > 0:
-                console.print(f"  [dim]Loaded {total} exclusion rule(s)[/dim]")
+                console.print(
+                    f"  [dim]Loaded {total} exclusion rule(s): "
+                    f"{len(self.excluded_urls)} URL, {len(self.excluded_patterns)} title[/dim]"
+                )
 
         except Exception as e:
             console.print(f"[yellow]Failed to load exclusions: {e}[/yellow]")
 
-    def is_excluded(self, seminar: Seminar) -> tuple[bool, str | None]:
+    def _compile_title_pattern(self) -> re.Pattern | None:
+        """
+        Combine the title patterns into one regex with a named group per rule.
+
+        Returns None when there are no patterns, or when they can't be combined
+        (e.g. duplicate group names or numbered backreferences), in which case
+        is_excluded() checks the patterns one at a time.
+        """
+        if not self.excluded_patterns:
+            return None
+        combined = "|".join(
+            f"(?P<rule_{index}>{pattern.pattern})"
+            for index, (pattern, _) in enumerate(self.excluded_patterns)
+        )
+        try:
+            compiled = re.compile(combined, re.IGNORECASE)
+        except re.error:
+            return None
+        if compiled.groups != len(self.excluded_patterns):
+            # A rule has groups of its own, so lastindex can't identify it
+            return None
+        return compiled
+
+    def is_excluded(self, seminar: Seminar | SeminarRecord) -> tuple[bool, str | None]:
         """
         Check if a seminar should be excluded.
 
@@ -70,17 +110,27 @@ class ExclusionFilter:
             Tuple of (is_excluded, reason)
         """
         # Check URL exclusion
-        if seminar.url and seminar.url in self.excluded_urls:
-            return True, "URL in exclusion list"
+        if seminar.url and self.excluded_urls:
+            reason = self.excluded_urls.get(normalize_url(seminar.url))
+            if reason is not None:
+                return True, f"URL in exclusion list: {reason}"
 
         # Check title patterns
-        for pattern, reason in self.excluded_patterns:
-            if pattern.search(seminar.title):
+        if self._title_pattern is not None:
+            match = self._title_pattern.search(seminar.title)
+            if match:
+                reason = self.excluded_patterns[match.lastindex - 1][1]
                 return True, f"Title matches pattern: {reason}"
+        else:
+            for pattern, reason in self.excluded_patterns:
+                if pattern.search(seminar.title):
+                    return True, f"Title matches pattern: {reason}"
 
         return False, None
 
-    def filter_seminars(self, seminars: list[Seminar]) -> list[Seminar]:
+    def filter_seminars(
+        self, seminars: list[Seminar | SeminarRecord]
+    ) -> list[Seminar | SeminarRecord]:
         """
         Filter out excluded seminars.
 
@@ -94,17 +144,41 @@ class ExclusionFilter:
             return seminars
 
         filtered = []
-        excluded_count = 0
+        reasons: Counter[str] = Counter()
 
         for seminar in seminars:
             is_excluded, reason = self.is_excluded(seminar)
             if is_excluded:
-                excluded_count += 1
-                console.print(f"  [dim]Excluded: {seminar.title[:50]}... - {reason}[/dim]")
+                reasons[reason] += 1
             else:
                 filtered.append(seminar)
 
-        if excluded_count > 0:
-            console.print(f"  [dim]Filtered out {excluded_count} excluded event(s)[/dim]")
-
+        self.print_summary(reasons)
         return filtered
+
+    @staticmethod
+    def print_summary(reasons: Counter[str]) -> None:
+        """Print one line per exclusion reason instead of one per event."""
+        total = sum(reasons.values())
+        if total == 0:
+            return
+        console.print(f"  [dim]Filtered out {total} excluded event(s)[/dim]")
+        for reason, count in reasons.most_common():
+            console.print(f"    [dim]{count} x {reason}[/dim]")
+
+    def iter_filtered(
+        self, seminars: Iterable[Seminar | SeminarRecord]
+    ) -> Iterator[Seminar | SeminarRecord]:
+        """
+        Lazily yield the seminars that are not excluded, without reporting them.
+
+        Args:
+            seminars: Seminars to filter, consumed one at a time
+        """
+        if not self.excluded_urls and not self.excluded_patterns:
+            yield from seminars
+            return
+
+        for seminar in seminars:
+            if not self.is_excluded(seminar)[0]:
+                yield seminar
@@ -0,0 +1,155 @@
+# GID Seminars - Shared HTTP Transport
+"""Process-wide pooled HTTP session shared by all sources and the uploader."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Default pool sizes: number of hosts kept pooled, connections kept per host
+DEFAULT_POOL_CONNECTIONS = 20
+DEFAULT_POOL_MAXSIZE = 4
+
+# Status codes worth retrying; any other 4xx fails straight away
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Status codes whose Retry-After header says when to try again
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+_session: requests.Session | None = None
+_rate_limiters: dict[str, "RateLimiter"] = {}
+_lock = threading.Lock()
+
+
+def get_session(http_config: dict[str, Any] | None = None) -> requests.Session:
+    """
+    Return the shared HTTP session, creating it on first use.
+
+    Connections are pooled per host and kept alive, so sources fetching
+    from the same server reuse TCP and TLS sessions. The pool sizes come
+    from the [http] config passed on the first call; later calls get the
+    existing session whatever they pass.
+
+    The session carries no default headers or auth. Callers send their own
+    per request so that one caller never changes what another sends.
+
+    Args:
+        http_config: [http] settings (pool_connections, pool_maxsize)
+
+    Returns:
+        The process-wide requests.Session
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            http_config = http_config or {}
+            adapter = HTTPAdapter(
+                pool_connections=http_config.get("pool_connections", DEFAULT_POOL_CONNECTIONS),
+                pool_maxsize=http_config.get("pool_maxsize", DEFAULT_POOL_MAXSIZE),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session's pooled connections, if it was created."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second, in bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until one is available.
+
+        The token is reserved under the lock and the wait happens outside
+        it, so concurrent callers queue up one interval apart.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def limit_to(self, rate: float, burst: int = 1) -> None:
+        """Lower the rate and burst to at most the given values."""
+        with self._lock:
+            self.rate = min(self.rate, rate)
+            self.burst = max(1, min(self.burst, burst))
+            self._tokens = min(self._tokens, self.burst)
+
+
+def get_rate_limiter(host: str | None, rate: float, burst: int = 1) -> RateLimiter | None:
+    """
+    Return the shared rate limiter for a host.
+
+    All sources fetching from a host share its bucket. When sources ask for
+    different limits, the slowest rate and smallest burst win.
+
+    Args:
+        host: Hostname the requests go to
+        rate: Requests per second; 0 or less disables limiting
+        burst: Requests allowed back to back before the rate applies
+
+    Returns:
+        The host's RateLimiter, or None when limiting is disabled
+    """
+    if not host or rate <= 0:
+        return None
+    with _lock:
+        limiter = _rate_limiters.get(host)
+        if limiter is None:
+            limiter = _rate_limiters[host] = RateLimiter(rate, burst)
+        else:
+            limiter.limit_to(rate, burst)
+        return limiter
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header into seconds from now.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -1,10 +1,12 @@
 # GID Seminars - Keyword Filter
 """Filter seminars based on keyword matching."""
 
+import json
 import re
+from hashlib import sha256
 from typing import Any
 
-from src.core.models import Seminar
+from src.core.models import FilterVerdict, Seminar
 
 
 class KeywordFilter:
@@ -23,16 +25,72 @@ class KeywordFilter:
         self.exclude_categories = [
             cat.lower() for cat in config.get("exclude_categories", [])
         ]
+        # Let sources drop non-matching entries before building Seminar models
+        self.prefilter = config.get("prefilter", False)
+
+        # Identifies the keyword lists that stored verdicts were computed with
+        self.config_hash = sha256(
+            json.dumps([self.keywords, self.exclude_keywords]).encode()
+        ).hexdigest()[:16]
+
+        # Every keyword goes into one case-insensitive alternation so each text
+        # is scanned once. Keywords ending in "*" are stems ("parasit*" matches
+        # "parasitic"); the rest keep whole-word \b...\b semantics. The scan
+        # is a lookahead so hits starting inside an earlier hit are still seen,
+        # and exclude alternatives come first so they win at the same position.
+        self._lookup: dict[tuple[str, str], str] = {}
+        alternatives = []
+        for kind, keywords in (
+            ("exclude", self.exclude_keywords),
+            ("include", self.keywords),
+        ):
+            words, stems = [], []
+            for keyword in keywords:
+                term = keyword.rstrip("*")
+                if not term:
+                    continue
+                (stems if keyword.endswith("*") else words).append(term)
+                self._lookup.setdefault((kind, term.lower()), keyword)
+            if words:
+                alternatives.append(rf"(?P<{kind}>{self._alternation(words)})\b")
+            if stems:
+                alternatives.append(rf"(?P<{kind}_stem>{self._alternation(stems)})")
+
+        self._pattern = (
+            re.compile(rf"\b(?=(?:{'|'.join(alternatives)}))", re.IGNORECASE)
+            if alternatives
+            else None
+        )
+
+    @staticmethod
+    def _alternation(terms: list[str]) -> str:
+        """Build a regex alternation, longest terms first."""
+        ordered = sorted(set(terms), key=lambda t: (-len(t), t))
+        return "|".join(re.escape(term) for term in ordered)
+
+    def find_keywords(self, text: str) -> tuple[list[str], list[str]]:
+        """
+        Scan text once and report which keywords it contains.
 
-        # Compile regex patterns for efficient matching (case-insensitive, word boundaries)
-        self.include_patterns = [
-            re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE)
-            for kw in self.keywords
-        ]
-        self.exclude_patterns = [
-            re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE)
-            for kw in self.exclude_keywords
-        ]
+        Args:
+            text: Text to search
+
+        Returns:
+            Tuple of (matched include keywords, matched exclude keywords),
+            each in order of first appearance without duplicates
+        """
+        included: dict[str, None] = {}
+        excluded: dict[str, None] = {}
+        if self._pattern is None:
+            return [], []
+
+        for match in self._pattern.finditer(text):
+            group = match.lastgroup
+            kind = group.removesuffix("_stem")
+            keyword = self._lookup[(kind, match.group(group).lower())]
+            (excluded if kind == "exclude" else included)[keyword] = None
+
+        return list(included), list(excluded)
 
     def is_excluded_category(self, seminar: Seminar) -> bool:
         """
@@ -67,25 +125,55 @@ class KeywordFilter:
         if self.is_excluded_category(seminar):
             return False
 
-        # Combine searchable text
-        text = f"{seminar.title} {seminar.description or ''}"
+        return self.evaluate(seminar).matched
 
-        # Check exclusion first (faster rejection)
-        for pattern in self.exclude_patterns:
-            if pattern.search(text):
-                return False
+    def evaluate(self, seminar: Seminar) -> FilterVerdict:
+        """
+        Match a seminar's title and description against the keyword lists.
 
-        # Check inclusion
-        for pattern in self.include_patterns:
-            if pattern.search(text):
-                return True
+        Category exclusions are not part of the verdict, since categories are
+        not covered by the seminar checksum.
 
-        return False
+        Args:
+            seminar: The seminar to check
+
+        Returns:
+            Verdict with the matched include keywords
+        """
+        included, excluded = self.find_keywords(
+            f"{seminar.title} {seminar.description or ''}"
+        )
+        return FilterVerdict(
+            checksum=seminar.checksum,
+            config_hash=self.config_hash,
+            matched=bool(included) and not excluded,
+            keywords=included,
+        )
+
+    def matches_text(self, title: str, description: str | None) -> bool:
+        """
+        Check raw entry text against the keyword lists before a Seminar exists.
+
+        Gives the same keyword result as evaluate() for a seminar built from
+        this title and description; category exclusions are not checked.
+
+        Args:
+            title: Entry title, before Seminar's whitespace cleanup
+            description: Entry description as it would be stored
+
+        Returns:
+            True if the text matches the keyword criteria
+        """
+        included, excluded = self.find_keywords(
+            f"{' '.join(title.split())} {description or ''}"
+        )
+        return bool(included) and not excluded
 
     def filter_seminars(
         self,
         seminars: list[Seminar],
         require_keywords: bool = True,
+        verdicts: dict[str, FilterVerdict] | None = None,
     ) -> tuple[list[Seminar], int]:
         """
         Filter a list of seminars based on keywords and category exclusions.
@@ -94,6 +182,9 @@ class KeywordFilter:
             seminars: List of seminars to filter
             require_keywords: If True, filter by keywords. If False, only apply
                             category exclusions.
+            verdicts: Optional stored verdicts by seminar ID. A verdict is
+                     reused when its checksum and config hash still match;
+                     otherwise the seminar is evaluated and its entry replaced.
 
         Returns:
             Tuple of (filtered_seminars, excluded_count)
@@ -109,7 +200,18 @@ class KeywordFilter:
 
             # If keyword filtering required, check keywords
             if require_keywords:
-                if self.matches(seminar):
+                if verdicts is None:
+                    verdict = self.evaluate(seminar)
+                else:
+                    verdict = verdicts.get(seminar.id)
+                    if (
+                        verdict is None
+                        or verdict.checksum != seminar.checksum
+                        or verdict.config_hash != self.config_hash
+                    ):
+                        verdict = self.evaluate(seminar)
+                        verdicts[seminar.id] = verdict
+                if verdict.matched:
                     filtered.append(seminar)
                 else:
                     excluded += 1
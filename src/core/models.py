@@ -1,6 +1,7 @@
 # GID Seminars - Data Models
 """Pydantic models for seminars and source runs."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from hashlib import sha256
@@ -8,6 +9,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from .utils import to_local_naive, to_utc_epoch
+
 
 class AccessRestriction(str, Enum):
     """Access restriction levels for seminars."""
@@ -51,6 +54,18 @@ class Seminar(BaseModel):
         """Clean up title whitespace."""
         return " ".join(v.split())
 
+    @property
+    def start_epoch(self) -> int:
+        """Start time as UTC epoch seconds."""
+        return to_utc_epoch(self.start_datetime, self.timezone)
+
+    @property
+    def end_epoch(self) -> int | None:
+        """End time as UTC epoch seconds, if known."""
+        if not self.end_datetime:
+            return None
+        return to_utc_epoch(self.end_datetime, self.timezone)
+
     def compute_id(self) -> str:
         """Compute unique ID from source, URL/title, and start time."""
         # Use URL if available, otherwise use title
@@ -64,13 +79,71 @@ class Seminar(BaseModel):
         return sha256(content.encode()).hexdigest()[:16]
 
     def model_post_init(self, __context: Any) -> None:
-        """Auto-compute ID and checksum after initialization."""
+        """
+        Localize start/end times, then auto-compute ID and checksum.
+
+        Aware times are stored as wall-clock time in the seminar's timezone.
+        This runs before hashing (pydantic calls model_post_init before any
+        "after" validator), so an aware time and the equivalent naive local
+        time give the same ID and checksum.
+        """
+        self.start_datetime = to_local_naive(self.start_datetime, self.timezone)
+        if self.end_datetime:
+            self.end_datetime = to_local_naive(self.end_datetime, self.timezone)
         if self.id is None:
             self.id = self.compute_id()
         if self.checksum is None:
             self.checksum = self.compute_checksum()
 
 
+@dataclass(frozen=True, slots=True)
+class SeminarRecord:
+    """
+    Lightweight read-only seminar loaded from our own database.
+
+    Has the same attribute names as Seminar but skips pydantic validation and
+    id/checksum hashing, since stored rows were validated when written.
+    Columns that were not selected for the read stay None.
+    """
+
+    id: str
+    source_id: str | None = None
+    title: str | None = None
+    description: str | None = None
+    url: str | None = None
+    start_datetime: datetime | None = None
+    end_datetime: datetime | None = None
+    start_epoch: int | None = None
+    end_epoch: int | None = None
+    timezone: str | None = None
+    location: str | None = None
+    organizer: str | None = None
+    category: str | None = None
+    tags: list[str] = field(default_factory=list)
+    access_restriction: str | None = None
+    registration_url: str | None = None
+    recording_url: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    checksum: str | None = None
+    raw_data: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FilterVerdict:
+    """
+    Stored keyword-filter result for one seminar.
+
+    Valid while the seminar's checksum and the filter's config_hash are
+    unchanged, so unchanged items are not re-matched on every run.
+    """
+
+    checksum: str | None
+    config_hash: str
+    matched: bool
+    keywords: list[str] = field(default_factory=list)
+
+
 class SourceRunStatus(str, Enum):
     """Status of a source collection run."""
 
@@ -95,6 +168,8 @@ class SourceRun(BaseModel):
     etag: str | None = None
     last_modified: str | None = None
     content_hash: str | None = None
+    cache_status: str | None = None
+    filter_hash: str | None = None
     error_message: str | None = None
     duration_seconds: float | None = None
 
@@ -2,9 +2,14 @@
 """Shared utility functions and constants used across the codebase."""
 
 import re
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from html import unescape
 from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
+import pytz
 from rich.console import Console
 
 # Shared console instance - use this instead of creating new Console() in each file
@@ -28,6 +33,9 @@ DEFAULT_DAYS_AHEAD = 30
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 2
+DEFAULT_RATE_LIMIT = 2.0  # Requests per second per host (0 = unlimited)
+DEFAULT_RATE_LIMIT_BURST = 4
+DEFAULT_MAX_RETRY_AFTER = 60  # Longest Retry-After (seconds) worth waiting for
 
 
 # =============================================================================
@@ -65,6 +73,167 @@ DATETIME_FORMATS = [
 ]
 
 
+# Date and time formats tried by parse_date_time_parts
+DATE_PART_FORMATS = [
+    "%B %d, %Y",
+    "%B %d %Y",
+    "%b %d, %Y",
+    "%b %d %Y",
+    "%m/%d/%Y",
+    "%b %d",
+]
+TIME_PART_FORMATS = ["%I:%M%p", "%I%p", "%I:%M %p", "%I %p", "%H:%M"]
+
+# Sample values used to work out the shape of each strptime directive
+_DIRECTIVE_SAMPLES = {
+    "%Y": "2000", "%m": "01", "%d": "01", "%H": "00", "%I": "01", "%M": "00",
+    "%S": "00", "%p": "AM", "%B": "January", "%b": "Jan", "%a": "Mon", "%z": "+0000",
+}
+_DIRECTIVE_PATTERN = re.compile("|".join(_DIRECTIVE_SAMPLES))
+_SHAPE_PATTERN = re.compile(r"(\d+)|([^\W\d_]+)|(\s+)")
+
+
+def _shape_token(match: re.Match) -> str:
+    if match.group(1):
+        return "9"
+    if match.group(2):
+        # Short runs are abbreviations (Jan, Mon, PM, T), long ones full names
+        return "a" if len(match.group(2)) <= 3 else "A"
+    return " "
+
+
+def datetime_shape(value: str) -> str:
+    """
+    Reduce a datetime string to its shape, e.g. "Jan 14, 2025" -> "a 9, 9".
+
+    Digit runs become "9", letter runs "a" (up to 3 letters) or "A", and
+    whitespace runs a single space; punctuation is kept.
+    """
+    return _SHAPE_PATTERN.sub(_shape_token, value)
+
+
+@lru_cache(maxsize=None)
+def _formats_by_shape(formats: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Group strptime formats by the shape of the strings they accept."""
+    grouped: dict[str, list[str]] = {}
+    for fmt in formats:
+        sample = _DIRECTIVE_PATTERN.sub(lambda m: _DIRECTIVE_SAMPLES[m.group(0)], fmt)
+        grouped.setdefault(datetime_shape(sample), []).append(fmt)
+    return {shape: tuple(fmts) for shape, fmts in grouped.items()}
+
+
+class DateTimeParser:
+    """
+    strptime-based parser that picks formats by the input's shape.
+
+    Formats whose shape matches the input are tried first, and the format
+    that worked for each shape is remembered, so repeated strings from one
+    source usually parse with a single strptime call. Every format is still
+    tried before giving up, so results match trying the formats in order
+    whenever only one format fits. Give each source its own parser so it
+    learns that source's formats.
+    """
+
+    def __init__(self, formats: list[str] | None = None):
+        self.formats = tuple(formats or DATETIME_FORMATS)
+        # (format list, shape) -> format that last parsed that shape
+        self._learned: dict[tuple[tuple[str, ...], str], str] = {}
+        # Format list -> format that last worked for any shape
+        self._last: dict[tuple[str, ...], str] = {}
+
+    def parse(self, dt_str: str, formats: list[str] | None = None) -> datetime | None:
+        """
+        Parse a datetime string using the parser's formats.
+
+        Args:
+            dt_str: The datetime string to parse
+            formats: Optional format list to use instead of the parser's own
+
+        Returns:
+            Parsed datetime or None if parsing fails
+        """
+        if not dt_str:
+            return None
+        return self._match(dt_str.strip(), tuple(formats) if formats else self.formats)[0]
+
+    def parse_parts(self, date_str: str, time_str: str) -> datetime | None:
+        """
+        Parse separate date and time strings into a datetime.
+
+        Dates without a year get the current year, or next year if that is
+        more than 30 days in the past. Unparseable times default to noon.
+
+        Args:
+            date_str: Date string (e.g., "January 15, 2025" or "1/15/2025")
+            time_str: Time string (e.g., "2:00 PM" or "14:00")
+
+        Returns:
+            Combined datetime or None if the date can't be parsed
+        """
+        parsed_date, date_format = self._match(date_str.strip(), tuple(DATE_PART_FORMATS))
+        if not parsed_date:
+            return None
+
+        if "%Y" not in date_format:
+            now = datetime.utcnow()
+            parsed_date = parsed_date.replace(year=now.year)
+            if parsed_date < now - timedelta(days=30):
+                parsed_date = parsed_date.replace(year=now.year + 1)
+
+        parsed_time, _ = self._match(time_str.upper().replace(" ", ""), tuple(TIME_PART_FORMATS))
+        if parsed_time:
+            return parsed_date.replace(hour=parsed_time.hour, minute=parsed_time.minute)
+
+        # Return date with noon as default time
+        return parsed_date.replace(hour=12, minute=0)
+
+    def _match(
+        self, value: str, formats: tuple[str, ...]
+    ) -> tuple[datetime | None, str | None]:
+        """
+        Try the learned format, then shape matches, then everything else.
+
+        Returns:
+            Tuple of (parsed datetime, format used), or (None, None)
+        """
+        shape = datetime_shape(value)
+        if "9" not in shape:
+            # Every format has numeric fields
+            return None, None
+
+        learned = self._learned.get((formats, shape))
+        if learned:
+            try:
+                return datetime.strptime(value, learned), learned
+            except ValueError:
+                pass
+
+        candidates = []
+        sniffed = _formats_by_shape(formats).get(shape, ())
+        last = self._last.get(formats)
+        if last in sniffed:
+            candidates.append(last)
+        candidates.extend(sniffed)
+        candidates.extend(formats)
+
+        for fmt in dict.fromkeys(candidates):
+            if fmt == learned:
+                continue
+            try:
+                parsed = datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+            self._learned[(formats, shape)] = fmt
+            self._last[formats] = fmt
+            return parsed, fmt
+
+        return None, None
+
+
+# Shared parser for callers without a parser of their own
+_default_parser = DateTimeParser()
+
+
 def parse_datetime(dt_str: str, formats: list[str] | None = None) -> datetime | None:
     """
     Parse a datetime string using multiple format patterns.
@@ -76,19 +245,7 @@ def parse_datetime(dt_str: str, formats: list[str] | None = None) -> datetime |
     Returns:
         Parsed datetime or None if parsing fails
     """
-    if not dt_str:
-        return None
-
-    dt_str = dt_str.strip()
-    formats = formats or DATETIME_FORMATS
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(dt_str, fmt)
-        except ValueError:
-            continue
-
-    return None
+    return _default_parser.parse(dt_str, formats)
 
 
 def parse_date_time_parts(date_str: str, time_str: str) -> datetime | None:
@@ -102,43 +259,259 @@ def parse_date_time_parts(date_str: str, time_str: str) -> datetime | None:
     Returns:
         Combined datetime or None if parsing fails
     """
-    time_str = time_str.upper().replace(" ", "")
-
-    date_formats = [
-        "%B %d, %Y",
-        "%B %d %Y",
-        "%b %d, %Y",
-        "%b %d %Y",
-        "%m/%d/%Y",
-        "%b %d",
-    ]
-
-    parsed_date = None
-    for fmt in date_formats:
-        try:
-            parsed_date = datetime.strptime(date_str.strip(), fmt)
-            if "%Y" not in fmt:
-                now = datetime.utcnow()
-                parsed_date = parsed_date.replace(year=now.year)
-                if parsed_date < now - timedelta(days=30):
-                    parsed_date = parsed_date.replace(year=now.year + 1)
-            break
-        except ValueError:
-            continue
+    return _default_parser.parse_parts(date_str, time_str)
+
+
+def to_local_naive(dt: datetime, tz_name: str) -> datetime:
+    """
+    Express a datetime as naive wall-clock time in the given timezone.
 
-    if not parsed_date:
+    Naive values are assumed to already be wall-clock time in tz_name and are
+    returned unchanged.
+    """
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(pytz.timezone(tz_name)).replace(tzinfo=None)
+
+
+def to_utc_epoch(dt: datetime, tz_name: str = "UTC") -> int:
+    """
+    Convert a datetime to UTC epoch seconds.
+
+    Args:
+        dt: Aware datetime, or naive wall-clock time in tz_name
+        tz_name: IANA timezone name used to localize naive values
+
+    Returns:
+        Seconds since 1970-01-01T00:00:00Z
+    """
+    if dt.tzinfo is None:
+        dt = pytz.timezone(tz_name).localize(dt)
+    return int(dt.timestamp())
+
+
+# =============================================================================
+# Free-Text Date/Time Extraction
+# =============================================================================
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|"
+    r"aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?(?![a-z])"
+)
+_WEEKDAY = r"(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s*"
+_YEAR = r"(?:19|20)\d{2}(?!\d)"
+_MERIDIEM = r"[ap]\.?m\b\.?"
+_CLOCK = rf"\d{{1,2}}(?::\d{{2}}){{0,2}}\s*(?:{_MERIDIEM})?"
+_RANGE_SEPARATOR = r"\s*(?:-|–|—|to)\s*"
+# Numbers must start a word, so "H5N1 may" and "COVID19 Jan 2" hold no dates
+_NUMBER_START = r"(?<!\w)"
+
+# One alternation so a text block is scanned once; at each position the
+# first alternative that matches wins
+DATETIME_MENTION_PATTERN = re.compile(
+    "|".join([
+        # "2:00 PM - 3:30 PM", "2-3 pm", "14:00-15:30"
+        rf"{_NUMBER_START}(?P<range_start>{_CLOCK}){_RANGE_SEPARATOR}"
+        rf"(?P<range_end>\d{{1,2}}(?::\d{{2}}){{0,2}}\s*{_MERIDIEM}|\d{{1,2}}:\d{{2}})",
+        # "28 January 2026", "28-30 January 2026", "12 Jan"
+        rf"{_NUMBER_START}(?P<dm_day>\d{{1,2}})(?:[-–]\d{{1,2}})?\s*(?P<dm_month>{_MONTH}),?"
+        rf"(?:\s+(?P<dm_year>{_YEAR}))?",
+        # "1/14/2025"
+        rf"{_NUMBER_START}(?P<us_month>\d{{1,2}})/(?P<us_day>\d{{1,2}})/(?P<us_year>{_YEAR})",
+        # "2025-01-14"
+        rf"{_NUMBER_START}(?P<iso_year>{_YEAR})-(?P<iso_month>\d{{2}})-(?P<iso_day>\d{{2}})",
+        # "2:00 PM", "9am", "14:00"
+        rf"{_NUMBER_START}(?P<clock>\d{{1,2}}(?::\d{{2}}){{1,2}}(?:\s*{_MERIDIEM})?|\d{{1,2}}\s*{_MERIDIEM})",
+        r"(?P<noon>\bnoon\b)",
+        # "Tuesday, January 20, 2026", "Jan 15th", "March 3 2025"
+        rf"\b(?:{_WEEKDAY})?(?P<md_month>{_MONTH})\s*(?P<md_day>\d{{1,2}})(?:st|nd|rd|th)?\b"
+        rf"(?:\s*,?\s*(?P<md_year>{_YEAR}))?",
+        # Upper-case zone abbreviations only, so "et al." isn't a timezone
+        r"(?-i:\b(?P<zone>[ECMP][SD]?T|GMT|UTC|CES?T|BST)\b)",
+    ]),
+    re.IGNORECASE,
+)
+_CLOCK_PATTERN = re.compile(rf"(\d{{1,2}})(?::(\d{{2}}))?(?::\d{{2}})?\s*({_MERIDIEM})?", re.IGNORECASE)
+
+TIME_KINDS = ("time", "time_range")
+
+
+@dataclass(frozen=True, slots=True)
+class DateTimeMention:
+    """
+    A date, time, time range or timezone found in free text.
+
+    kind is "date", "time", "time_range" or "timezone"; start/end are
+    offsets into the searched text. Dates without a year have year None.
+    A time range's end is in end_hour/end_minute.
+    """
+
+    kind: str
+    start: int
+    end: int
+    text: str
+    year: int | None = None
+    month: int | None = None
+    day: int | None = None
+    hour: int | None = None
+    minute: int | None = None
+    end_hour: int | None = None
+    end_minute: int | None = None
+    timezone: str | None = None
+
+
+def _parse_clock(text: str, meridiem: str | None = None) -> tuple[int, int, str | None] | None:
+    """Parse "2:30 pm" / "14:00" / "9am" into (hour, minute, meridiem)."""
+    match = _CLOCK_PATTERN.fullmatch(text.strip())
+    if not match:
         return None
+    hour, minute = int(match.group(1)), int(match.group(2) or 0)
+    meridiem = (match.group(3) or meridiem or "").lower()[:1] or None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem == "p" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    return hour, minute, meridiem
+
+
+def _mention_from_match(match: re.Match) -> DateTimeMention | None:
+    """Build a mention from whichever alternative of the pattern matched."""
+    groups = match.groupdict()
+    base = {"start": match.start(), "end": match.end(), "text": match.group(0)}
+
+    if groups["range_start"] is not None:
+        end = _parse_clock(groups["range_end"])
+        start = _parse_clock(groups["range_start"], end[2] if end else None)
+        if not start or not end:
+            return None
+        return DateTimeMention(
+            "time_range", hour=start[0], minute=start[1],
+            end_hour=end[0], end_minute=end[1], **base,
+        )
+    if groups["clock"] is not None:
+        clock = _parse_clock(groups["clock"])
+        if not clock:
+            return None
+        return DateTimeMention("time", hour=clock[0], minute=clock[1], **base)
+    if groups["noon"] is not None:
+        return DateTimeMention("time", hour=12, minute=0, **base)
+    if groups["zone"] is not None:
+        return DateTimeMention("timezone", timezone=groups["zone"], **base)
+
+    for prefix in ("dm", "md", "us", "iso"):
+        month = groups[f"{prefix}_month"]
+        if month is None:
+            continue
+        year = groups[f"{prefix}_year"]
+        return DateTimeMention(
+            "date",
+            year=int(year) if year else None,
+            month=int(month) if month.isdigit() else _MONTHS[month[:3].lower()],
+            day=int(groups[f"{prefix}_day"]),
+            **base,
+        )
+    return None
 
-    time_formats = ["%I:%M%p", "%I%p", "%I:%M %p", "%I %p", "%H:%M"]
-    for fmt in time_formats:
-        try:
-            parsed_time = datetime.strptime(time_str, fmt)
-            return parsed_date.replace(hour=parsed_time.hour, minute=parsed_time.minute)
-        except ValueError:
+
+def extract_datetime_mentions(text: str) -> list[DateTimeMention]:
+    """
+    Find every date, time, time range and timezone in a block of text.
+
+    The text is scanned once with DATETIME_MENTION_PATTERN; mentions are
+    returned in order of position.
+
+    Args:
+        text: Free text to scan
+
+    Returns:
+        List of mentions with their positions
+    """
+    if not text:
+        return []
+    mentions = []
+    for match in DATETIME_MENTION_PATTERN.finditer(text):
+        mention = _mention_from_match(match)
+        if mention:
+            mentions.append(mention)
+    return mentions
+
+
+def nearest_mention(
+    mentions: list[DateTimeMention],
+    position: int,
+    kinds: tuple[str, ...] = TIME_KINDS,
+    max_distance: int | None = None,
+    forward_only: bool = False,
+) -> DateTimeMention | None:
+    """
+    Pick the mention of the given kinds closest to a position in the text.
+
+    Args:
+        mentions: Mentions from extract_datetime_mentions()
+        position: Offset to measure from, e.g. the end of a date mention
+        kinds: Mention kinds to consider
+        max_distance: Ignore mentions further away than this many characters
+        forward_only: Only consider mentions starting at or after position
+
+    Returns:
+        The nearest mention, or None
+    """
+    best = None
+    best_distance = None
+    for mention in mentions:
+        if mention.kind not in kinds:
+            continue
+        if mention.start >= position:
+            distance = mention.start - position
+        elif forward_only:
             continue
+        else:
+            distance = max(0, position - mention.end)
+        if max_distance is not None and distance > max_distance:
+            continue
+        if best_distance is None or distance < best_distance:
+            best, best_distance = mention, distance
+    return best
+
+
+def mention_to_datetime(
+    date: DateTimeMention,
+    time: DateTimeMention | None = None,
+    past_days: int = 30,
+    default_hour: int = 0,
+) -> datetime | None:
+    """
+    Combine a date mention and an optional time mention into a datetime.
 
-    # Return date with noon as default time
-    return parsed_date.replace(hour=12, minute=0)
+    Dates without a year get the current year, or next year if that is more
+    than past_days in the past. A time range contributes its start time.
+
+    Args:
+        date: A "date" mention
+        time: Optional "time" or "time_range" mention
+        past_days: How far back a year-less date may fall before rolling over
+        default_hour: Hour to use when there is no time mention
+
+    Returns:
+        Naive datetime, or None if the date is invalid (e.g. February 30)
+    """
+    hour, minute = (time.hour, time.minute) if time else (default_hour, 0)
+    try:
+        if date.year is not None:
+            return datetime(date.year, date.month, date.day, hour, minute)
+        now = datetime.utcnow()
+        result = datetime(now.year, date.month, date.day, hour, minute)
+        if result < now - timedelta(days=past_days):
+            result = result.replace(year=now.year + 1)
+        return result
+    except ValueError:
+        return None
 
 
 # =============================================================================
@@ -182,6 +555,38 @@ def extract_all_urls_from_text(text: str) -> list[str]:
     return URL_PATTERN.findall(text)
 
 
+# Query parameters that only track where a click came from (besides utm_*)
+TRACKING_QUERY_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid"})
+
+
+def normalize_url(url: str) -> str:
+    """
+    Reduce a URL to a comparison key.
+
+    The scheme (http vs https), host case, a leading "www.", default ports,
+    trailing slashes, the fragment and tracking parameters (utm_*, fbclid,
+    ...) are ignored. The remaining query parameters are kept, sorted, since
+    some sites identify events by them ("?event=123").
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Normalized "host/path" or "host/path?query" key
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").removeprefix("www.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    key = f"{host}{parts.path.rstrip('/')}"
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_QUERY_PARAMS
+    )
+    return f"{key}?{urlencode(query)}" if query else key
+
+
 # =============================================================================
 # String Utilities
 # =============================================================================
@@ -219,6 +624,98 @@ def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     return text[: max_length - len(suffix)] + suffix
 
 
+# Tags that start a new line of text, and tags whose content is never text.
+# Inline tags such as <b> or <a> join their text to the surrounding words;
+# any other tag separates words with a space.
+_HTML_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "table", "tr", "ul",
+})
+_HTML_INLINE_TAGS = frozenset({
+    "a", "abbr", "b", "cite", "code", "em", "font", "i", "mark", "q", "s",
+    "small", "span", "strong", "sub", "sup", "u",
+})
+_HTML_SKIP_TAGS = frozenset({"script", "style"})
+_HTML_TOKEN_PATTERN = re.compile(
+    r"<!--.*?(?:-->|\Z)"                        # comment
+    r"|<(/?)([a-zA-Z][\w:-]*)[^>]*>"             # start or end tag
+    r"|<[!?/][^>]*>"                             # doctype, CDATA, stray markup
+    r"|([^<]+|<)",                               # text
+    re.DOTALL,
+)
+
+
+def html_to_text(html: str, max_length: int | None = None) -> str:
+    """
+    Convert an HTML fragment to plain text.
+
+    The fragment is tokenized lazily, so conversion stops as soon as
+    max_length characters have been produced. Entities are decoded, runs of
+    whitespace collapse to one space, block-level tags start a new line and
+    script/style content is dropped.
+
+    Args:
+        html: HTML text (plain text passes through with whitespace collapsed)
+        max_length: Maximum length of the result, or None for no limit
+
+    Returns:
+        Plain text, at most max_length characters
+    """
+    if not html:
+        return ""
+
+    parts: list[str] = []
+    length = 0
+    separator = ""  # Pending separator before the next word: "", " " or "\n"
+    skip_until = None
+
+    for match in _HTML_TOKEN_PATTERN.finditer(html):
+        closing, tag, text = match.groups()
+
+        if skip_until:
+            if closing and tag.lower() == skip_until:
+                skip_until = None
+            continue
+
+        if tag:
+            tag = tag.lower()
+            if tag in _HTML_SKIP_TAGS and not closing:
+                skip_until = tag
+            if tag in _HTML_BLOCK_TAGS:
+                separator = "\n"
+            elif tag not in _HTML_INLINE_TAGS and not separator:
+                separator = " "
+            continue
+
+        if text is None:
+            continue
+
+        text = unescape(text)
+        words = text.split()
+        if not words:
+            if text and not separator:
+                separator = " "
+            continue
+
+        if parts and (separator or text[0].isspace()):
+            parts.append(separator or " ")
+            length += 1
+        chunk = " ".join(words)
+        parts.append(chunk)
+        length += len(chunk)
+        separator = " " if text[-1].isspace() else ""
+
+        if max_length is not None and length >= max_length:
+            break
+
+    result = "".join(parts)
+    if max_length is not None:
+        result = result[:max_length]
+    return result.rstrip()
+
+
 # =============================================================================
 # Config Loading Utilities
 # =============================================================================
@@ -6,11 +6,11 @@ import time
 from pathlib import Path
 from typing import Any
 
-import requests
 import toml
 from requests.auth import HTTPBasicAuth
 
 from src.core.exceptions import DeploymentError
+from src.core.http_client import get_session
 from src.core.utils import DEFAULT_MAX_RETRIES, DEFAULT_RETRY_DELAY, console
 
 # Load environment variables
@@ -48,9 +48,10 @@ class LabKeyWebDAVUploader:
         # CSRF token will be fetched when needed
         self.csrf_token: str | None = None
 
-        # Use a session to maintain cookies between requests
-        self.session = requests.Session()
-        self.session.auth = HTTPBasicAuth("apikey", self.api_key)
+        # The shared pooled session keeps cookies between requests; auth is
+        # sent per request so it never reaches the sources' requests
+        self.session = get_session()
+        self.auth = HTTPBasicAuth("apikey", self.api_key)
 
         # Retry settings
         self.max_retries = config.get("deployment", {}).get("max_retries", DEFAULT_MAX_RETRIES)
@@ -59,7 +60,7 @@ class LabKeyWebDAVUploader:
     def get_csrf_token(self, url: str) -> str | None:
         """Get CSRF token from LabKey server via OPTIONS request."""
         try:
-            response = self.session.options(url, timeout=10)
+            response = self.session.options(url, auth=self.auth, timeout=10)
 
             # Extract CSRF token from Set-Cookie header
             for cookie in response.headers.get("Set-Cookie", "").split(","):
@@ -115,6 +116,7 @@ class LabKeyWebDAVUploader:
                     webdav_url,
                     data=file_content,
                     headers=headers,
+                    auth=self.auth,
                     timeout=30,
                 )
 
@@ -4,9 +4,12 @@
 from .ics_generator import ICSGenerator
 from .html_generator import HTMLGenerator
 from .json_generator import JSONGenerator
+from .snapshot import RenderSnapshot, build_render_snapshot
 
 __all__ = [
     "ICSGenerator",
     "HTMLGenerator",
     "JSONGenerator",
+    "RenderSnapshot",
+    "build_render_snapshot",
 ]
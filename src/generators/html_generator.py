@@ -3,18 +3,14 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Sequence
 from urllib.parse import quote
 
 from src.core.database import SeminarDatabase
-from src.core.exclusion_filter import ExclusionFilter
-from src.core.models import Seminar
-from src.core.utils import (
-    DEFAULT_DAYS_AHEAD,
-    DEFAULT_DAYS_BEHIND,
-    MAX_DESCRIPTION_PREVIEW,
-    console,
-)
+from src.core.models import SeminarRecord
+from src.core.utils import MAX_DESCRIPTION_PREVIEW, console
+
+from .snapshot import RenderSnapshot, build_render_snapshot
 
 # Color constants for consistent styling
 COLORS = {
@@ -39,72 +35,60 @@ class HTMLGenerator:
         self,
         config: dict[str, Any],
         database: SeminarDatabase,
-        exclusion_filter: ExclusionFilter | None = None,
     ):
         self.config = config
         self.database = database
-        self.exclusion_filter = exclusion_filter
         self.time_window = config.get("time_window", {})
         self.calendar_config = config.get("calendar", {})
 
-    def generate(self, output_path: Path) -> tuple[Path, int]:
+    def generate(
+        self, output_path: Path, snapshot: RenderSnapshot | None = None
+    ) -> tuple[Path, int]:
         """
         Generate HTML page with Upcoming and Past sections.
 
+        Args:
+            output_path: File to write
+            snapshot: Pre-loaded seminars; loaded from the database if omitted
+
         Returns:
             Tuple of (output_path, event_count)
         """
         # Get seminars
-        days_behind = self.time_window.get("days_behind", DEFAULT_DAYS_BEHIND)
-        days_ahead = self.time_window.get("days_ahead", DEFAULT_DAYS_AHEAD)
-
-        seminars = self.database.get_seminars_in_window(
-            days_behind=days_behind,
-            days_ahead=days_ahead,
-        )
-
-        # Apply exclusion filter
-        if self.exclusion_filter:
-            seminars = self.exclusion_filter.filter_seminars(seminars)
-
-        # Split into upcoming and past
-        now = datetime.utcnow()
-        upcoming = [s for s in seminars if s.start_datetime >= now]
-        past = [s for s in seminars if s.start_datetime < now]
-
-        # Sort: upcoming by soonest first, past by most recent first
-        upcoming.sort(key=lambda s: s.start_datetime)
-        past.sort(key=lambda s: s.start_datetime, reverse=True)
-
-        # Get unique values for filters
-        sources = sorted(set(s.source_id for s in seminars))
-        categories = sorted(set(s.category for s in seminars if s.category))
-
-        # Build HTML
-        html_parts = [
-            self._get_html_header(),
-            self._generate_title_banner(len(upcoming), len(past)),
-            self._generate_filter_controls(sources, categories),
-            self._generate_quick_links(),
-            self._generate_upcoming_section(upcoming),
-            self._generate_past_section(past),
-            self._generate_footer(),
-            self._get_filter_script(),
-            self._get_html_footer(),
-        ]
-
-        html_content = "\n".join(html_parts)
+        if snapshot is None:
+            snapshot = build_render_snapshot(self.config, self.database)
 
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write file
+        # Write file, streaming the upcoming (soonest first) and past (most
+        # recent first) cards instead of building the whole page in memory
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-        console.print(f"  Generated HTML: {len(upcoming)} upcoming, {len(past)} past → {output_path.name}")
+            f.write("\n".join([
+                self._get_html_header(),
+                self._generate_title_banner(snapshot.upcoming_count, snapshot.past_count),
+                self._generate_filter_controls(snapshot.sources, snapshot.categories),
+                self._generate_quick_links(),
+            ]) + "\n")
+            f.writelines(
+                self._generate_upcoming_section(snapshot.iter_upcoming(), snapshot.upcoming_count)
+            )
+            f.write("\n")
+            f.writelines(
+                self._generate_past_section(snapshot.iter_past(), snapshot.past_count)
+            )
+            f.write("\n" + "\n".join([
+                self._generate_footer(),
+                self._get_filter_script(),
+                self._get_html_footer(),
+            ]))
+
+        console.print(
+            f"  Generated HTML: {snapshot.upcoming_count} upcoming, "
+            f"{snapshot.past_count} past → {output_path.name}"
+        )
 
-        return output_path, len(seminars)
+        return output_path, snapshot.count
 
     def _get_html_header(self) -> str:
         """Generate HTML header."""
@@ -248,7 +232,7 @@ class HTMLGenerator:
     </p>
 </div>"""
 
-    def _generate_filter_controls(self, sources: list[str], categories: list[str]) -> str:
+    def _generate_filter_controls(self, sources: Sequence[str], categories: Sequence[str]) -> str:
         """Generate filter dropdowns and search box."""
         source_options = '<option value="all">All Sources</option>\n'
         for source in sources:
@@ -329,45 +313,57 @@ class HTMLGenerator:
     </span>
 </div>"""
 
-    def _generate_upcoming_section(self, seminars: list[Seminar]) -> str:
-        """Generate collapsible upcoming seminars section."""
-        cards = "".join(self._generate_seminar_card(s, is_past=False) for s in seminars)
-
-        if not cards:
-            cards = f'<div class="no-results">No upcoming seminars in the next 30 days.</div>'
-
-        return f"""
+    def _generate_upcoming_section(
+        self, seminars: Iterable[SeminarRecord], count: int
+    ) -> Iterator[str]:
+        """Generate collapsible upcoming seminars section, one card at a time."""
+        yield f"""
 <div class="section-header" id="upcoming-header">
     <div style="display: flex; align-items: center; gap: 15px;">
         <h2 class="section-title" style="color: {COLORS['success']};">Upcoming Seminars</h2>
-        <span class="section-count" id="upcoming-count" style="background: {COLORS['success']};">{len(seminars)}</span>
+        <span class="section-count" id="upcoming-count" style="background: {COLORS['success']};">{count}</span>
     </div>
     <span class="section-toggle" id="upcoming-toggle">▼</span>
 </div>
 <div class="section-content" id="upcoming-content">
-    {cards}
-</div>"""
+    """
+        empty = True
+        for seminar in seminars:
+            empty = False
+            yield self._generate_seminar_card(seminar, is_past=False)
 
-    def _generate_past_section(self, seminars: list[Seminar]) -> str:
-        """Generate collapsible past seminars section."""
-        cards = "".join(self._generate_seminar_card(s, is_past=True) for s in seminars)
+        if empty:
+            yield f'<div class="no-results">No upcoming seminars in the next 30 days.</div>'
 
-        if not cards:
-            cards = f'<div class="no-results">No past seminars in the last 30 days.</div>'
+        yield """
+</div>"""
 
-        return f"""
+    def _generate_past_section(
+        self, seminars: Iterable[SeminarRecord], count: int
+    ) -> Iterator[str]:
+        """Generate collapsible past seminars section, one card at a time."""
+        yield f"""
 <div class="section-header" id="past-header">
     <div style="display: flex; align-items: center; gap: 15px;">
         <h2 class="section-title" style="color: {COLORS['secondary']};">Past Seminars (Recordings)</h2>
-        <span class="section-count" id="past-count" style="background: {COLORS['secondary']};">{len(seminars)}</span>
+        <span class="section-count" id="past-count" style="background: {COLORS['secondary']};">{count}</span>
     </div>
     <span class="section-toggle" id="past-toggle">▼</span>
 </div>
 <div class="section-content" id="past-content">
-    {cards}
+    """
+        empty = True
+        for seminar in seminars:
+            empty = False
+            yield self._generate_seminar_card(seminar, is_past=True)
+
+        if empty:
+            yield f'<div class="no-results">No past seminars in the last 30 days.</div>'
+
+        yield """
 </div>"""
 
-    def _generate_seminar_card(self, seminar: Seminar, is_past: bool) -> str:
+    def _generate_seminar_card(self, seminar: SeminarRecord, is_past: bool) -> str:
         """Generate a single seminar card."""
         now = datetime.utcnow()
         is_today = seminar.start_datetime.date() == now.date()
@@ -9,9 +9,10 @@ import pytz
 from icalendar import Alarm, Calendar, Event
 
 from src.core.database import SeminarDatabase
-from src.core.exclusion_filter import ExclusionFilter
-from src.core.models import Seminar
-from src.core.utils import DEFAULT_DAYS_AHEAD, DEFAULT_DAYS_BEHIND, console
+from src.core.models import SeminarRecord
+from src.core.utils import console
+
+from .snapshot import RenderSnapshot, build_render_snapshot
 
 
 class ICSGenerator:
@@ -21,18 +22,22 @@ class ICSGenerator:
         self,
         config: dict[str, Any],
         database: SeminarDatabase,
-        exclusion_filter: ExclusionFilter | None = None,
     ):
         self.config = config
         self.database = database
-        self.exclusion_filter = exclusion_filter
         self.calendar_config = config.get("calendar", {})
         self.time_window = config.get("time_window", {})
 
-    def generate(self, output_path: Path) -> tuple[Path, int]:
+    def generate(
+        self, output_path: Path, snapshot: RenderSnapshot | None = None
+    ) -> tuple[Path, int]:
         """
         Generate .ics file with seminars in time window.
 
+        Args:
+            output_path: File to write
+            snapshot: Pre-loaded seminars; loaded from the database if omitted
+
         Returns:
             Tuple of (output_path, event_count)
         """
@@ -55,43 +60,36 @@ class ICSGenerator:
         )
 
         # Get seminars in time window
-        days_behind = self.time_window.get("days_behind", DEFAULT_DAYS_BEHIND)
-        days_ahead = self.time_window.get("days_ahead", DEFAULT_DAYS_AHEAD)
-
-        seminars = self.database.get_seminars_in_window(
-            days_behind=days_behind,
-            days_ahead=days_ahead,
-        )
-
-        # Apply exclusion filter
-        if self.exclusion_filter:
-            seminars = self.exclusion_filter.filter_seminars(seminars)
-
-        # Add events
-        for seminar in seminars:
-            event = self._create_event(seminar)
-            cal.add_component(event)
+        if snapshot is None:
+            snapshot = build_render_snapshot(self.config, self.database)
 
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write file
+        # Write the calendar envelope around events serialized one at a time,
+        # so a streaming snapshot is never held in memory as a whole
+        header, footer = cal.to_ical().rsplit(b"END:VCALENDAR", 1)
+        event_count = 0
         with open(output_path, "wb") as f:
-            f.write(cal.to_ical())
+            f.write(header)
+            for seminar in snapshot.iter_seminars():
+                f.write(self._create_event(seminar, snapshot.generated_at).to_ical())
+                event_count += 1
+            f.write(b"END:VCALENDAR" + footer)
 
-        console.print(f"  Generated ICS with {len(seminars)} events: {output_path.name}")
+        console.print(f"  Generated ICS with {event_count} events: {output_path.name}")
 
-        return output_path, len(seminars)
+        return output_path, event_count
 
-    def _create_event(self, seminar: Seminar) -> Event:
-        """Create iCalendar Event from Seminar."""
+    def _create_event(self, seminar: SeminarRecord, dtstamp: datetime) -> Event:
+        """Create iCalendar Event from a seminar record."""
         event = Event()
 
         # Unique ID
         event.add("uid", f"{seminar.id}@gid-seminars.wnprc.wisc.edu")
 
         # Timestamps
-        event.add("dtstamp", datetime.utcnow())
+        event.add("dtstamp", dtstamp)
 
         # Start time - convert to timezone-aware
         tz = pytz.timezone(seminar.timezone)
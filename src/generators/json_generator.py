@@ -2,13 +2,13 @@
 """Generate JSON feed from seminars."""
 
 import json
-from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, TextIO
 
 from src.core.database import SeminarDatabase
-from src.core.exclusion_filter import ExclusionFilter
-from src.core.utils import DEFAULT_DAYS_AHEAD, DEFAULT_DAYS_BEHIND, console
+from src.core.utils import console
+
+from .snapshot import RenderSnapshot, build_render_snapshot
 
 
 class JSONGenerator:
@@ -18,51 +18,43 @@ class JSONGenerator:
         self,
         config: dict[str, Any],
         database: SeminarDatabase,
-        exclusion_filter: ExclusionFilter | None = None,
     ):
         self.config = config
         self.database = database
-        self.exclusion_filter = exclusion_filter
         self.time_window = config.get("time_window", {})
 
-    def generate(self, output_path: Path) -> tuple[Path, int]:
+    def generate(
+        self, output_path: Path, snapshot: RenderSnapshot | None = None
+    ) -> tuple[Path, int]:
         """
         Generate JSON feed with seminars in time window.
 
+        Args:
+            output_path: File to write
+            snapshot: Pre-loaded seminars; loaded from the database if omitted
+
         Returns:
             Tuple of (output_path, event_count)
         """
         # Get seminars in time window
-        days_behind = self.time_window.get("days_behind", DEFAULT_DAYS_BEHIND)
-        days_ahead = self.time_window.get("days_ahead", DEFAULT_DAYS_AHEAD)
-
-        seminars = self.database.get_seminars_in_window(
-            days_behind=days_behind,
-            days_ahead=days_ahead,
-        )
-
-        # Apply exclusion filter
-        if self.exclusion_filter:
-            seminars = self.exclusion_filter.filter_seminars(seminars)
+        if snapshot is None:
+            snapshot = build_render_snapshot(self.config, self.database)
 
         # Get statistics
-        stats = self.database.get_statistics()
+        stats = snapshot.statistics
 
         # Build JSON structure
-        data = {
-            "metadata": {
-                "title": "GID Seminars Feed",
-                "description": "Aggregated seminars and webinars for Global Infectious Disease research",
-                "generated_at": datetime.utcnow().isoformat() + "Z",
-                "time_window": {
-                    "days_behind": days_behind,
-                    "days_ahead": days_ahead,
-                },
-                "total_events": len(seminars),
-                "sources": list(stats.get("by_source", {}).keys()),
-                "categories": list(stats.get("by_category", {}).keys()),
+        metadata = {
+            "title": "GID Seminars Feed",
+            "description": "Aggregated seminars and webinars for Global Infectious Disease research",
+            "generated_at": snapshot.generated_at.isoformat() + "Z",
+            "time_window": {
+                "days_behind": snapshot.days_behind,
+                "days_ahead": snapshot.days_ahead,
             },
-            "events": [self._seminar_to_dict(s) for s in seminars],
+            "total_events": snapshot.count,
+            "sources": list(stats.get("by_source", {}).keys()),
+            "categories": list(stats.get("by_category", {}).keys()),
         }
 
         # Ensure output directory exists
@@ -70,11 +62,32 @@ class JSONGenerator:
 
         # Write file
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+            event_count = self._write_feed(f, metadata, snapshot.iter_seminars())
+
+        console.print(f"  Generated JSON with {event_count} events: {output_path.name}")
+
+        return output_path, event_count
+
+    def _write_feed(
+        self, f: TextIO, metadata: dict[str, Any], seminars: Iterable[Any]
+    ) -> int:
+        """
+        Write the feed one event at a time and return the number of events.
+
+        Produces the same document as json.dump({"metadata": ..., "events":
+        [...]}, indent=2) without building the events list.
+        """
+        head = json.dumps({"metadata": metadata}, indent=2, default=str)
+        f.write(head[: -len("\n}")] + ',\n  "events": [')
 
-        console.print(f"  Generated JSON with {len(seminars)} events: {output_path.name}")
+        event_count = 0
+        for seminar in seminars:
+            event = json.dumps(self._seminar_to_dict(seminar), indent=2, default=str)
+            f.write(("," if event_count else "") + "\n    " + event.replace("\n", "\n    "))
+            event_count += 1
 
-        return output_path, len(seminars)
+        f.write("\n  ]\n}" if event_count else "]\n}")
+        return event_count
 
     def _seminar_to_dict(self, seminar: Any) -> dict[str, Any]:
         """Convert Seminar to JSON-serializable dict."""
@@ -0,0 +1,202 @@
+# GID Seminars - Render Snapshot
+"""Load the time window once so every generator renders the same data."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
+
+from src.core.database import SeminarDatabase
+from src.core.models import SeminarRecord
+from src.core.utils import DEFAULT_DAYS_AHEAD, DEFAULT_DAYS_BEHIND, to_utc_epoch
+
+# Columns read by the streaming summary pass (counts, filter lists)
+SUMMARY_FIELDS = ("source_id", "start_epoch", "category")
+
+
+@dataclass(frozen=True)
+class RenderSnapshot:
+    """
+    Immutable set of seminars and metadata shared by the output generators.
+
+    A materialized snapshot holds every seminar in `seminars`. A streaming
+    snapshot (seminars is None) only holds the window and its summary, and
+    each iter_* call streams the rows from the database again, so memory use
+    stays flat however wide the time window is.
+    """
+
+    seminars: tuple[SeminarRecord, ...] | None
+    generated_at: datetime
+    days_behind: int
+    days_ahead: int
+    statistics: Mapping[str, Any] = field(default_factory=dict)
+    count: int = 0
+    upcoming_count: int = 0
+    past_count: int = 0
+    sources: tuple[str, ...] = ()
+    categories: tuple[str, ...] = ()
+    database: SeminarDatabase | None = None
+
+    @property
+    def generated_epoch(self) -> int:
+        """Generation time as UTC epoch seconds, for comparing start_epoch."""
+        return to_utc_epoch(self.generated_at)
+
+    @property
+    def streaming(self) -> bool:
+        """True when seminars are streamed from the database on each iteration."""
+        return self.seminars is None
+
+    def iter_seminars(self) -> Iterator[SeminarRecord]:
+        """Seminars in the window, earliest first."""
+        if not self.streaming:
+            return iter(self.seminars)
+        return self._stream()
+
+    def iter_upcoming(self) -> Iterator[SeminarRecord]:
+        """Seminars starting at or after generation time, soonest first."""
+        if not self.streaming:
+            return iter(self.upcoming)
+        return (s for s in self._stream() if s.start_epoch >= self.generated_epoch)
+
+    def iter_past(self) -> Iterator[SeminarRecord]:
+        """Seminars that started before generation time, most recent first."""
+        if not self.streaming:
+            return iter(self.past)
+        return (
+            s for s in self._stream(descending=True)
+            if s.start_epoch < self.generated_epoch
+        )
+
+    @property
+    def upcoming(self) -> list[SeminarRecord]:
+        """Seminars starting at or after generation time, soonest first."""
+        if self.streaming:
+            return list(self.iter_upcoming())
+        return sorted(
+            (s for s in self.seminars if s.start_epoch >= self.generated_epoch),
+            key=lambda s: s.start_epoch,
+        )
+
+    @property
+    def past(self) -> list[SeminarRecord]:
+        """Seminars that started before generation time, most recent first."""
+        if self.streaming:
+            return list(self.iter_past())
+        return sorted(
+            (s for s in self.seminars if s.start_epoch < self.generated_epoch),
+            key=lambda s: s.start_epoch,
+            reverse=True,
+        )
+
+    def _stream(self, descending: bool = False) -> Iterator[SeminarRecord]:
+        """Stream the window from the database; excluded seminars are skipped in SQL."""
+        return self.database.iter_records_in_window(
+            days_behind=self.days_behind,
+            days_ahead=self.days_ahead,
+            now=self.generated_at,
+            descending=descending,
+        )
+
+
+def build_render_snapshot(
+    config: dict[str, Any],
+    database: SeminarDatabase,
+    streaming: bool | None = None,
+) -> RenderSnapshot:
+    """
+    Load the configured time window once.
+
+    Seminars flagged by the exclusion rules are already left out by the
+    database's window queries.
+
+    Args:
+        config: Settings configuration (reads the [time_window] table and
+            [output] stream_rendering)
+        database: Database to load seminars from
+        streaming: Build a streaming snapshot instead of loading every
+            seminar; defaults to [output] stream_rendering
+
+    Returns:
+        Snapshot to hand to every generator
+    """
+    time_window = config.get("time_window", {})
+    days_behind = time_window.get("days_behind", DEFAULT_DAYS_BEHIND)
+    days_ahead = time_window.get("days_ahead", DEFAULT_DAYS_AHEAD)
+    if streaming is None:
+        streaming = config.get("output", {}).get("stream_rendering", False)
+    generated_at = datetime.utcnow()
+    statistics = MappingProxyType(database.get_statistics())
+
+    if streaming:
+        return RenderSnapshot(
+            seminars=None,
+            generated_at=generated_at,
+            days_behind=days_behind,
+            days_ahead=days_ahead,
+            statistics=statistics,
+            database=database,
+            **_summarize_stream(database, days_behind, days_ahead, generated_at),
+        )
+
+    # Generators never read raw_data, so use the lightweight read path
+    seminars = database.get_records_in_window(
+        days_behind=days_behind,
+        days_ahead=days_ahead,
+        now=generated_at,
+    )
+
+    generated_epoch = to_utc_epoch(generated_at)
+    upcoming_count = sum(1 for s in seminars if s.start_epoch >= generated_epoch)
+    return RenderSnapshot(
+        seminars=tuple(seminars),
+        generated_at=generated_at,
+        days_behind=days_behind,
+        days_ahead=days_ahead,
+        statistics=statistics,
+        count=len(seminars),
+        upcoming_count=upcoming_count,
+        past_count=len(seminars) - upcoming_count,
+        sources=tuple(sorted(set(s.source_id for s in seminars))),
+        categories=tuple(sorted(set(s.category for s in seminars if s.category))),
+    )
+
+
+def _summarize_stream(
+    database: SeminarDatabase,
+    days_behind: int,
+    days_ahead: int,
+    generated_at: datetime,
+) -> dict[str, Any]:
+    """
+    Compute the counts and filter lists of a streaming snapshot.
+
+    One pass over a few narrow columns, so the generators' own passes only
+    read the rows they render.
+    """
+    records = database.iter_records_in_window(
+        days_behind=days_behind,
+        days_ahead=days_ahead,
+        now=generated_at,
+        fields=SUMMARY_FIELDS,
+    )
+
+    generated_epoch = to_utc_epoch(generated_at)
+    count = upcoming_count = 0
+    sources: set[str] = set()
+    categories: set[str] = set()
+    for seminar in records:
+        count += 1
+        if seminar.start_epoch >= generated_epoch:
+            upcoming_count += 1
+        sources.add(seminar.source_id)
+        if seminar.category:
+            categories.add(seminar.category)
+
+    return {
+        "count": count,
+        "upcoming_count": upcoming_count,
+        "past_count": count - upcoming_count,
+        "sources": tuple(sorted(sources)),
+        "categories": tuple(sorted(categories)),
+    }
@@ -1,10 +1,9 @@
 # GID Seminars - Source Collectors
 """Source collectors for various seminar/webinar feeds."""
 
+from typing import Any
+
 from .base import BaseSource
-from .rss_source import RSSSource
-from .ical_source import ICalSource
-from .manual_source import ManualSource
 from .collector import SourceCollector
 
 __all__ = [
@@ -14,3 +13,14 @@ __all__ = [
     "ManualSource",
     "SourceCollector",
 ]
+
+
+# Source classes re-exported here, by source type
+_LAZY_CLASSES = {"RSSSource": "rss", "ICalSource": "ical", "ManualSource": "manual"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import source classes lazily so importing the package stays cheap."""
+    if name in _LAZY_CLASSES:
+        return SourceCollector.SOURCE_CLASSES[_LAZY_CLASSES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,34 @@
 # GID Seminars - Base Source Class
 """Abstract base class for all seminar sources."""
 
+import random
 import time
 from abc import ABC, abstractmethod
 from hashlib import sha256
 from typing import Any
+from urllib.parse import urlparse
 
 import requests
 
 from src.core.database import SeminarDatabase
-from src.core.exceptions import NetworkError
+from src.core.exceptions import NetworkError, NotModifiedError
+from src.core.http_client import (
+    RETRY_AFTER_STATUS_CODES,
+    RETRYABLE_STATUS_CODES,
+    get_rate_limiter,
+    get_session,
+    parse_retry_after,
+)
 from src.core.keyword_filter import KeywordFilter
-from src.core.models import Seminar, SourceRunStatus
+from src.core.models import Seminar, SourceRun, SourceRunStatus
 from src.core.utils import (
     DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_RETRY_AFTER,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
     DEFAULT_RETRY_DELAY,
     DEFAULT_TIMEOUT,
+    DateTimeParser,
     console,
 )
 
@@ -45,29 +58,77 @@ class BaseSource(ABC):
         self.url = config.get("url")
         self.require_keywords = config.get("require_keywords", True)  # Default to filtering
 
-        # HTTP settings
-        self.timeout = self.http_config.get("timeout", DEFAULT_TIMEOUT)
-        self.max_retries = self.http_config.get("max_retries", DEFAULT_MAX_RETRIES)
-        self.retry_delay_base = self.http_config.get("retry_delay_base", DEFAULT_RETRY_DELAY)
-        self.user_agent = self.http_config.get(
-            "user_agent", "GID-Seminars-Aggregator/1.0"
-        )
+        # HTTP settings ([http], overridable per source)
+        self.timeout = self._http_setting("timeout", DEFAULT_TIMEOUT)
+        self.max_retries = max(1, self._http_setting("max_retries", DEFAULT_MAX_RETRIES))
+        self.retry_delay_base = self._http_setting("retry_delay_base", DEFAULT_RETRY_DELAY)
+        self.max_retry_after = self._http_setting("max_retry_after", DEFAULT_MAX_RETRY_AFTER)
+        self.rate_limit = self._http_setting("rate_limit", DEFAULT_RATE_LIMIT)
+        self.rate_limit_burst = self._http_setting("rate_limit_burst", DEFAULT_RATE_LIMIT_BURST)
+        self.user_agent = self._http_setting("user_agent", "GID-Seminars-Aggregator/1.0")
+
+        # Pooled session shared by all sources; headers are this source's own
+        # and are sent with each request
+        self.session = get_session(self.http_config)
+        self.headers = {"User-Agent": self.user_agent}
+
+        # Learns which datetime formats this source's feed uses
+        self.datetime_parser = DateTimeParser()
+
+        # Entries dropped by the keyword pre-filter during the current run
+        self._prefiltered = 0
+
+        # Request attempts allowed during the current run
+        self._max_attempts = self.max_retries
+
+        # Validators from the current run's conditional request, saved to the
+        # HTTP cache only once the run has completed successfully
+        self._validators: dict[str, str | None] | None = None
+
+    def _http_setting(self, key: str, default: Any) -> Any:
+        """Look up an HTTP setting in the source config, then [http], then the default."""
+        return self.config.get(key, self.http_config.get(key, default))
+
+    @property
+    def filter_hash(self) -> str:
+        """
+        Hash of the filter config this source's rows are filtered with.
+
+        Covers the keyword filter (keyword lists, excluded categories,
+        pre-filter) and the exclusion rules, so an unchanged feed is still
+        re-parsed once after either changes.
+        """
+        keyword_filter = self.keyword_filter if self.require_keywords else None
+        parts = [
+            keyword_filter.config_hash if keyword_filter else "",
+            ",".join(sorted(keyword_filter.exclude_categories)) if keyword_filter else "",
+            str(bool(keyword_filter and keyword_filter.prefilter)),
+            self.database.exclusion_filter.rules_hash,
+        ]
+        return sha256(":".join(parts).encode()).hexdigest()[:16]
 
-        # Create session
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.user_agent})
+    @property
+    def host(self) -> str | None:
+        """Hostname this source fetches from, used for per-host concurrency limits."""
+        return urlparse(self.url).hostname if self.url else None
 
     @abstractmethod
     def fetch_seminars(self) -> list[Seminar]:
         """Fetch seminars from the source. Must be implemented by subclasses."""
         pass
 
-    def run(self) -> dict[str, int]:
+    def run(self, max_attempts: int | None = None) -> dict[str, Any]:
         """
         Execute the source collection with logging and database updates.
 
+        Args:
+            max_attempts: Attempts per request for this run, instead of
+                max_retries (e.g. 1 to probe a source that keeps failing)
+
         Returns:
-            Statistics dict with keys: found, added, updated, removed
+            Statistics dict with keys: found, added, updated, removed,
+            prefiltered (model builds skipped by the keyword pre-filter), and
+            cache_status when existing rows were kept because the feed is unchanged
         """
         if not self.enabled:
             console.print(f"[dim]  Skipping disabled source: {self.name}[/dim]")
@@ -75,17 +136,46 @@ class BaseSource(ABC):
 
         console.print(f"\n[bold cyan]  {self.name}[/bold cyan]")
         run_id = self.database.start_source_run(self.source_id)
-        stats = {"found": 0, "added": 0, "updated": 0, "removed": 0}
+        stats: dict[str, Any] = {"found": 0, "added": 0, "updated": 0, "removed": 0}
+        self._validators = None
+        self._prefiltered = 0
+        self._max_attempts = max(1, max_attempts or self.max_retries)
 
         try:
             seminars = self.fetch_seminars()
             stats["found"] = len(seminars)
+            stats["prefiltered"] = self._prefiltered
+            if self._prefiltered > 0:
+                console.print(
+                    f"    Pre-filtered: {self._prefiltered} (not matching keywords, not built)",
+                    style="dim",
+                )
 
             # Apply keyword filtering if required
             stats["filtered"] = 0
             if self.keyword_filter and self.require_keywords:
+                # Only new or changed items are matched again
+                fetched = seminars
+                verdicts = self.database.get_filter_verdicts(
+                    self.source_id, self.keyword_filter.config_hash
+                )
                 seminars, filtered_count = self.keyword_filter.filter_seminars(
-                    seminars, require_keywords=True
+                    fetched, require_keywords=True, verdicts=verdicts
+                )
+                self.database.save_filter_verdicts(
+                    self.source_id,
+                    {
+                        seminar.id: verdicts[seminar.id]
+                        for seminar in fetched
+                        if seminar.id in verdicts
+                    },
+                )
+
+                # Keep rejected candidates so a new filter config can be re-applied offline
+                accepted_ids = {seminar.id for seminar in seminars}
+                self.database.save_rejected_seminars(
+                    [seminar for seminar in fetched if seminar.id not in accepted_ids],
+                    list(accepted_ids),
                 )
                 stats["filtered"] = filtered_count
                 if filtered_count > 0:
@@ -94,15 +184,11 @@ class BaseSource(ABC):
                         style="dim"
                     )
 
-            # Upsert each seminar
-            current_ids = []
-            for seminar in seminars:
-                is_new, change_type = self.database.upsert_seminar(seminar)
-                current_ids.append(seminar.id)
-                if change_type == "added":
-                    stats["added"] += 1
-                elif change_type == "updated":
-                    stats["updated"] += 1
+            # Upsert all seminars in one transaction
+            counts = self.database.upsert_many(seminars)
+            stats["added"] = counts["added"]
+            stats["updated"] = counts["updated"]
+            current_ids = [seminar.id for seminar in seminars]
 
             # Remove stale entries (only if we found some seminars)
             if current_ids:
@@ -110,6 +196,7 @@ class BaseSource(ABC):
                     self.source_id, current_ids
                 )
 
+            validators = self._save_validators()
             self.database.complete_source_run(
                 run_id,
                 SourceRunStatus.SUCCESS.value,
@@ -117,6 +204,10 @@ class BaseSource(ABC):
                 events_added=stats["added"],
                 events_updated=stats["updated"],
                 events_removed=stats["removed"],
+                etag=validators.get("etag"),
+                last_modified=validators.get("last_modified"),
+                content_hash=validators.get("content_hash"),
+                filter_hash=self.filter_hash,
             )
 
             # Log results
@@ -131,6 +222,24 @@ class BaseSource(ABC):
             if stats["removed"] > 0:
                 console.print(f"    Removed: {stats['removed']}", style="red")
 
+        except NotModifiedError as e:
+            # Nothing to parse - the rows from the last run stay as they are
+            stats["cache_status"] = e.cache_status
+            validators = self._save_validators()
+            self.database.complete_source_run(
+                run_id,
+                SourceRunStatus.SUCCESS.value,
+                etag=validators.get("etag"),
+                last_modified=validators.get("last_modified"),
+                content_hash=validators.get("content_hash"),
+                cache_status=e.cache_status,
+                filter_hash=self.filter_hash,
+            )
+            if e.cache_status == "unchanged":
+                console.print("    Content unchanged since last run, keeping existing entries", style="dim")
+            else:
+                console.print("    Not modified since last run, keeping existing entries", style="dim")
+
         except Exception as e:
             console.print(f"    [red]Error: {e}[/red]")
             self.database.complete_source_run(
@@ -140,38 +249,161 @@ class BaseSource(ABC):
 
         return stats
 
+    def _passes_prefilter(self, title: str, description: str | None) -> bool:
+        """
+        Check an entry's text against the keyword filter before building a Seminar.
+
+        Sources call this once they have the title and description they would
+        store, and skip the entry when it returns False. Entries skipped here
+        are not kept as rejected candidates, so the pre-filter is opt-in via
+        [filtering] prefilter.
+        """
+        keyword_filter = self.keyword_filter
+        if not (keyword_filter and keyword_filter.prefilter and self.require_keywords):
+            return True
+        if keyword_filter.matches_text(title, description):
+            return True
+        self._prefiltered += 1
+        return False
+
     def _make_request(
         self,
         url: str,
         method: str = "GET",
+        conditional: bool = False,
         **kwargs: Any,
     ) -> requests.Response:
-        """Make HTTP request with retry logic."""
+        """
+        Make HTTP request with rate limiting and retry logic.
+
+        Requests to a host are paced by its shared token bucket. Connection
+        errors, timeouts, 408/429 and 5xx responses are retried with jittered
+        exponential backoff, or after the Retry-After delay of a 429/503;
+        other 4xx responses fail straight away.
+
+        Args:
+            url: URL to request
+            method: HTTP method
+            conditional: If True, send the validators cached for this URL and
+                raise NotModifiedError when the server answers 304 or the body
+                hashes the same as on the last successful run. Neither applies
+                when the filter config changed since that run.
+
+        Returns:
+            The successful response
+        """
         last_error = None
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+
+        last_run = None
+        if conditional:
+            # Skip re-parsing an unchanged feed only if its rows were
+            # filtered with the current config
+            last_run = self.database.get_last_successful_run(self.source_id)
+            if last_run and last_run.filter_hash != self.filter_hash:
+                last_run = None
+            cached = self.database.get_http_cache(url) or {}
+            if last_run and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if last_run and cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
 
-        for attempt in range(self.max_retries):
+        limiter = get_rate_limiter(
+            urlparse(url).hostname, self.rate_limit, self.rate_limit_burst
+        )
+
+        for attempt in range(self._max_attempts):
+            if limiter:
+                limiter.acquire()
+            retry_after = None
             try:
                 response = self.session.request(
-                    method, url, timeout=self.timeout, **kwargs
+                    method, url, headers=headers, timeout=self.timeout, **kwargs
                 )
+                if conditional and response.status_code == 304:
+                    self._validators = {
+                        "url": url,
+                        "etag": cached.get("etag"),
+                        "last_modified": cached.get("last_modified"),
+                        "content_hash": cached.get("content_hash"),
+                    }
+                    raise NotModifiedError(self.source_id, f"{url} not modified")
+                if response.status_code in RETRY_AFTER_STATUS_CODES:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
                 response.raise_for_status()
+                if conditional:
+                    self._check_content_changed(url, response, last_run)
                 return response
 
             except requests.exceptions.RequestException as e:
                 last_error = e
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay_base * (2**attempt)
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and status not in RETRYABLE_STATUS_CODES:
+                    raise NetworkError(self.source_id, f"Request failed: {e}", e) from e
+                if retry_after is not None and retry_after > self.max_retry_after:
+                    break
+                if attempt < self._max_attempts - 1:
+                    delay = self._retry_delay(attempt, retry_after)
                     console.print(
-                        f"    [yellow]Request failed, retrying in {delay}s...[/yellow]"
+                        f"    [yellow]Request failed, retrying in {delay:.1f}s...[/yellow]"
                     )
                     time.sleep(delay)
 
         raise NetworkError(
             self.source_id,
-            f"Request failed after {self.max_retries} attempts: {last_error}",
+            f"Request failed after {attempt + 1} attempt(s): {last_error}",
             last_error,
         )
 
+    def _retry_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Seconds to wait before a retry: the server's Retry-After, or jittered backoff."""
+        if retry_after is not None:
+            return retry_after
+        # Half the exponential backoff plus a random share of the other half,
+        # so sources that failed together do not retry in lockstep
+        backoff = self.retry_delay_base * (2**attempt)
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+    def _check_content_changed(
+        self, url: str, response: requests.Response, last_run: SourceRun | None
+    ) -> None:
+        """
+        Record validators for a fetched feed and stop the run if its body is unchanged.
+
+        Many feeds send no ETag/Last-Modified, so the body hash from the last
+        successful run is the only way to tell that nothing needs re-parsing.
+
+        Args:
+            url: Requested URL
+            response: Successful response
+            last_run: Last successful run to compare with, or None to always
+                re-parse (e.g. after a filter config change)
+        """
+        content_hash = self._compute_content_hash(response.content)
+        self._validators = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_hash": content_hash,
+        }
+
+        if last_run and last_run.content_hash == content_hash:
+            raise NotModifiedError(
+                self.source_id, f"{url} content unchanged", cache_status="unchanged"
+            )
+
+    def _save_validators(self) -> dict[str, str | None]:
+        """Store this run's validators in the HTTP cache and return them."""
+        validators = self._validators or {}
+        if validators:
+            self.database.update_http_cache(
+                validators["url"],
+                etag=validators["etag"],
+                last_modified=validators["last_modified"],
+                content_hash=validators["content_hash"],
+            )
+        return validators
+
     def _compute_content_hash(self, content: bytes) -> str:
         """Compute SHA256 hash of content."""
         return sha256(content).hexdigest()[:16]
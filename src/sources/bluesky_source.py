@@ -17,7 +17,9 @@ from src.core.utils import (
     MAX_DESCRIPTION_LENGTH,
     MAX_TITLE_LENGTH,
     console,
-    parse_date_time_parts,
+    extract_datetime_mentions,
+    mention_to_datetime,
+    nearest_mention,
 )
 
 from .base import BaseSource
@@ -48,6 +50,11 @@ class BlueskySource(BaseSource):
 
         self._client = None
 
+    @property
+    def host(self) -> str | None:
+        """All Bluesky searches go through the same AT Protocol service."""
+        return "bsky.social"
+
     def _get_client(self):
         """Get authenticated Bluesky client."""
         if self._client is not None:
@@ -163,6 +170,14 @@ class BlueskySource(BaseSource):
         if not self._looks_like_seminar(text):
             return None
 
+        # Build title from first line
+        title = self._extract_title(text)
+        if not title:
+            return None
+
+        if not self._passes_prefilter(title, text[:MAX_DESCRIPTION_LENGTH]):
+            return None
+
         # Extract datetime from post
         event_datetime = self._extract_datetime_from_text(text)
 
@@ -171,17 +186,12 @@ class BlueskySource(BaseSource):
             created_at = record.created_at if hasattr(record, "created_at") else ""
             if created_at:
                 try:
-                    event_datetime = datetime.fromisoformat(created_at.replace("Z", "+00:00")).replace(tzinfo=None)
+                    event_datetime = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
                 except ValueError:
                     return None
             else:
                 return None
 
-        # Build title from first line
-        title = self._extract_title(text)
-        if not title:
-            return None
-
         # Get author info
         author_handle = author.handle if author and hasattr(author, "handle") else ""
         author_name = author.display_name if author and hasattr(author, "display_name") else author_handle
@@ -259,32 +269,23 @@ class BlueskySource(BaseSource):
         return first_line if first_line else None
 
     def _extract_datetime_from_text(self, text: str) -> datetime | None:
-        """Try to extract event date/time from post text."""
-        patterns = [
-            # "January 15, 2025 at 2:00 PM"
-            r"(\w+ \d{1,2},? \d{4})\s+(?:at\s+)?(\d{1,2}:\d{2}\s*[AP]M)",
-            # "1/15/2025 2:00 PM"
-            r"(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}:\d{2}\s*[AP]M)",
-            # "Jan 15 at 2pm"
-            r"(\w{3,9}\s+\d{1,2})(?:st|nd|rd|th)?\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*[AP]M)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    date_str = match.group(1)
-                    time_str = match.group(2)
-                    return self._parse_date_time(date_str, time_str)
-                except (ValueError, IndexError):
-                    continue
+        """Try to extract event date/time from post text.
+
+        Matches a date directly followed by a time, e.g. "January 15, 2025 at
+        2:00 PM", "1/15/2025 2:00 PM" or "Jan 15th at 2pm".
+        """
+        mentions = extract_datetime_mentions(text)
+        for date in mentions:
+            if date.kind != "date":
+                continue
+            time = nearest_mention(mentions, date.end, max_distance=10, forward_only=True)
+            if time:
+                event_datetime = mention_to_datetime(date, time)
+                if event_datetime:
+                    return event_datetime
 
         return None
 
-    def _parse_date_time(self, date_str: str, time_str: str) -> datetime | None:
-        """Parse date and time strings into datetime using shared utility."""
-        return parse_date_time_parts(date_str, time_str)
-
     def _uri_to_url(self, uri: str, handle: str) -> str:
         """Convert AT URI to Bluesky web URL."""
         if not uri:
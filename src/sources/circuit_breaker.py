@@ -0,0 +1,58 @@
+# GID Seminars - Source Circuit Breaker
+"""Skip or probe sources that have failed on several runs in a row."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any
+
+from src.core.database import SeminarDatabase
+
+
+class CircuitState(str, Enum):
+    """Circuit state of a source for the current run."""
+
+    CLOSED = "closed"  # Run normally
+    OPEN = "open"  # Skip until the cooldown has passed
+    HALF_OPEN = "half_open"  # Cooldown over: probe with a single attempt
+
+
+@dataclass(frozen=True, slots=True)
+class BreakerState:
+    """A source's circuit state, with the failure streak it is based on."""
+
+    state: CircuitState
+    failures: int = 0
+    next_probe_at: datetime | None = None  # UTC, naive like source_runs
+
+
+class CircuitBreaker:
+    """
+    Decide per source whether to run, skip or probe it, from source_runs history.
+
+    A source whose last `threshold` runs all failed has an open circuit and
+    is skipped until `cooldown` after its latest failure. After that it is
+    probed with a single request attempt; a success closes the circuit and
+    another failure keeps it open for a further cooldown.
+    """
+
+    def __init__(self, database: SeminarDatabase, config: dict[str, Any]):
+        """
+        Args:
+            database: Database holding the source_runs history
+            config: [collection] settings (breaker_threshold, breaker_cooldown_hours)
+        """
+        self.threshold = config.get("breaker_threshold", 3)
+        self.cooldown = timedelta(hours=config.get("breaker_cooldown_hours", 6))
+        self._streaks = database.get_failure_streaks() if self.threshold > 0 else {}
+
+    def state(self, source_id: str, now: datetime | None = None) -> BreakerState:
+        """Get the circuit state of a source for a run starting at `now` (UTC)."""
+        failures, last_failure = self._streaks.get(source_id, (0, None))
+        if self.threshold <= 0 or failures < self.threshold or last_failure is None:
+            return BreakerState(CircuitState.CLOSED, failures)
+
+        next_probe_at = last_failure + self.cooldown
+        if (now or datetime.utcnow()) < next_probe_at:
+            return BreakerState(CircuitState.OPEN, failures, next_probe_at)
+        return BreakerState(CircuitState.HALF_OPEN, failures, next_probe_at)
@@ -1,6 +1,13 @@
 # GID Seminars - Source Collector
 """Orchestrates collection from all configured sources."""
 
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from importlib import import_module
 from pathlib import Path
 from typing import Any
 
@@ -8,33 +15,69 @@ import toml
 
 from src.core.database import SeminarDatabase
 from src.core.keyword_filter import KeywordFilter
+from src.core.models import Seminar, SourceRunStatus
 from src.core.utils import console
 
 from .base import BaseSource
-from .bluesky_source import BlueskySource
-from .conference_source import ConferenceSource
-from .ical_source import ICalSource
-from .manual_source import ManualSource
-from .podcast_source import PodcastSource
-from .rss_source import RSSSource
-from .scraper_source import ScraperSource
-from .who_source import WHOSource
+from .circuit_breaker import BreakerState, CircuitBreaker, CircuitState
+from .scheduler import (
+    RefreshScheduler,
+    order_longest_first,
+    predict_total_time,
+    take_dispatchable,
+)
+
+
+class SourceRegistry(Mapping[str, type[BaseSource]]):
+    """
+    Map source types to their classes, importing each source module on first use.
+
+    Source modules pull in heavy parsing libraries (bs4, feedparser,
+    icalendar, ...), so only the types that enabled sources need are loaded.
+    """
+
+    def __init__(self, paths: dict[str, str]):
+        """
+        Args:
+            paths: Source type -> "module:ClassName", relative to this package
+        """
+        self._paths = paths
+        self._classes: dict[str, type[BaseSource]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, source_type: str) -> type[BaseSource]:
+        source_class = self._classes.get(source_type)
+        if source_class is None:
+            module_name, class_name = self._paths[source_type].split(":")
+            with self._lock:
+                module = import_module(f".{module_name}", __package__)
+                source_class = self._classes[source_type] = getattr(module, class_name)
+        return source_class
+
+    def __contains__(self, source_type: object) -> bool:
+        return source_type in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
 
 
 class SourceCollector:
     """Orchestrates collection from all configured sources."""
 
     # Map source types to their classes
-    SOURCE_CLASSES: dict[str, type[BaseSource]] = {
-        "rss": RSSSource,
-        "ical": ICalSource,
-        "manual": ManualSource,
-        "bluesky": BlueskySource,
-        "scraper": ScraperSource,
-        "podcast": PodcastSource,
-        "conference": ConferenceSource,
-        "who": WHOSource,
-    }
+    SOURCE_CLASSES = SourceRegistry({
+        "rss": "rss_source:RSSSource",
+        "ical": "ical_source:ICalSource",
+        "manual": "manual_source:ManualSource",
+        "bluesky": "bluesky_source:BlueskySource",
+        "scraper": "scraper_source:ScraperSource",
+        "podcast": "podcast_source:PodcastSource",
+        "conference": "conference_source:ConferenceSource",
+        "who": "who_source:WHOSource",
+    })
 
     def __init__(
         self,
@@ -49,9 +92,17 @@ class SourceCollector:
         self.base_dir = base_dir or Path.cwd()
         self.http_config = settings_config.get("http", {})
 
+        # Concurrency settings (max_workers = 1 keeps the sequential behaviour)
+        collection_config = settings_config.get("collection", {})
+        self.max_workers = max(1, collection_config.get("max_workers", 1))
+        self.max_per_host = max(1, collection_config.get("max_per_host", 2))
+        self.collection_config = collection_config
+        self.breaker_states: dict[str, BreakerState] = {}
+
         # Initialize keyword filter
         filter_config = settings_config.get("filtering", {})
         self.keyword_filter = KeywordFilter(filter_config) if filter_config.get("keywords") else None
+        self.rejected_retention_days = filter_config.get("rejected_retention_days", 30)
 
         self.sources = self._initialize_sources()
 
@@ -65,15 +116,15 @@ class SourceCollector:
                 continue
 
             source_type = source_config.get("type", "rss")
-            source_class = self.SOURCE_CLASSES.get(source_type)
-
-            if not source_class:
+            if source_type not in self.SOURCE_CLASSES:
                 console.print(
                     f"[yellow]Unknown source type '{source_type}' for {source_id}[/yellow]"
                 )
                 continue
 
             try:
+                # Imports the source module the first time its type is used
+                source_class = self.SOURCE_CLASSES[source_type]
                 if source_type in ("manual", "conference"):
                     source = source_class(
                         source_id,
@@ -97,35 +148,87 @@ class SourceCollector:
 
         return sources
 
-    def collect_all(self) -> dict[str, dict[str, Any]]:
+    def collect_all(self, force: bool = False) -> dict[str, dict[str, Any]]:
         """
         Collect from all sources, isolating failures.
 
+        Args:
+            force: Run every source, including ones refreshed recently
+
         Returns:
             Dict mapping source_id -> result dict with 'status' and 'stats' or 'error'
         """
-        results: dict[str, dict[str, Any]] = {}
-
-        console.print(f"\n[bold]Collecting from {len(self.sources)} source(s)...[/bold]")
-
-        for source in self.sources:
-            try:
-                stats = source.run()
-                results[source.source_id] = {"status": "success", "stats": stats}
+        # Decide up front which sources are due; the others keep their stored rows
+        if force:
+            due, results = self.sources, {}
+        else:
+            due, results = self._schedule()
+
+        console.print(f"\n[bold]Collecting from {len(due)} source(s)...[/bold]")
+
+        # Skip sources that keep failing until their cooldown has passed
+        breaker = CircuitBreaker(self.database, self.collection_config)
+        self.breaker_states = {
+            source.source_id: breaker.state(source.source_id) for source in due
+        }
+        runnable = []
+        for source in due:
+            state = self.breaker_states[source.source_id]
+            if state.state == CircuitState.OPEN:
+                results[source.source_id] = self._skip_source(source, state)
+            else:
+                runnable.append(source)
+
+        # Dispatch the slowest sources first so no long run starts last
+        concurrent = self.max_workers > 1 and len(runnable) > 1
+        durations = self.database.get_run_durations()
+        if concurrent:
+            runnable = order_longest_first(runnable, durations)
+        predicted = predict_total_time(
+            runnable, durations, self.max_workers if concurrent else 1, self.max_per_host
+        )
 
-            except Exception as e:
-                console.print(f"  [red]Source {source.source_id} failed: {e}[/red]")
-                results[source.source_id] = {"status": "error", "error": str(e)}
-                # Continue to next source - don't let one failure stop others
+        started = time.perf_counter()
+        if concurrent:
+            results.update(self._collect_concurrently(runnable))
+        else:
+            for source in runnable:
+                results[source.source_id] = self._run_source(source)
+        elapsed = time.perf_counter() - started
+        results = {source.source_id: results[source.source_id] for source in self.sources}
 
         # Log summary
         successful = sum(1 for r in results.values() if r["status"] == "success")
         failed = sum(1 for r in results.values() if r["status"] == "error")
+        skipped = sum(1 for r in results.values() if r["status"] == "skipped")
+        deferred = sum(1 for r in results.values() if r["status"] == "deferred")
+
+        not_modified = sum(
+            1
+            for r in results.values()
+            if r["status"] == "success"
+            and r.get("stats", {}).get("cache_status") == "not_modified"
+        )
+        unchanged = sum(
+            1
+            for r in results.values()
+            if r["status"] == "success"
+            and r.get("stats", {}).get("cache_status") == "unchanged"
+        )
 
         console.print(f"\n[bold]Collection Summary:[/bold]")
         console.print(f"  Successful: {successful}")
+        if not_modified > 0:
+            console.print(f"  Not modified (HTTP 304): {not_modified}", style="dim")
+        if unchanged > 0:
+            console.print(f"  Unchanged content: {unchanged}", style="dim")
         if failed > 0:
             console.print(f"  Failed: {failed}", style="red")
+        if skipped > 0:
+            console.print(f"  Skipped (circuit open): {skipped}", style="yellow")
+        if deferred > 0:
+            console.print(f"  Deferred (refreshed recently): {deferred}", style="dim")
+        self._print_breaker_summary(results, breaker)
 
         # Calculate totals
         total_found = sum(
@@ -144,12 +247,190 @@ class SourceCollector:
             if r["status"] == "success"
         )
 
+        total_prefiltered = sum(
+            r.get("stats", {}).get("prefiltered", 0)
+            for r in results.values()
+            if r["status"] == "success"
+        )
+
         console.print(f"  Total seminars found: {total_found}")
         console.print(f"  Total added: {total_added}")
         console.print(f"  Total updated: {total_updated}")
+        if total_prefiltered > 0:
+            console.print(f"  Total pre-filtered: {total_prefiltered}", style="dim")
+        if runnable:
+            console.print(f"  Collection time: {elapsed:.1f}s (predicted {predicted:.1f}s)")
+
+        # Sources that kept their rows without parsing did not re-list their
+        # candidates, but have not dropped them either
+        kept = [
+            source_id
+            for source_id, r in results.items()
+            if r["status"] == "deferred" or r.get("stats", {}).get("cache_status")
+        ]
+        self.database.touch_rejected_seminars(kept)
+        pruned = self.database.prune_rejected_seminars(self.rejected_retention_days)
+        if pruned > 0:
+            console.print(f"  Expired rejected candidates: {pruned}", style="dim")
 
         return results
 
+    def refilter_rejected(self) -> int:
+        """
+        Re-apply the current filter config to stored rejected candidates.
+
+        Candidates that now pass are promoted into the seminars table. Nothing
+        is fetched, so this is safe to run right after editing settings.toml.
+
+        Returns:
+            Number of candidates promoted
+        """
+        sources = {source.source_id: source for source in self.sources}
+        by_source: dict[str, list[Seminar]] = {}
+        for seminar in self.database.get_rejected_seminars():
+            by_source.setdefault(seminar.source_id, []).append(seminar)
+
+        promoted: list[Seminar] = []
+        for source_id, candidates in by_source.items():
+            source = sources.get(source_id)
+            if source is None:
+                # Source removed or disabled - leave its candidates to expire
+                continue
+            if self.keyword_filter and source.require_keywords:
+                accepted, _ = self.keyword_filter.filter_seminars(candidates)
+            else:
+                accepted = candidates
+            if accepted:
+                console.print(f"  {source.name}: {len(accepted)} now match", style="green")
+            promoted.extend(accepted)
+
+        if promoted:
+            self.database.upsert_many(promoted)
+            self.database.delete_rejected_seminars([seminar.id for seminar in promoted])
+
+        total = sum(len(candidates) for candidates in by_source.values())
+        console.print(f"  Promoted {len(promoted)} of {total} rejected candidate(s)")
+        return len(promoted)
+
+    def _schedule(self) -> tuple[list[BaseSource], dict[str, dict[str, Any]]]:
+        """
+        Split the sources into those due for a refresh and those refreshed recently.
+
+        Returns:
+            (sources to run, 'deferred' results for the others by source_id)
+        """
+        scheduler = RefreshScheduler(self.database, self.collection_config)
+        now = datetime.utcnow()
+        due = []
+        deferred: dict[str, dict[str, Any]] = {}
+        for source in self.sources:
+            decision = scheduler.decide(source, now)
+            if decision.due:
+                due.append(source)
+                continue
+            next_refresh_at = decision.next_refresh_at
+            deferred[source.source_id] = {
+                "status": "deferred",
+                "next_refresh_at": next_refresh_at.isoformat(),
+            }
+            console.print(
+                f"  [dim]Deferring {source.name}: refreshed "
+                f"{(now - decision.last_refresh).total_seconds() / 3600:.1f}h ago, "
+                f"due at {next_refresh_at:%Y-%m-%d %H:%M} UTC[/dim]"
+            )
+        return due, deferred
+
+    def _run_source(self, source: BaseSource) -> dict[str, Any]:
+        """Run a single source, converting failures into an error result."""
+        # A source probed after its cooldown gets a single request attempt
+        state = self.breaker_states.get(source.source_id)
+        probe = state is not None and state.state == CircuitState.HALF_OPEN
+        try:
+            stats = source.run(max_attempts=1 if probe else None)
+            return {"status": "success", "stats": stats}
+        except Exception as e:
+            # Don't let one failure stop the other sources
+            console.print(f"  [red]Source {source.source_id} failed: {e}[/red]")
+            return {"status": "error", "error": str(e)}
+        finally:
+            # Keep seminars.db complete on disk even if a later source kills the run
+            self.database.checkpoint()
+
+    def _skip_source(self, source: BaseSource, state: BreakerState) -> dict[str, Any]:
+        """Record a skipped run for a source whose circuit is open."""
+        message = (
+            f"Circuit open after {state.failures} consecutive failures, "
+            f"next probe at {state.next_probe_at:%Y-%m-%d %H:%M} UTC"
+        )
+        run_id = self.database.start_source_run(source.source_id)
+        self.database.complete_source_run(
+            run_id, SourceRunStatus.SKIPPED.value, error_message=message
+        )
+        return {"status": "skipped", "error": message}
+
+    def _print_breaker_summary(
+        self, results: dict[str, dict[str, Any]], breaker: CircuitBreaker
+    ) -> None:
+        """Print the circuit state of every source that is failing repeatedly."""
+        lines = []
+        for source_id, state in self.breaker_states.items():
+            status = results[source_id]["status"]
+            failures = state.failures + (status == "error")
+            if status == "success":
+                if state.state == CircuitState.HALF_OPEN:
+                    lines.append(f"{source_id}: probe succeeded, circuit closed")
+                continue
+            if status == "skipped":
+                next_probe_at = state.next_probe_at
+            elif breaker.threshold > 0 and failures >= breaker.threshold:
+                next_probe_at = datetime.utcnow() + breaker.cooldown
+            else:
+                continue
+            lines.append(
+                f"{source_id}: open, {failures} failure(s) in a row, "
+                f"next probe at {next_probe_at:%Y-%m-%d %H:%M} UTC"
+            )
+
+        if lines:
+            console.print("  Circuit breaker:", style="yellow")
+            for line in lines:
+                console.print(f"    {line}", style="dim")
+
+    def _collect_concurrently(self, sources: list[BaseSource]) -> dict[str, dict[str, Any]]:
+        """
+        Run sources on a worker pool, capping how many hit the same host at once.
+
+        Sources are dispatched in the order given, each only once a worker is
+        free and its host is below max_per_host; a source finishing frees its
+        worker for the next source that can start, which may be on another
+        host. Waiting for a host slot thus never ties up a worker.
+
+        Returns:
+            Results keyed by source_id, in the order of `sources`
+        """
+        console.print(
+            f"  [dim]Using {self.max_workers} workers "
+            f"(max {self.max_per_host} per host)[/dim]"
+        )
+        pending = list(sources)
+        active: Counter[str] = Counter()
+        running: dict[Future, BaseSource] = {}
+        results: dict[str, dict[str, Any]] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="source"
+        ) as executor:
+            while pending or running:
+                free_workers = self.max_workers - len(running)
+                for source in take_dispatchable(pending, active, free_workers, self.max_per_host):
+                    running[executor.submit(self._run_source, source)] = source
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    source = running.pop(future)
+                    if source.host:
+                        active[source.host] -= 1
+                    results[source.source_id] = future.result()
+        return {source.source_id: results[source.source_id] for source in sources}
+
 
 def collect_seminars(base_dir: Path | None = None) -> dict[str, dict[str, Any]]:
     """
@@ -169,18 +450,23 @@ def collect_seminars(base_dir: Path | None = None) -> dict[str, dict[str, Any]]:
     settings_config = toml.load(config_dir / "settings.toml")
 
     # Initialize database
-    db_path = base_dir / settings_config.get("database", {}).get("path", "data/seminars.db")
-    database = SeminarDatabase(db_path)
-
-    # Create collector and run
-    collector = SourceCollector(
-        sources_config=sources_config,
-        settings_config=settings_config,
-        database=database,
-        base_dir=base_dir,
+    database_config = settings_config.get("database", {})
+    db_path = base_dir / database_config.get("path", "data/seminars.db")
+    database = SeminarDatabase(
+        db_path, database_config, base_dir / "data" / "excluded_events.toml"
     )
 
-    return collector.collect_all()
+    # Create collector and run
+    try:
+        collector = SourceCollector(
+            sources_config=sources_config,
+            settings_config=settings_config,
+            database=database,
+            base_dir=base_dir,
+        )
+        return collector.collect_all()
+    finally:
+        database.close()
 
 
 if __name__ == "__main__":
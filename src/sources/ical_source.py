@@ -4,7 +4,6 @@
 from datetime import datetime, timedelta
 from typing import Any
 
-import pytz
 from icalendar import Calendar
 
 from src.core.models import Seminar
@@ -22,7 +21,7 @@ class ICalSource(BaseSource):
             console.print("    [yellow]No URL configured[/yellow]")
             return []
 
-        response = self._make_request(self.url)
+        response = self._make_request(self.url, conditional=True)
 
         try:
             cal = Calendar.from_ical(response.content)
@@ -71,6 +70,10 @@ class ICalSource(BaseSource):
 
         # Get description
         description = str(event.get("description", "")).strip() or None
+        if not self._passes_prefilter(
+            title, description[:MAX_DESCRIPTION_LENGTH] if description else None
+        ):
+            return None
 
         # Get URL - check explicit field first, then look in description
         url = str(event.get("url", "")).strip() or None
@@ -122,8 +125,6 @@ class ICalSource(BaseSource):
             # It's a date object, convert to datetime at midnight
             return datetime(dt.year, dt.month, dt.day, 0, 0, 0)
 
-        # If timezone-aware, convert to UTC then to naive
-        if dt.tzinfo is not None:
-            dt = dt.astimezone(pytz.UTC).replace(tzinfo=None)
-
+        # Timezone-aware values are kept aware; Seminar converts them to
+        # wall-clock time in the source's timezone
         return dt
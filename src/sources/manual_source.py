@@ -9,7 +9,7 @@ import toml
 
 from src.core.keyword_filter import KeywordFilter
 from src.core.models import AccessRestriction, Seminar
-from src.core.utils import console, parse_datetime
+from src.core.utils import console
 
 from .base import BaseSource
 
@@ -108,5 +108,5 @@ class ManualSource(BaseSource):
         )
 
     def _parse_datetime(self, dt_str: str) -> datetime | None:
-        """Parse datetime string using shared utility."""
-        return parse_datetime(dt_str)
+        """Parse datetime string with this source's parser."""
+        return self.datetime_parser.parse(dt_str)
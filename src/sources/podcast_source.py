@@ -2,16 +2,19 @@
 """Fetch recent podcast episodes from RSS feeds."""
 
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from typing import Any
 
 from src.core.keyword_filter import KeywordFilter
 from src.core.models import Seminar
-from src.core.utils import DEFAULT_DAYS_BEHIND, console
+from src.core.utils import DEFAULT_DAYS_BEHIND, console, html_to_text
 
 from .base import BaseSource
 
+# Characters of episode show notes kept in the description
+EPISODE_NOTES_LENGTH = 1500
+
 
 class PodcastSource(BaseSource):
     """Fetch recent podcast episodes from RSS feeds."""
@@ -34,7 +37,7 @@ class PodcastSource(BaseSource):
             console.print("    [yellow]No URL configured[/yellow]")
             return []
 
-        response = self._make_request(self.url)
+        response = self._make_request(self.url, conditional=True)
 
         try:
             root = ET.fromstring(response.content)
@@ -43,7 +46,7 @@ class PodcastSource(BaseSource):
             return []
 
         seminars = []
-        cutoff_date = datetime.utcnow() - timedelta(days=self.days_back)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.days_back)
 
         # Find channel element
         channel = root.find("channel")
@@ -85,8 +88,9 @@ class PodcastSource(BaseSource):
 
         try:
             pub_date = parsedate_to_datetime(pub_date_str)
-            # Convert to naive datetime in UTC
-            pub_date = pub_date.replace(tzinfo=None)
+            # A -0000 offset parses as naive; treat it as UTC
+            if pub_date.tzinfo is None:
+                pub_date = pub_date.replace(tzinfo=timezone.utc)
         except (ValueError, TypeError):
             return None
 
@@ -102,10 +106,8 @@ class PodcastSource(BaseSource):
         if content_encoded and len(content_encoded) > len(description):
             description = content_encoded
 
-        # Strip HTML tags from description
-        import re
-        description = re.sub(r"<[^>]+>", " ", description)
-        description = re.sub(r"\s+", " ", description).strip()
+        # Convert to text, stopping at the length kept below
+        description = html_to_text(description, EPISODE_NOTES_LENGTH)
 
         # Get episode URL (link or enclosure)
         url = item.findtext("link", "")
@@ -122,7 +124,7 @@ class PodcastSource(BaseSource):
         if duration:
             full_desc += f" Duration: {duration}"
         if description:
-            full_desc += f"\n\n{description[:1500]}"
+            full_desc += f"\n\n{description}"
 
         return Seminar(
             source_id=self.source_id,
@@ -2,14 +2,14 @@
 """RSS feed parser for NIH VideoCast and similar sources."""
 
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from html import unescape
 from typing import Any
 
 import feedparser
 
 from src.core.models import AccessRestriction, Seminar
-from src.core.utils import MAX_DESCRIPTION_LENGTH, console, parse_datetime
+from src.core.utils import MAX_DESCRIPTION_LENGTH, console, html_to_text
 
 from .base import BaseSource
 
@@ -23,7 +23,7 @@ class RSSSource(BaseSource):
             console.print("    [yellow]No URL configured[/yellow]")
             return []
 
-        response = self._make_request(self.url)
+        response = self._make_request(self.url, conditional=True)
         feed = feedparser.parse(response.content)
 
         if feed.bozo and feed.bozo_exception:
@@ -69,7 +69,10 @@ class RSSSource(BaseSource):
 
         # Get description and clean it
         description = entry.get("description", "") or entry.get("summary", "")
-        description = self._clean_html(description)
+        description = html_to_text(description, MAX_DESCRIPTION_LENGTH) or None
+
+        if not self._passes_prefilter(title, description):
+            return None
 
         # Extract datetime - NIH VideoCast uses various formats
         start_datetime = self._extract_datetime(entry)
@@ -91,7 +94,7 @@ class RSSSource(BaseSource):
         return Seminar(
             source_id=self.source_id,
             title=title,
-            description=description[:MAX_DESCRIPTION_LENGTH] if description else None,
+            description=description,
             url=url,
             start_datetime=start_datetime,
             timezone=self.default_timezone,
@@ -117,17 +120,17 @@ class RSSSource(BaseSource):
             if air_date:
                 return air_date
 
-        # Strategy 3: Use published date
+        # Strategy 3: Use published date (feedparser normalizes it to UTC)
         if "published_parsed" in entry and entry["published_parsed"]:
             try:
-                return datetime(*entry["published_parsed"][:6])
+                return datetime(*entry["published_parsed"][:6], tzinfo=timezone.utc)
             except (TypeError, ValueError):
                 pass
 
-        # Strategy 4: Use updated date
+        # Strategy 4: Use updated date (also UTC)
         if "updated_parsed" in entry and entry["updated_parsed"]:
             try:
-                return datetime(*entry["updated_parsed"][:6])
+                return datetime(*entry["updated_parsed"][:6], tzinfo=timezone.utc)
             except (TypeError, ValueError):
                 pass
 
@@ -151,8 +154,8 @@ class RSSSource(BaseSource):
         return None
 
     def _parse_date_string(self, date_str: str) -> datetime | None:
-        """Parse various date string formats using shared utility."""
-        return parse_datetime(date_str)
+        """Parse various date string formats with this source's parser."""
+        return self.datetime_parser.parse(date_str)
 
     def _parse_access_restriction(self, title: str) -> AccessRestriction:
         """Determine access restriction from title."""
@@ -178,19 +181,3 @@ class RSSSource(BaseSource):
                 elif isinstance(val, str):
                     return val
         return None
-
-    def _clean_html(self, text: str) -> str:
-        """Remove HTML tags and clean up text."""
-        if not text:
-            return ""
-
-        # Unescape HTML entities
-        text = unescape(text)
-
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", " ", text)
-
-        # Clean up whitespace
-        text = " ".join(text.split())
-
-        return text.strip()
@@ -0,0 +1,182 @@
+# GID Seminars - Source Scheduler
+"""Decide which sources to run and in what order, from source_runs history."""
+
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from src.core.database import SeminarDatabase
+
+from .base import BaseSource
+
+# Successful runs per source used to estimate how often it changes
+HISTORY_RUNS = 10
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshDecision:
+    """Whether a source is due, and when it was last refreshed (UTC, naive)."""
+
+    due: bool
+    interval: timedelta
+    last_refresh: datetime | None = None
+
+    @property
+    def next_refresh_at(self) -> datetime | None:
+        return self.last_refresh + self.interval if self.last_refresh else None
+
+
+class RefreshScheduler:
+    """
+    Skip sources that were refreshed recently.
+
+    A source is due once min_refresh_interval hours have passed since its
+    last successful run. With adaptive_refresh, the interval stretches to
+    half the source's estimated time between changes (runs that added,
+    updated or removed something), capped at max_refresh_interval hours, so
+    rarely-changing sources such as quiet calendars and podcasts are
+    fetched less often. Each setting can be overridden per source.
+    """
+
+    def __init__(self, database: SeminarDatabase, config: dict[str, Any]):
+        """
+        Args:
+            database: Database holding the source_runs history
+            config: [collection] settings (min_refresh_interval,
+                adaptive_refresh, max_refresh_interval)
+        """
+        self.config = config
+        self._history = database.get_refresh_history(HISTORY_RUNS)
+
+    def _setting(self, source: BaseSource, key: str, default: Any) -> Any:
+        """Look up a setting in the source config, then [collection], then the default."""
+        return source.config.get(key, self.config.get(key, default))
+
+    def refresh_interval(self, source: BaseSource) -> timedelta:
+        """Minimum time between two refreshes of a source."""
+        min_interval = timedelta(hours=self._setting(source, "min_refresh_interval", 0))
+        max_interval = timedelta(hours=self._setting(source, "max_refresh_interval", 72))
+        if not self._setting(source, "adaptive_refresh", False):
+            return min_interval
+
+        runs = self._history.get(source.source_id, [])
+        if len(runs) < 2:
+            return min_interval
+
+        # Changes seen by each run after the oldest, over the time they cover;
+        # counting one more change than seen keeps a quiet history from
+        # stretching the interval beyond what it covers
+        span = runs[0][0] - runs[-1][0]
+        changes = sum(changed for _, changed in runs[:-1])
+        interval = span / (changes + 1) / 2
+        return max(min_interval, min(interval, max_interval))
+
+    def decide(self, source: BaseSource, now: datetime | None = None) -> RefreshDecision:
+        """Decide whether a source is due for a run starting at `now` (UTC)."""
+        interval = self.refresh_interval(source)
+        runs = self._history.get(source.source_id)
+        if not runs:
+            return RefreshDecision(True, interval)
+
+        last_refresh = runs[0][0]
+        due = (now or datetime.utcnow()) - last_refresh >= interval
+        return RefreshDecision(due, interval, last_refresh)
+
+
+def expected_durations(
+    sources: list[BaseSource], durations: dict[str, float]
+) -> dict[str, float]:
+    """
+    Expected run time of each source, in seconds.
+
+    Sources without history are assumed to take the mean of the others.
+    """
+    known = [durations[source.source_id] for source in sources if source.source_id in durations]
+    default = sum(known) / len(known) if known else 0.0
+    return {source.source_id: durations.get(source.source_id, default) for source in sources}
+
+
+def order_longest_first(
+    sources: list[BaseSource], durations: dict[str, float]
+) -> list[BaseSource]:
+    """
+    Order sources for dispatch to a worker pool, slowest first.
+
+    Starting the long runs (ISRV detail pages, Bluesky searches) first lets
+    the short ones fill the remaining workers around them instead of a long
+    run starting last and setting the total time on its own.
+    """
+    expected = expected_durations(sources, durations)
+    return sorted(sources, key=lambda source: expected[source.source_id], reverse=True)
+
+
+def take_dispatchable(
+    pending: list[BaseSource],
+    active: Counter[str],
+    free_workers: int,
+    max_per_host: int,
+) -> list[BaseSource]:
+    """
+    Take the sources to start now off the front of a dispatch queue.
+
+    Sources start in queue order while workers are free, skipping any whose
+    host already has max_per_host sources running, so a busy host never
+    holds a worker that another host's source could use.
+
+    Args:
+        pending: Sources not yet started, in dispatch order; started ones
+            are removed
+        active: Running sources per host; started ones are counted
+        free_workers: Number of idle workers
+        max_per_host: Maximum sources running against one host
+
+    Returns:
+        Sources to start, in order
+    """
+    started = []
+    for source in list(pending):
+        if len(started) >= free_workers:
+            break
+        if source.host and active[source.host] >= max_per_host:
+            continue
+        pending.remove(source)
+        if source.host:
+            active[source.host] += 1
+        started.append(source)
+    return started
+
+
+def predict_total_time(
+    sources: list[BaseSource],
+    durations: dict[str, float],
+    max_workers: int,
+    max_per_host: int,
+) -> float:
+    """
+    Predict the wall-clock time of running sources in the given order.
+
+    Replays the collector's dispatch: whenever a source finishes, the
+    sources take_dispatchable() picks are started on the free workers.
+
+    Returns:
+        Predicted seconds from the first dispatch to the last completion
+    """
+    expected = expected_durations(sources, durations)
+    max_workers = max(1, max_workers)
+    pending = list(sources)
+    active: Counter[str] = Counter()
+    # (end time, dispatch number, host) of each running source
+    running: list[tuple[float, int, str | None]] = []
+    dispatched = 0
+    now = 0.0
+    while pending or running:
+        free_workers = max_workers - len(running)
+        for source in take_dispatchable(pending, active, free_workers, max_per_host):
+            heapq.heappush(running, (now + expected[source.source_id], dispatched, source.host))
+            dispatched += 1
+        now, _, host = heapq.heappop(running)
+        if host:
+            active[host] -= 1
+    return now
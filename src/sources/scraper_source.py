@@ -9,7 +9,15 @@ from bs4 import BeautifulSoup
 
 from src.core.keyword_filter import KeywordFilter
 from src.core.models import Seminar
-from src.core.utils import MAX_TITLE_LENGTH, console, parse_datetime
+from src.core.utils import (
+    MAX_TITLE_LENGTH,
+    TIME_KINDS,
+    DateTimeMention,
+    console,
+    extract_datetime_mentions,
+    mention_to_datetime,
+    nearest_mention,
+)
 
 from .base import BaseSource
 
@@ -17,6 +25,11 @@ from .base import BaseSource
 class ScraperSource(BaseSource):
     """Scrape seminars from HTML pages."""
 
+    # Scraper types that read each event from its own detail page. The
+    # listing alone does not show changes (or failed fetches) on those
+    # pages, so they are always fetched and parsed in full
+    DETAIL_PAGE_TYPES = frozenset({"isrv"})
+
     def __init__(
         self,
         source_id: str,
@@ -29,7 +42,7 @@ class ScraperSource(BaseSource):
         self.scraper_type = config.get("scraper_type", "generic")
 
         # Override with browser-like headers for scraping
-        self.session.headers.update({
+        self.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
@@ -41,7 +54,9 @@ class ScraperSource(BaseSource):
             console.print("    [yellow]No URL configured[/yellow]")
             return []
 
-        response = self._make_request(self.url)
+        response = self._make_request(
+            self.url, conditional=self.scraper_type not in self.DETAIL_PAGE_TYPES
+        )
         soup = BeautifulSoup(response.content, "html.parser")
 
         # Route to appropriate scraper based on type
@@ -107,35 +122,14 @@ class ScraperSource(BaseSource):
                 block_text = ""
 
             # Extract date and time from the block
-            date_str = None
-            time_str = None
+            start_datetime = self._first_datetime(extract_datetime_mentions(block_text))
             presenter = None
 
-            # Look for date pattern
-            date_match = re.search(
-                r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}",
-                block_text, re.IGNORECASE
-            )
-            if date_match:
-                date_str = date_match.group(0)
-
-            # Look for time pattern
-            time_match = re.search(r"(\d{1,2}:\d{2}\s*(AM|PM))", block_text, re.IGNORECASE)
-            if time_match:
-                time_str = time_match.group(1)
-
             # Look for presenter
             presenter_match = re.search(r"Presenter:\s*([^\n]+)", block_text, re.IGNORECASE)
             if presenter_match:
                 presenter = presenter_match.group(1).strip()
 
-            # Parse datetime
-            if date_str:
-                dt_str = f"{date_str} {time_str}".strip() if time_str else date_str
-                start_datetime = self._parse_datetime(dt_str)
-            else:
-                start_datetime = None
-
             if not start_datetime:
                 # Skip entries without dates
                 continue
@@ -169,23 +163,8 @@ class ScraperSource(BaseSource):
         if not title:
             return None
 
-        # Try to extract date
-        date_match = re.search(
-            r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}",
-            text, re.IGNORECASE
-        )
-
-        start_datetime = None
-        if date_match:
-            date_str = date_match.group(0)
-            # Also look for time
-            time_match = re.search(r"(\d{1,2}:\d{2})\s*(AM|PM)", text, re.IGNORECASE)
-            if time_match:
-                time_str = time_match.group(0)
-                start_datetime = self._parse_datetime(f"{date_str} {time_str}")
-            else:
-                start_datetime = self._parse_datetime(date_str)
-
+        # Try to extract date and time
+        start_datetime = self._first_datetime(extract_datetime_mentions(text))
         if not start_datetime:
             return None
 
@@ -217,23 +196,16 @@ class ScraperSource(BaseSource):
         """Parse webinars from page text content."""
         seminars = []
 
-        # Pattern for IAS-USA webinar entries:
-        # Title followed by date and time
-        pattern = r"([A-Z][^:\n]{20,200})\s*(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}"
-
-        # Find all date occurrences and work backwards to find titles
-        date_pattern = r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})"
-        time_pattern = r"(\d{1,2}:\d{2})\s*(AM|PM)\s*(?:–|-)\s*(\d{1,2}:\d{2})\s*(AM|PM)\s*(PT|ET|CT|MT)?"
-
-        for date_match in re.finditer(date_pattern, text, re.IGNORECASE):
-            date_str = date_match.group(0)
-            pos = date_match.start()
+        # IAS-USA webinar entries are a title followed by date and time, so
+        # find all dates and work backwards to find titles
+        mentions = extract_datetime_mentions(text)
+        for date in mentions:
+            if date.kind != "date" or date.year is None:
+                continue
+            pos = date.start
 
             # Look for time after the date
-            time_match = re.search(time_pattern, text[pos:pos+100], re.IGNORECASE)
-            time_str = ""
-            if time_match:
-                time_str = f"{time_match.group(1)} {time_match.group(2)}"
+            time = nearest_mention(mentions, date.end, max_distance=100, forward_only=True)
 
             # Look for title before the date (find the previous block of text)
             preceding_text = text[max(0, pos-300):pos]
@@ -249,10 +221,7 @@ class ScraperSource(BaseSource):
             if not title:
                 continue
 
-            # Parse datetime
-            dt_str = f"{date_str} {time_str}".strip()
-            start_datetime = self._parse_datetime(dt_str)
-
+            start_datetime = mention_to_datetime(date, time)
             if not start_datetime:
                 continue
 
@@ -306,24 +275,15 @@ class ScraperSource(BaseSource):
                     except ValueError:
                         pass
 
-            # Fallback: extract from text
+            # Fallback: extract from text; year-less dates are upcoming
             if not start_datetime:
                 card_text = card.get_text(separator=" ", strip=True)
-                date_match = re.search(
-                    r"(\d{1,2})\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)",
-                    card_text, re.IGNORECASE
+                date = next(
+                    (m for m in extract_datetime_mentions(card_text) if m.kind == "date"),
+                    None,
                 )
-                if date_match:
-                    day = date_match.group(1)
-                    month = date_match.group(2)
-                    current_year = datetime.now().year
-                    try:
-                        dt = datetime.strptime(f"{day} {month} {current_year}", "%d %b %Y")
-                        if dt < datetime.now():
-                            dt = datetime.strptime(f"{day} {month} {current_year + 1}", "%d %b %Y")
-                        start_datetime = dt
-                    except ValueError:
-                        pass
+                if date:
+                    start_datetime = mention_to_datetime(date, past_days=0)
 
             # Check if it's a webinar
             card_text = card.get_text(separator=" ", strip=True).lower()
@@ -392,17 +352,16 @@ class ScraperSource(BaseSource):
 
             # Get time
             time_elem = event_div.find("p", string=re.compile(r"Time:"))
-            if time_elem:
-                time_match = re.search(r"(\d{1,2}:\d{2}\s*(AM|PM))", time_elem.get_text(), re.IGNORECASE)
-                if time_match and start_datetime:
-                    time_str = time_match.group(1)
-                    try:
-                        time_obj = datetime.strptime(time_str, "%I:%M %p")
-                        start_datetime = start_datetime.replace(
-                            hour=time_obj.hour, minute=time_obj.minute
-                        )
-                    except ValueError:
-                        pass
+            if time_elem and start_datetime:
+                time = next(
+                    (
+                        m for m in extract_datetime_mentions(time_elem.get_text())
+                        if m.kind in TIME_KINDS
+                    ),
+                    None,
+                )
+                if time:
+                    start_datetime = start_datetime.replace(hour=time.hour, minute=time.minute)
 
             # Get location
             location_elem = event_div.find("p", class_="subtitle")
@@ -468,25 +427,9 @@ class ScraperSource(BaseSource):
             date_text = date_span.get_text(strip=True) if date_span else ""
 
             # Parse date - can be single or range
-            start_datetime = None
-            end_datetime = None
-
-            # Check for date range first
-            range_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})", date_text)
-            if range_match:
-                try:
-                    start_datetime = datetime.strptime(range_match.group(1), "%m/%d/%Y")
-                    end_datetime = datetime.strptime(range_match.group(2), "%m/%d/%Y")
-                except ValueError:
-                    pass
-            else:
-                # Single date
-                date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", date_text)
-                if date_match:
-                    try:
-                        start_datetime = datetime.strptime(date_match.group(1), "%m/%d/%Y")
-                    except ValueError:
-                        pass
+            dates = [m for m in extract_datetime_mentions(date_text) if m.kind == "date"]
+            start_datetime = mention_to_datetime(dates[0]) if dates else None
+            end_datetime = mention_to_datetime(dates[1]) if len(dates) > 1 else None
 
             if not start_datetime:
                 continue
@@ -572,50 +515,20 @@ class ScraperSource(BaseSource):
             container_text = re.sub(r"\s+", " ", container_text)
             container_text = re.sub(r"\s*,\s*", ", ", container_text)
 
-            # Extract title - first line before the date
-            title = None
-            date_match = re.search(
-                r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)",
-                container_text, re.IGNORECASE
+            # Date is in the form "Tuesday, January 20, 2026"; the title is
+            # the substantial text before it
+            mentions = extract_datetime_mentions(container_text)
+            date = next(
+                (m for m in mentions if m.kind == "date" and m.year is not None), None
             )
-            if date_match:
-                pre_text = container_text[:date_match.start()].strip()
-                # Title is the substantial text before the day of week
-                if len(pre_text) > 10:
-                    title = pre_text
-
-            if not title or len(title) < 10:
+            if not date:
+                continue
+            title = container_text[:date.start].strip()
+            if len(title) < 10:
                 continue
 
-            # Extract date - format in text: "Tuesday, January 20, 2026"
-            # Note: page has date split across elements, so we need to handle spacing
-            date_match = re.search(
-                r"(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s*(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})\s*,?\s*(\d{4})",
-                container_text, re.IGNORECASE
-            )
-
-            start_datetime = None
-            if date_match:
-                month = date_match.group(1)
-                day = date_match.group(2)
-                year = date_match.group(3)
-                date_str = f"{month} {day}, {year}"
-
-                # Look for time - format: "12:00PM" or "12:00 PM"
-                time_match = re.search(r"(\d{1,2}:\d{2})\s*(AM|PM)", container_text, re.IGNORECASE)
-                if time_match:
-                    time_str = f"{time_match.group(1)} {time_match.group(2)}"
-                    try:
-                        start_datetime = datetime.strptime(f"{date_str} {time_str}", "%B %d, %Y %I:%M %p")
-                    except ValueError:
-                        pass
-
-                if not start_datetime:
-                    try:
-                        start_datetime = datetime.strptime(date_str, "%B %d, %Y")
-                    except ValueError:
-                        pass
-
+            # Time is the nearest one, e.g. "12:00PM - 1:00PM"
+            start_datetime = mention_to_datetime(date, nearest_mention(mentions, date.end))
             if not start_datetime:
                 continue
 
@@ -713,73 +626,17 @@ class ScraperSource(BaseSource):
         if not title or len(title) < 5:
             return None
 
-        # Extract date - look for patterns like "28 January 2026" or "January 28, 2026"
-        start_datetime = None
-
-        # Pattern 1: "28 January 2026"
-        date_match = re.search(
-            r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})",
-            text, re.IGNORECASE
-        )
-        if date_match:
-            day = date_match.group(1)
-            month = date_match.group(2)
-            year = date_match.group(3)
-            date_str = f"{month} {day}, {year}"
-            try:
-                start_datetime = datetime.strptime(date_str, "%B %d, %Y")
-            except ValueError:
-                pass
-
-        # Pattern 2: "January 28, 2026"
-        if not start_datetime:
-            date_match = re.search(
-                r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})",
-                text, re.IGNORECASE
-            )
-            if date_match:
-                month = date_match.group(1)
-                day = date_match.group(2)
-                year = date_match.group(3)
-                date_str = f"{month} {day}, {year}"
-                try:
-                    start_datetime = datetime.strptime(date_str, "%B %d, %Y")
-                except ValueError:
-                    pass
-
-        # Pattern 3: Date range "28-30 January 2026"
-        if not start_datetime:
-            date_match = re.search(
-                r"(\d{1,2})[-–]\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})",
-                text, re.IGNORECASE
-            )
-            if date_match:
-                day = date_match.group(1)
-                month = date_match.group(2)
-                year = date_match.group(3)
-                date_str = f"{month} {day}, {year}"
-                try:
-                    start_datetime = datetime.strptime(date_str, "%B %d, %Y")
-                except ValueError:
-                    pass
+        # Extract date - e.g. "28 January 2026", "January 28, 2026" or "28-30 January 2026"
+        mentions = extract_datetime_mentions(text)
+        date = next((m for m in mentions if m.kind == "date" and m.year is not None), None)
+        if not date:
+            return None
 
+        # Use the time nearest the date, if there is one
+        start_datetime = mention_to_datetime(date, nearest_mention(mentions, date.end))
         if not start_datetime:
             return None
 
-        # Extract time if available
-        time_match = re.search(r"(\d{1,2}(?::\d{2})?)\s*(am|pm)", text, re.IGNORECASE)
-        if time_match and start_datetime:
-            time_str = time_match.group(0)
-            try:
-                # Handle formats like "9am" or "9:00am"
-                if ":" in time_str:
-                    time_obj = datetime.strptime(time_str.upper(), "%I:%M%p")
-                else:
-                    time_obj = datetime.strptime(time_str.upper(), "%I%p")
-                start_datetime = start_datetime.replace(hour=time_obj.hour, minute=time_obj.minute)
-            except ValueError:
-                pass
-
         # Check if online/webinar
         is_online = "webinar" in text.lower() or "online" in text.lower() or "zoom" in text.lower()
         location = "Online" if is_online else None
@@ -833,6 +690,9 @@ class ScraperSource(BaseSource):
 
         return "https://www.iasusa.org/activities/webinars/upcoming-webinars/"
 
-    def _parse_datetime(self, dt_str: str) -> datetime | None:
-        """Parse various datetime formats using shared utility."""
-        return parse_datetime(dt_str)
+    def _first_datetime(self, mentions: list[DateTimeMention]) -> datetime | None:
+        """Combine the first dated mention with the time nearest to it."""
+        date = next((m for m in mentions if m.kind == "date" and m.year is not None), None)
+        if not date:
+            return None
+        return mention_to_datetime(date, nearest_mention(mentions, date.end))
@@ -3,6 +3,7 @@
 
 from datetime import datetime
 from typing import Any
+from urllib.parse import urlparse
 
 from src.core.keyword_filter import KeywordFilter
 from src.core.models import Seminar
@@ -28,6 +29,11 @@ class WHOSource(BaseSource):
         super().__init__(source_id, config, database, http_config, keyword_filter)
         self.max_events = config.get("max_events", 50)
 
+    @property
+    def host(self) -> str | None:
+        """WHO events come from a fixed API endpoint."""
+        return urlparse(self.API_URL).hostname
+
     def fetch_seminars(self) -> list[Seminar]:
         """Fetch upcoming events from WHO API."""
         # Build API request
@@ -38,7 +44,7 @@ class WHOSource(BaseSource):
         }
 
         # Set JSON accept header
-        self.session.headers.update({"Accept": "application/json"})
+        self.headers["Accept"] = "application/json"
 
         try:
             response = self._make_request(self.API_URL, params=params)
@@ -73,20 +79,23 @@ class WHOSource(BaseSource):
         if start_str:
             try:
                 start_datetime = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-                start_datetime = start_datetime.replace(tzinfo=None)
             except ValueError:
                 pass
 
         if end_str:
             try:
                 end_datetime = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
-                end_datetime = end_datetime.replace(tzinfo=None)
             except ValueError:
                 pass
 
         if not start_datetime:
             return None
 
+        # Get description/summary
+        description = (event.get("Summary") or "").strip() or None
+        if not self._passes_prefilter(title, description):
+            return None
+
         # Build URL - prefer ItemDefaultUrl (includes date path), fall back to UrlName
         item_url = event.get("ItemDefaultUrl", "")
         url_name = event.get("UrlName", "")
@@ -106,9 +115,6 @@ class WHOSource(BaseSource):
         # Get location
         location = (event.get("Location") or "").strip() or "Online/Geneva"
 
-        # Get description/summary
-        description = (event.get("Summary") or "").strip() or None
-
         return Seminar(
             source_id=self.source_id,
             title=title,
@@ -0,0 +1,47 @@
+# GID Seminars - Test Fixtures
+"""Shared pytest fixtures."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.core.database import SeminarDatabase
+from src.core.models import Seminar, SourceRunStatus
+
+
+@pytest.fixture
+def database(tmp_path: Path):
+    """A fresh database in a temporary directory, with no exclusion rules."""
+    database = SeminarDatabase(tmp_path / "seminars.db")
+    yield database
+    database.close()
+
+
+def make_seminar(number: int, source_id: str = "test_source", **fields) -> Seminar:
+    """Build a seminar starting `number` hours from now."""
+    return Seminar(
+        source_id=source_id,
+        title=fields.pop("title", f"Seminar {number}"),
+        url=fields.pop("url", f"https://example.org/events/{number}"),
+        start_datetime=datetime.utcnow().replace(microsecond=0) + timedelta(hours=number),
+        **fields,
+    )
+
+
+def record_run(
+    database: SeminarDatabase,
+    source_id: str,
+    status: SourceRunStatus,
+    started_at: datetime,
+    duration: float | None = None,
+    **fields,
+) -> None:
+    """Record a completed source run that started at `started_at` (UTC)."""
+    run_id = database.start_source_run(source_id)
+    database.complete_source_run(run_id, status.value, **fields)
+    with database.connection() as conn:
+        conn.execute(
+            "UPDATE source_runs SET run_started_at = ?, duration_seconds = ? WHERE id = ?",
+            (started_at.isoformat(), duration, run_id),
+        )
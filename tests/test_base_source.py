@@ -0,0 +1,84 @@
+# GID Seminars - Base Source Tests
+"""Tests for BaseSource conditional fetching and run bookkeeping."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.keyword_filter import KeywordFilter
+from src.sources.base import BaseSource
+
+from .conftest import make_seminar
+
+FEED_URL = "https://example.org/feed"
+
+
+class FakeSession:
+    """Answers every request with the same body, or 304 when validators match."""
+
+    def __init__(self, body: bytes = b"<feed/>", etag: str = '"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests: list[dict] = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+        not_modified = self.etag and headers.get("If-None-Match") == self.etag
+        status = 304 if not_modified else 200
+        return SimpleNamespace(
+            status_code=status,
+            content=self.body if status == 200 else b"",
+            headers={"ETag": self.etag},
+            raise_for_status=lambda: None,
+        )
+
+
+class FeedSource(BaseSource):
+    """Source parsing one seminar per matching title out of a fixed feed."""
+
+    titles = ["Malaria seminar", "Economics seminar"]
+
+    def fetch_seminars(self):
+        self._make_request(FEED_URL, conditional=True)
+        return [
+            make_seminar(number, source_id=self.source_id, title=title)
+            for number, title in enumerate(self.titles)
+        ]
+
+
+def make_source(database, session, keywords):
+    source = FeedSource(
+        "feed",
+        {"url": FEED_URL, "rate_limit": 0},
+        database,
+        keyword_filter=KeywordFilter({"keywords": keywords}),
+    )
+    source.session = session
+    return source
+
+
+@pytest.mark.parametrize("etag", ['"v1"', None])
+def test_unchanged_feed_is_skipped(database, etag):
+    session = FakeSession(etag=etag)
+    make_source(database, session, ["malaria"]).run()
+
+    stats = make_source(database, session, ["malaria"]).run()
+    assert stats["cache_status"] == ("not_modified" if etag else "unchanged")
+
+
+@pytest.mark.parametrize("etag", ['"v1"', None])
+def test_unchanged_feed_is_reparsed_after_filter_change(database, etag):
+    session = FakeSession(etag=etag)
+    make_source(database, session, ["malaria"]).run()
+
+    stats = make_source(database, session, ["malaria", "economics"]).run()
+    assert "cache_status" not in stats
+    assert "If-None-Match" not in session.requests[-1]
+    with database.connection() as conn:
+        titles = {row[0] for row in conn.execute("SELECT title FROM seminars")}
+    assert titles == {"Malaria seminar", "Economics seminar"}
+
+    # The new config is now the one on record, so the next run skips again
+    stats = make_source(database, session, ["malaria", "economics"]).run()
+    assert "cache_status" in stats
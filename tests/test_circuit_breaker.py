@@ -0,0 +1,90 @@
+# GID Seminars - Circuit Breaker Tests
+"""Tests for circuit states from run history and single-attempt probes."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+from src.core.exceptions import NetworkError
+from src.core.models import SourceRunStatus
+from src.sources.base import BaseSource
+from src.sources.circuit_breaker import CircuitBreaker, CircuitState
+
+from .conftest import record_run
+
+NOW = datetime(2026, 3, 1, 12, 0)
+CONFIG = {"breaker_threshold": 3, "breaker_cooldown_hours": 6}
+
+
+def record_runs(database, statuses: list[SourceRunStatus], source_id: str = "flaky") -> None:
+    """Record runs an hour apart, the last one at NOW."""
+    for hours_ago, status in zip(range(len(statuses) - 1, -1, -1), statuses):
+        record_run(database, source_id, status, NOW - timedelta(hours=hours_ago))
+
+
+def test_closed_below_threshold(database):
+    record_runs(database, [SourceRunStatus.ERROR, SourceRunStatus.ERROR])
+    state = CircuitBreaker(database, CONFIG).state("flaky", NOW)
+    assert (state.state, state.failures) == (CircuitState.CLOSED, 2)
+
+
+def test_success_resets_the_streak(database):
+    record_runs(database, [SourceRunStatus.ERROR] * 3 + [SourceRunStatus.SUCCESS])
+    assert CircuitBreaker(database, CONFIG).state("flaky", NOW).state == CircuitState.CLOSED
+
+
+@pytest.mark.parametrize(
+    "hours_later, expected",
+    [(1, CircuitState.OPEN), (6, CircuitState.HALF_OPEN), (24, CircuitState.HALF_OPEN)],
+)
+def test_open_until_cooldown_then_half_open(database, hours_later, expected):
+    # Skipped runs neither extend nor break the streak
+    record_runs(
+        database,
+        [SourceRunStatus.SUCCESS, SourceRunStatus.ERROR, SourceRunStatus.ERROR,
+         SourceRunStatus.SKIPPED, SourceRunStatus.ERROR],
+    )
+    state = CircuitBreaker(database, CONFIG).state("flaky", NOW + timedelta(hours=hours_later))
+    assert (state.state, state.failures) == (expected, 3)
+    assert state.next_probe_at == NOW + timedelta(hours=6)
+
+
+def test_threshold_zero_disables_the_breaker(database):
+    record_runs(database, [SourceRunStatus.ERROR] * 5)
+    breaker = CircuitBreaker(database, {**CONFIG, "breaker_threshold": 0})
+    assert breaker.state("flaky", NOW).state == CircuitState.CLOSED
+
+
+class FailingSession:
+    def __init__(self):
+        self.attempts = 0
+
+    def request(self, *args, **kwargs):
+        self.attempts += 1
+        raise requests.ConnectionError("connection refused")
+
+
+class FailingSource(BaseSource):
+    def fetch_seminars(self):
+        self._make_request(self.url)
+        return []
+
+
+def test_probe_run_makes_a_single_attempt(database):
+    source = FailingSource(
+        "flaky",
+        {"url": "https://example.org/feed", "max_retries": 3, "retry_delay_base": 0, "rate_limit": 0},
+        database,
+    )
+    source.session = FailingSession()
+
+    with pytest.raises(NetworkError):
+        source.run(max_attempts=1)
+    assert source.session.attempts == 1
+    assert source.max_retries == 3
+
+    # The next run is back to the configured attempts
+    with pytest.raises(NetworkError):
+        source.run()
+    assert source.session.attempts == 4
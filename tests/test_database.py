@@ -0,0 +1,125 @@
+# GID Seminars - Database Tests
+"""Tests for SeminarDatabase upserts, exclusions and connection handling."""
+
+from pathlib import Path
+
+import pytest
+
+from src.core.database import SeminarDatabase
+from src.core.exceptions import DatabaseError
+
+from .conftest import make_seminar
+
+
+def test_upsert_many_counts(database):
+    first = [make_seminar(i) for i in range(3)]
+    assert database.upsert_many(first) == {"added": 3, "updated": 0, "unchanged": 0}
+
+    changed = make_seminar(1, description="Now with a description")
+    second = [first[0], changed, make_seminar(3)]
+    assert database.upsert_many(second) == {"added": 1, "updated": 1, "unchanged": 1}
+
+
+def test_upsert_many_empty(database):
+    assert database.upsert_many([]) == {"added": 0, "updated": 0, "unchanged": 0}
+
+
+def test_exclusions_apply_without_explicit_call(tmp_path: Path):
+    (tmp_path / "excluded_events.toml").write_text(
+        '[[exclude_title]]\npattern = "^Cancelled"\nreason = "cancelled"\n'
+    )
+    database = SeminarDatabase(tmp_path / "seminars.db")
+    try:
+        database.upsert_many([make_seminar(1, title="Cancelled: talk"), make_seminar(2)])
+        with database.connection() as conn:
+            rows = dict(conn.execute("SELECT title, excluded FROM seminars").fetchall())
+    finally:
+        database.close()
+
+    assert rows == {"Cancelled: talk": 1, "Seminar 2": 0}
+
+
+def test_exclusion_rules_reapplied_when_changed(tmp_path: Path):
+    rules = tmp_path / "excluded_events.toml"
+    database = SeminarDatabase(tmp_path / "seminars.db")
+    database.upsert_many([make_seminar(1, title="Old talk")])
+    assert database.exclusions_update == 0
+    database.close()
+
+    rules.write_text('[[exclude_title]]\npattern = "^Old"\nreason = "old"\n')
+    database = SeminarDatabase(tmp_path / "seminars.db")
+    try:
+        assert database.exclusions_update == 1
+    finally:
+        database.close()
+
+    # Unchanged rules leave the stored verdicts alone
+    database = SeminarDatabase(tmp_path / "seminars.db")
+    try:
+        assert database.exclusions_update is None
+    finally:
+        database.close()
+
+
+def test_checkpoint_folds_wal_into_database(tmp_path: Path):
+    config = {"persistent_connection": True, "journal_mode": "WAL"}
+    database = SeminarDatabase(tmp_path / "seminars.db", config)
+    try:
+        database.upsert_many([make_seminar(i) for i in range(5)])
+        assert (tmp_path / "seminars.db-wal").stat().st_size > 0
+        database.checkpoint()
+        assert (tmp_path / "seminars.db-wal").stat().st_size == 0
+
+        # A copy of the main file alone already holds the batch
+        copy = tmp_path / "copy.db"
+        copy.write_bytes((tmp_path / "seminars.db").read_bytes())
+        with SeminarDatabase(copy).connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM seminars").fetchone()[0] == 5
+    finally:
+        database.close()
+
+
+def test_nested_database_error_is_not_rewrapped(tmp_path: Path):
+    database = SeminarDatabase(tmp_path / "seminars.db", {"persistent_connection": True})
+    try:
+        with pytest.raises(DatabaseError) as excinfo:
+            with database.connection():
+                with database.connection() as conn:
+                    conn.execute("SELECT * FROM missing_table")
+        assert str(excinfo.value).count("Database error") == 1
+    finally:
+        database.close()
+
+
+def test_touched_rejected_candidates_survive_pruning(database):
+    database.save_rejected_seminars(
+        [make_seminar(1, source_id="quiet"), make_seminar(2, source_id="gone")], []
+    )
+    with database.connection() as conn:
+        conn.execute("UPDATE rejected_seminars SET updated_at = '2000-01-01T00:00:00'")
+
+    # "quiet" answered 304 (or was deferred), so its candidates are still listed
+    assert database.touch_rejected_seminars(["quiet"]) == 1
+    assert database.prune_rejected_seminars(30) == 1
+    assert [seminar.source_id for seminar in database.get_rejected_seminars()] == ["quiet"]
+
+
+def test_url_exclusion_only_matches_its_own_query(tmp_path: Path):
+    (tmp_path / "excluded_events.toml").write_text(
+        '[[exclude_url]]\nurl = "https://example.org/events?event=1"\nreason = "duplicate"\n'
+    )
+    database = SeminarDatabase(tmp_path / "seminars.db")
+    try:
+        database.upsert_many([
+            make_seminar(1, url="https://example.org/events?event=1&utm_source=rss"),
+            make_seminar(2, url="https://example.org/events?event=2"),
+        ])
+        with database.connection() as conn:
+            rows = dict(conn.execute("SELECT url, excluded FROM seminars").fetchall())
+    finally:
+        database.close()
+
+    assert rows == {
+        "https://example.org/events?event=1&utm_source=rss": 1,
+        "https://example.org/events?event=2": 0,
+    }
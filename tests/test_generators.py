@@ -0,0 +1,63 @@
+# GID Seminars - Generator Tests
+"""Streaming and materialized snapshots must render the same files."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from src.core.database import SeminarDatabase
+from src.generators import HTMLGenerator, ICSGenerator, JSONGenerator, build_render_snapshot
+
+from .conftest import make_seminar
+
+SETTINGS = {"time_window": {"days_behind": 30, "days_ahead": 90}}
+
+# Lines stamped with the generation time
+GENERATED_AT_LINE = re.compile(r"DTSTAMP|generated", re.IGNORECASE)
+
+
+def render(database, tmp_path: Path, streaming: bool) -> dict[str, list[str]]:
+    snapshot = build_render_snapshot(SETTINGS, database, streaming=streaming)
+    assert snapshot.streaming == streaming
+    files = {}
+    for generator_class, filename in [
+        (ICSGenerator, "seminars.ics"),
+        (HTMLGenerator, "index.html"),
+        (JSONGenerator, "seminars.json"),
+    ]:
+        path = tmp_path / f"{streaming}-{filename}"
+        generator_class(SETTINGS, database).generate(path, snapshot)
+        files[filename] = [
+            line for line in path.read_text().splitlines()
+            if not GENERATED_AT_LINE.search(line)
+        ]
+    return files
+
+
+@pytest.mark.parametrize("persistent", [False, True])
+def test_streaming_renders_the_same_files(tmp_path, persistent):
+    database = SeminarDatabase(
+        tmp_path / "seminars.db", {"persistent_connection": persistent}
+    )
+    try:
+        database.upsert_many(
+            [make_seminar(hours, category="Webinar") for hours in (-48, -2, 3, 30, 400)]
+            + [make_seminar(5, source_id="other_source", description="Details")]
+            # Outside the time window
+            + [make_seminar(24 * 200), make_seminar(-24 * 60)]
+        )
+        materialized = render(database, tmp_path, streaming=False)
+        streamed = render(database, tmp_path, streaming=True)
+    finally:
+        database.close()
+
+    assert streamed == materialized
+    assert any("Seminar 400" in line for line in streamed["index.html"])
+    assert not any("Seminar 4800" in line for line in streamed["seminars.json"])
+
+
+def test_streaming_is_opt_in(database):
+    assert not build_render_snapshot(SETTINGS, database).streaming
+    output = {**SETTINGS, "output": {"stream_rendering": True}}
+    assert build_render_snapshot(output, database).streaming
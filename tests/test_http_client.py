@@ -0,0 +1,85 @@
+# GID Seminars - HTTP Client Tests
+"""Tests for Retry-After parsing and the per-host rate limiters."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src.core import http_client
+from src.core.http_client import RateLimiter, get_rate_limiter, parse_retry_after
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiters(monkeypatch):
+    monkeypatch.setattr(http_client, "_rate_limiters", {})
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(http_client.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(http_client.time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("120", 120.0), (" 5 ", 5.0), ("0", 0.0), (None, None), ("", None), ("soon", None)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 28 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_rate_limiter_allows_a_burst_then_paces(clock):
+    limiter = RateLimiter(rate=2.0, burst=3)
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(0.5)
+
+    # Idle time refills the bucket, up to the burst
+    clock.sleep(10)
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire() == pytest.approx(0.5)
+
+
+def test_get_rate_limiter_shares_per_host_and_keeps_the_strictest_limit(clock):
+    limiter = get_rate_limiter("example.org", 2.0, 4)
+    assert get_rate_limiter("example.org", 0.5, 1) is limiter
+    assert (limiter.rate, limiter.burst) == (0.5, 1)
+
+    # A looser request does not relax the shared limit
+    get_rate_limiter("example.org", 10.0, 8)
+    assert (limiter.rate, limiter.burst) == (0.5, 1)
+
+    # Tokens saved under the old burst are capped to the new one
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(2.0)
+
+    assert get_rate_limiter("other.org", 2.0, 4) is not limiter
+
+
+@pytest.mark.parametrize("host, rate", [(None, 2.0), ("example.org", 0)])
+def test_get_rate_limiter_disabled(host, rate):
+    assert get_rate_limiter(host, rate) is None
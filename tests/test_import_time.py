@@ -0,0 +1,10 @@
+# GID Seminars - Startup Import Tests
+"""Startup must not load source parsers, generators or the deploy package."""
+
+from benchmarks.check_import_time import STARTUP_IMPORTS, eager_modules, measure_imports
+
+
+def test_startup_imports_stay_lazy():
+    # The timing budget is left to benchmarks/check_import_time.py
+    _, modules = measure_imports(STARTUP_IMPORTS)
+    assert eager_modules(modules) == []
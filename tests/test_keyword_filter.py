@@ -0,0 +1,73 @@
+# GID Seminars - Keyword Filter Tests
+"""Tests for keyword matching, stems, exclusions and verdict caching."""
+
+import pytest
+
+from src.core.keyword_filter import KeywordFilter
+
+from .conftest import make_seminar
+
+CONFIG = {
+    "keywords": ["malaria", "vaccin*", "E. coli", "HIV"],
+    "exclude_keywords": ["veterinary", "retracted*"],
+    "exclude_categories": ["Social"],
+}
+
+
+@pytest.fixture
+def keyword_filter():
+    return KeywordFilter(CONFIG)
+
+
+def test_stem_matches_longer_words(keyword_filter):
+    assert keyword_filter.find_keywords("Vaccination campaigns in 2026") == (["vaccin*"], [])
+    assert keyword_filter.matches_text("New vaccines", None)
+
+
+def test_whole_word_keyword_does_not_match_inside_words(keyword_filter):
+    assert keyword_filter.find_keywords("Malarial fevers and the HIVE mind") == ([], [])
+    assert keyword_filter.find_keywords("Malaria, HIV.") == (["malaria", "HIV"], [])
+
+
+def test_punctuated_keyword(keyword_filter):
+    assert keyword_filter.find_keywords("Tracking E. coli outbreaks") == (["E. coli"], [])
+    assert keyword_filter.find_keywords("The E.coli strain") == ([], [])
+
+
+def test_exclude_keyword_beats_include(keyword_filter):
+    text = "Veterinary malaria vaccines"
+    assert keyword_filter.find_keywords(text) == (["malaria", "vaccin*"], ["veterinary"])
+    assert not keyword_filter.matches_text(text, None)
+
+    seminar = make_seminar(1, title="Malaria update", description="Retracted: see the erratum")
+    verdict = keyword_filter.evaluate(seminar)
+    assert not verdict.matched
+    assert verdict.keywords == ["malaria"]
+
+
+def test_evaluate_and_matches_text_agree(keyword_filter):
+    title, description = "  Malaria   research  seminar ", "Field work"
+    seminar = make_seminar(1, title=title, description=description)
+    assert keyword_filter.evaluate(seminar).matched == keyword_filter.matches_text(title, description)
+    assert keyword_filter.matches(seminar)
+    assert not keyword_filter.matches(make_seminar(2, title="Malaria mixer", category="social"))
+
+
+def test_config_hash_tracks_keyword_lists(keyword_filter):
+    assert KeywordFilter(dict(CONFIG)).config_hash == keyword_filter.config_hash
+    assert KeywordFilter({**CONFIG, "keywords": ["malaria"]}).config_hash != keyword_filter.config_hash
+    assert (
+        KeywordFilter({**CONFIG, "exclude_keywords": []}).config_hash
+        != keyword_filter.config_hash
+    )
+
+
+def test_stored_verdicts_are_reused_until_the_config_changes(keyword_filter):
+    seminar = make_seminar(1, title="Malaria seminar")
+    verdicts = {}
+    assert keyword_filter.filter_seminars([seminar], verdicts=verdicts) == ([seminar], 0)
+    assert verdicts[seminar.id].config_hash == keyword_filter.config_hash
+
+    narrower = KeywordFilter({**CONFIG, "keywords": ["HIV"]})
+    assert narrower.filter_seminars([seminar], verdicts=verdicts) == ([], 1)
+    assert verdicts[seminar.id].config_hash == narrower.config_hash
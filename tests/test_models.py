@@ -0,0 +1,31 @@
+# GID Seminars - Model Tests
+"""Tests for Seminar datetime localization and id/checksum hashing."""
+
+from datetime import datetime, timezone
+
+from src.core.models import Seminar
+
+
+def make(start: datetime, end: datetime | None = None) -> Seminar:
+    return Seminar(
+        source_id="who",
+        title="Outbreak briefing",
+        url="https://example.org/briefing",
+        start_datetime=start,
+        end_datetime=end,
+        timezone="America/New_York",
+    )
+
+
+def test_aware_and_naive_local_times_hash_the_same():
+    aware = make(
+        datetime(2026, 3, 3, 17, 0, tzinfo=timezone.utc),
+        datetime(2026, 3, 3, 18, 0, tzinfo=timezone.utc),
+    )
+    naive = make(datetime(2026, 3, 3, 12, 0), datetime(2026, 3, 3, 13, 0))
+
+    assert aware.start_datetime == naive.start_datetime == datetime(2026, 3, 3, 12, 0)
+    assert aware.end_datetime == datetime(2026, 3, 3, 13, 0)
+    assert aware.id == naive.id
+    assert aware.checksum == naive.checksum
+    assert aware.start_epoch == naive.start_epoch
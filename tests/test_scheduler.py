@@ -0,0 +1,181 @@
+# GID Seminars - Scheduler Tests
+"""Tests for source dispatch order, host limits and run time prediction."""
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.models import SourceRunStatus
+from src.sources.base import BaseSource
+from src.sources.collector import SourceCollector
+from src.sources.scheduler import (
+    RefreshScheduler,
+    expected_durations,
+    order_longest_first,
+    predict_total_time,
+    take_dispatchable,
+)
+
+from .conftest import record_run
+
+NOW = datetime(2026, 3, 1, 12, 0)
+COLLECTION = {"min_refresh_interval": 1, "adaptive_refresh": True, "max_refresh_interval": 72}
+
+
+class StubSource(BaseSource):
+    """Source whose run() calls a hook instead of fetching anything."""
+
+    def __init__(self, source_id, database, host=None, on_run=None, **config):
+        url = f"https://{host}/feed" if host else None
+        super().__init__(source_id, {"url": url, **config}, database)
+        self.on_run = on_run
+
+    def fetch_seminars(self):
+        return []
+
+    def run(self, max_attempts=None):
+        if self.on_run:
+            self.on_run(self)
+        return {"found": 0}
+
+
+def record_refreshes(database, source_id: str, every_hours: int, changed: list[bool]) -> None:
+    """Record successful runs every_hours apart, oldest first, the last at NOW."""
+    for runs_ago, has_changes in zip(range(len(changed) - 1, -1, -1), changed):
+        record_run(
+            database,
+            source_id,
+            SourceRunStatus.SUCCESS,
+            NOW - timedelta(hours=every_hours * runs_ago),
+            events_added=int(has_changes),
+        )
+
+
+@pytest.mark.parametrize(
+    "every_hours, changed, expected_hours",
+    [
+        (2, [False] * 10, 9),  # 18h without changes: half of 18h / 1
+        (2, [True] * 3 + [False] * 7, 3),  # 18h, 2 changes: the oldest run's is not counted
+        (24, [False] * 10, 72),  # Capped at max_refresh_interval
+        (1, [True] * 10, 1),  # Changes every run: min_refresh_interval
+        (2, [True], 1),  # Too little history to estimate
+    ],
+)
+def test_adaptive_refresh_interval(database, every_hours, changed, expected_hours):
+    record_refreshes(database, "feed", every_hours, changed)
+    scheduler = RefreshScheduler(database, COLLECTION)
+    interval = scheduler.refresh_interval(StubSource("feed", database))
+    assert interval == timedelta(hours=expected_hours)
+
+
+def test_refresh_settings_per_source(database):
+    record_refreshes(database, "manual", 2, [False] * 10)
+    scheduler = RefreshScheduler(database, COLLECTION)
+    fixed = StubSource("manual", database, min_refresh_interval=0, adaptive_refresh=False)
+    assert scheduler.refresh_interval(fixed) == timedelta(0)
+    assert scheduler.decide(fixed, NOW).due
+
+
+def test_decide(database):
+    record_refreshes(database, "feed", 2, [False] * 10)
+    scheduler = RefreshScheduler(database, COLLECTION)
+    source = StubSource("feed", database)
+
+    decision = scheduler.decide(source, NOW + timedelta(hours=8))
+    assert not decision.due
+    assert decision.next_refresh_at == NOW + timedelta(hours=9)
+    assert scheduler.decide(source, NOW + timedelta(hours=9)).due
+
+    # Never refreshed: due straight away
+    assert scheduler.decide(StubSource("new", database), NOW).due
+
+
+def test_take_dispatchable_skips_busy_hosts(database):
+    a1, a2, b1, c1 = (
+        StubSource(source_id, database, host)
+        for source_id, host in [("a1", "a.org"), ("a2", "a.org"), ("b1", "b.org"), ("c1", "c.org")]
+    )
+    pending = [a1, a2, b1, c1]
+    active: Counter[str] = Counter()
+
+    assert take_dispatchable(pending, active, 2, max_per_host=1) == [a1, b1]
+    assert pending == [a2, c1]
+    assert active == {"a.org": 1, "b.org": 1}
+
+    assert take_dispatchable(pending, active, 1, max_per_host=1) == [c1]
+    assert take_dispatchable(pending, active, 1, max_per_host=1) == []
+
+
+def test_run_durations_are_medians_of_recent_successes(database):
+    for runs_ago, duration in enumerate([2.0, 3.0, 4.0, 5.0, 6.0, 100.0]):
+        record_run(
+            database, "feed", SourceRunStatus.SUCCESS, NOW - timedelta(hours=runs_ago), duration
+        )
+    record_run(database, "feed", SourceRunStatus.ERROR, NOW, 500.0)
+
+    # The outlier is the sixth most recent success, and the error is ignored
+    assert database.get_run_durations(limit=5) == {"feed": 4.0}
+    assert database.get_run_durations(limit=6) == {"feed": 4.5}
+
+
+def test_expected_durations_default_to_the_mean(database):
+    sources = [StubSource(source_id, database) for source_id in ("a", "b", "new")]
+    assert expected_durations(sources, {"a": 2.0, "b": 4.0, "gone": 60.0}) == {
+        "a": 2.0, "b": 4.0, "new": 3.0,
+    }
+    assert expected_durations(sources[2:], {}) == {"new": 0.0}
+
+
+def test_order_longest_first(database):
+    sources = [StubSource(source_id, database) for source_id in ("short", "new", "long")]
+    ordered = order_longest_first(sources, {"short": 1.0, "long": 9.0})
+    # Sources without history are assumed to take the mean
+    assert [source.source_id for source in ordered] == ["long", "new", "short"]
+
+
+@pytest.mark.parametrize(
+    "max_workers, max_per_host, expected",
+    [
+        (1, 2, 10.0),  # Sequential: the sum
+        (3, 3, 4.0),  # One worker each: the longest
+        (3, 1, 7.0),  # a1 then a2 on a.org, b1 alongside
+        (2, 1, 7.0),  # b1 takes the worker a2 cannot use yet
+    ],
+)
+def test_predict_total_time(database, max_workers, max_per_host, expected):
+    sources = [
+        StubSource("a1", database, "a.org"),
+        StubSource("a2", database, "a.org"),
+        StubSource("b1", database, "b.org"),
+    ]
+    durations = {"a1": 4.0, "a2": 3.0, "b1": 3.0}
+    assert predict_total_time(sources, durations, max_workers, max_per_host) == expected
+
+
+def test_busy_host_does_not_hold_a_worker(database):
+    # a1 only finishes once b1 has started; if a2 sat on the second worker
+    # waiting for a.org, b1 could not start and a1 would time out
+    b1_started = threading.Event()
+    waited: dict[str, bool] = {}
+
+    def on_run(source):
+        if source.source_id == "a1":
+            waited["a1"] = b1_started.wait(timeout=5)
+        elif source.source_id == "b1":
+            b1_started.set()
+
+    collector = SourceCollector(
+        {}, {"collection": {"max_workers": 2, "max_per_host": 1}}, database
+    )
+    sources = [
+        StubSource("a1", database, "a.org", on_run),
+        StubSource("a2", database, "a.org", on_run),
+        StubSource("b1", database, "b.org", on_run),
+    ]
+    results = collector._collect_concurrently(sources)
+
+    assert waited == {"a1": True}
+    assert list(results) == ["a1", "a2", "b1"]
+    assert all(result["status"] == "success" for result in results.values())
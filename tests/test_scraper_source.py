@@ -0,0 +1,45 @@
+# GID Seminars - Scraper Source Tests
+"""Scrapers that follow detail pages must not skip unchanged listings."""
+
+from types import SimpleNamespace
+
+from src.sources.scraper_source import ScraperSource
+
+LISTING_URL = "https://www.isrv.global/events-calendar/"
+DETAIL_URL = "https://www.isrv.global/events-calendar/flu-talk/"
+LISTING = b'<html><body><a href="/events-calendar/flu-talk/">Flu talk</a></body></html>'
+
+
+class PageSession:
+    """Serves fixed pages with an ETag, answering 304 to a matching If-None-Match."""
+
+    def __init__(self):
+        self.requested: list[tuple[str, dict]] = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requested.append((url, headers))
+        not_modified = headers.get("If-None-Match") == '"listing"'
+        return SimpleNamespace(
+            status_code=304 if not_modified else 200,
+            content=LISTING if url == LISTING_URL else b"<html><main></main></html>",
+            headers={"ETag": '"listing"'},
+            raise_for_status=lambda: None,
+        )
+
+
+def test_detail_page_scraper_is_always_parsed(database):
+    session = PageSession()
+    for _ in range(2):
+        source = ScraperSource(
+            "isrv",
+            {"url": LISTING_URL, "scraper_type": "isrv", "rate_limit": 0},
+            database,
+        )
+        source.session = session
+        stats = source.run()
+        assert "cache_status" not in stats
+
+    assert [url for url, _ in session.requested] == [LISTING_URL, DETAIL_URL] * 2
+    assert all("If-None-Match" not in headers for _, headers in session.requested)
+    assert database.get_last_successful_run("isrv").content_hash is None
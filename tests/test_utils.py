@@ -0,0 +1,149 @@
+# GID Seminars - Utility Tests
+"""Tests for free-text date/time extraction, datetime parsing and URL keys."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.utils import (
+    DateTimeParser,
+    extract_datetime_mentions,
+    mention_to_datetime,
+    nearest_mention,
+    normalize_url,
+)
+
+
+def summarize(text: str) -> list[tuple]:
+    return [
+        (m.kind, m.text, m.year, m.month, m.day, m.hour, m.minute)
+        for m in extract_datetime_mentions(text)
+    ]
+
+
+def test_extracts_date_time_range_and_zone():
+    assert summarize("Seminar 28 January 2026, 2:00 PM - 3:30 PM EST") == [
+        ("date", "28 January 2026", 2026, 1, 28, None, None),
+        ("time_range", "2:00 PM - 3:30 PM", None, None, None, 14, 0),
+        ("timezone", "EST", None, None, None, None, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Tuesday, January 20, 2026", (2026, 1, 20)),
+        ("Jan 15th", (None, 1, 15)),
+        ("1/14/2025", (2025, 1, 14)),
+        ("2025-01-14", (2025, 1, 14)),
+    ],
+)
+def test_extracts_date_formats(text, expected):
+    [mention] = extract_datetime_mentions(text)
+    assert mention.kind == "date"
+    assert (mention.year, mention.month, mention.day) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("at 9am", (9, 0)), ("at 14:00", (14, 0)), ("12:30 p.m.", (12, 30)), ("noon", (12, 0))],
+)
+def test_extracts_times(text, expected):
+    [mention] = extract_datetime_mentions(text)
+    assert (mention.hour, mention.minute) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("H5N1 may spread", []),
+        ("COVID19 Jan 2 update", [("date", "Jan 2", None, 1, 2, None, None)]),
+        ("H1N1 at 3pm", [("time", "3pm", None, None, None, 15, 0)]),
+        ("PM2.5 exposure", []),
+    ],
+)
+def test_numbers_inside_words_are_not_dates(text, expected):
+    assert summarize(text) == expected
+
+
+def test_nearest_mention():
+    text = "Talk at 10am. Seminar on 3 March 2026 at 2pm, reception at 5pm"
+    mentions = extract_datetime_mentions(text)
+    date = next(m for m in mentions if m.kind == "date")
+
+    assert nearest_mention(mentions, date.end).text == "2pm"
+    assert nearest_mention(mentions, date.start, forward_only=True).text == "2pm"
+    assert nearest_mention(mentions, date.end, max_distance=2) is None
+    assert nearest_mention(mentions, 0, kinds=("date",)) is date
+
+
+def test_mention_to_datetime():
+    [date, time] = extract_datetime_mentions("3 March 2026 at 2:15 pm")
+    assert mention_to_datetime(date, time) == datetime(2026, 3, 3, 14, 15)
+    assert mention_to_datetime(date, default_hour=12) == datetime(2026, 3, 3, 12, 0)
+
+    [invalid] = extract_datetime_mentions("30 February 2026")
+    assert mention_to_datetime(invalid) is None
+
+
+def test_mention_to_datetime_rolls_yearless_dates_forward():
+    now = datetime.utcnow()
+    recent = now - timedelta(days=10)
+    old = now - timedelta(days=60)
+
+    [date] = extract_datetime_mentions(recent.strftime("%d %B"))
+    assert mention_to_datetime(date, past_days=30).year == now.year
+
+    # Unless it wrapped into last year, 60 days ago is too far back for this year
+    [date] = extract_datetime_mentions(old.strftime("%d %B"))
+    assert mention_to_datetime(date, past_days=30).year == now.year + (old.year == now.year)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2025-01-14T14:00:00", datetime(2025, 1, 14, 14, 0)),
+        ("January 14, 2025 2:00 PM", datetime(2025, 1, 14, 14, 0)),
+        ("not a date", None),
+        ("", None),
+    ],
+)
+def test_datetime_parser(value, expected):
+    assert DateTimeParser().parse(value) == expected
+
+
+def test_datetime_parser_reuses_learned_format():
+    parser = DateTimeParser()
+    assert parser.parse("2025-01-14T14:00:00") == datetime(2025, 1, 14, 14, 0)
+    assert parser.parse("2025-02-01T09:30:00") == datetime(2025, 2, 1, 9, 30)
+
+
+def test_datetime_parser_parts():
+    parser = DateTimeParser()
+    assert parser.parse_parts("1/15/2025", "2:00 PM") == datetime(2025, 1, 15, 14, 0)
+    assert parser.parse_parts("January 15, 2025", "TBA") == datetime(2025, 1, 15, 12, 0)
+    assert parser.parse_parts("soon", "2:00 PM") is None
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.example.org/events/talk/",
+        "http://EXAMPLE.org:80/events/talk?utm_source=feed#details",
+        " https://example.org:443/events/talk ",
+    ],
+)
+def test_normalize_url(url):
+    assert normalize_url(url) == "example.org/events/talk"
+
+
+def test_normalize_url_keeps_identifying_query_parameters():
+    first = normalize_url("https://example.org/events?id=123&view=full")
+    second = normalize_url("https://example.org/events/?view=full&id=456")
+    assert first == "example.org/events?id=123&view=full"
+    assert second == "example.org/events?id=456&view=full"
+    assert normalize_url("https://example.org/events?view=full&fbclid=x&id=123#top") == first
+
+
+def test_normalize_url_keeps_other_ports():
+    assert normalize_url("http://example.org:8080/a/") == "example.org:8080/a"